@@ -0,0 +1,50 @@
+"""
+Microbenchmark of the quiz rendering throughput with the plugin `logging` option on and off.
+
+With logging off, diagnostics are DEBUG messages that are neither formatted nor emitted in a default build.
+With logging on, they are INFO messages, formatted and written to a handler discarding the output.
+
+Usage:
+    python benchmarks/bench_logging.py [--questions 50] [--duration 2]
+"""
+import argparse
+import logging
+import os
+import time
+
+from synthetic import build_quiz, make_plugin
+
+
+def throughput(plugin, quiz, duration):
+    """
+    Returns the number of quizzes rendered per second.
+    """
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < duration:
+        plugin.generate_quiz_html(quiz, 'bench')
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--questions', type=int, default=50, help='number of questions of the rendered quiz')
+    parser.add_argument('--duration', type=float, default=2.0, help='duration of each measurement, in seconds')
+    args = parser.parse_args()
+
+    # Same setup as `mkdocs build`: INFO messages are emitted, DEBUG ones are not
+    logger = logging.getLogger('mkdocs.plugins.mkdocs_quiz')
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.addHandler(logging.StreamHandler(open(os.devnull, 'w')))
+
+    quiz = build_quiz(args.questions)
+    for enabled in (False, True):
+        plugin = make_plugin(logging=enabled)
+        rate = throughput(plugin, quiz, args.duration)
+        print(f"logging {'on ' if enabled else 'off'}: {rate:10.1f} quizzes/s ({args.questions} questions each)")
+
+
+if __name__ == '__main__':
+    main()
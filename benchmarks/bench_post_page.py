@@ -0,0 +1,79 @@
+"""
+Benchmark of the quiz injection done in `on_post_page`.
+
+Compares the previous implementation, one `str.replace` per placeholder plus one for each of `</head>` and
+`</body>`, with the single scan of `mkdocs_quiz.injection.inject_html`, for several page sizes and quiz counts.
+
+Usage:
+    python benchmarks/bench_post_page.py [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mkdocs_quiz.injection import inject_html  # noqa: E402
+
+PAGE_SIZES = (10 * 1024, 100 * 1024, 1024 * 1024, 5 * 1024 * 1024)
+QUIZ_COUNTS = (1, 10, 30, 100)
+QUIZ_HTML = "<div class='quiz'>" + "<div class='question'><p>Question?</p><ul><li>Answer</li></ul></div>" * 10 + "</div>"
+HEAD_HTML = '<link rel="stylesheet" href="static/quiz.css">'
+BODY_HTML = '<script src="static/quiz.js"></script>'
+
+
+def legacy_inject_html(content, placeholders, head_html, body_html):
+    for placeholder, quiz_html in placeholders.items():
+        content = content.replace(placeholder, quiz_html)
+    content = content.replace('</body>', f'{body_html}</body>')
+    content = content.replace('</head>', f'{head_html}</head>')
+    return content
+
+
+def make_page(page_size, quiz_count):
+    placeholders = {f"<!-- QUIZ_PLACEHOLDER_quiz{i}_0123abcd -->": QUIZ_HTML for i in range(quiz_count)}
+    paragraph = "<p>" + "Lorem ipsum dolor sit amet. " * 10 + "</p>\n"
+    chunk_count = max(quiz_count, page_size // len(paragraph))
+    chunks = [paragraph] * chunk_count
+    step = chunk_count // quiz_count
+    for i, placeholder in enumerate(placeholders):
+        chunks[i * step] += placeholder
+    content = "<html><head><title>Benchmark</title></head><body>" + "".join(chunks) + "</body></html>"
+    return content, placeholders
+
+
+def measure(func, content, placeholders, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(content, placeholders, HEAD_HTML, BODY_HTML)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    func(content, placeholders, HEAD_HTML, BODY_HTML)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(timings), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5, help='number of timed runs, the fastest one is kept')
+    args = parser.parse_args()
+
+    print(f"{'page size':>10} {'quizzes':>8} {'legacy ms':>10} {'single ms':>10} {'legacy peak':>12} {'single peak':>12}")
+    for page_size in PAGE_SIZES:
+        for quiz_count in QUIZ_COUNTS:
+            content, placeholders = make_page(page_size, quiz_count)
+            assert legacy_inject_html(content, placeholders, HEAD_HTML, BODY_HTML) == \
+                inject_html(content, placeholders, HEAD_HTML, BODY_HTML)
+            legacy_time, legacy_peak = measure(legacy_inject_html, content, placeholders, args.repeat)
+            single_time, single_peak = measure(inject_html, content, placeholders, args.repeat)
+            print(f"{page_size // 1024:>8}KB {quiz_count:>8} {legacy_time * 1000:>10.2f} {single_time * 1000:>10.2f} "
+                  f"{legacy_peak // 1024:>10}KB {single_peak // 1024:>10}KB")
+
+
+if __name__ == '__main__':
+    main()
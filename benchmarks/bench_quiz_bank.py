@@ -0,0 +1,115 @@
+"""
+Compares loading a quiz file with `json.load` and loading its compiled quiz bank, see the `compile_quiz_file`
+option. The compiled bank is measured both when the quiz file is unchanged and after the quiz file was touched,
+when its hash has to be checked. The plugin loads are timed through `QuizFile.load`, as on the first build of
+`mkdocs build` or `mkdocs serve`, including the hash of the quiz file kept to detect changes. "plugin JSON" is
+the plugin loading the quiz file without the compiled bank, with the garbage collector paused.
+
+The lazy loader of the `lazy_loading` option is measured too: time to index the quiz file, then peak and
+retained memory when a share of the quizzes is used, compared with loading the whole file.
+
+Usage:
+    python benchmarks/bench_quiz_bank.py [--quizzes 20000] [--languages en,fr,de] [--repeat 5]
+    python benchmarks/bench_quiz_bank.py --quiz-file quizzes.json
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from synthetic import ROOT_DIR  # noqa: F401, puts the repository on the import path
+from site_generator import generate_quiz_bank
+from mkdocs_quiz.bank import QuizFile, compile_quiz_file, compiled_path, load_compiled, load_quiz_index
+
+
+def best_time(function, repeat, before=None):
+    """
+    Returns:
+        float: The best wall time of `function` over `repeat` calls, `before` is called before each one.
+    """
+    best = None
+    for _ in range(repeat):
+        if before is not None:
+            before()
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def memory(function):
+    """
+    Returns:
+        tuple: The tracemalloc peak while calling `function` and the memory still held by its result, in bytes.
+    """
+    tracemalloc.start()
+    try:
+        result = function()  # noqa: F841, kept alive to measure the retained memory
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak, retained
+
+
+def lazy_load(quiz_file, used):
+    """
+    Indexes the quiz file and decodes the given share of its quizzes, like a site using only some of them.
+    """
+    quizzes, _ = load_quiz_index(quiz_file)
+    step = max(1, round(1 / used)) if used else len(quizzes) + 1
+    for quiz_key in list(quizzes)[::step]:
+        quizzes[quiz_key]
+    return quizzes
+
+
+def json_load(quiz_file):
+    with open(quiz_file, 'r') as file:
+        return json.load(file)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--quiz-file', help='an existing quiz file, a synthetic one is generated by default')
+    parser.add_argument('--quizzes', type=int, default=20000, help='number of quizzes of the synthetic quiz file')
+    parser.add_argument('--questions', type=int, default=5, help='average number of questions per quiz')
+    parser.add_argument('--languages', default='en,fr,de', help='comma separated languages of the synthetic quiz file')
+    parser.add_argument('--repeat', type=int, default=5, help='number of timed loads')
+    parser.add_argument('--used', type=float, default=0.05, help='share of the quizzes used with lazy loading')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        quiz_file = args.quiz_file
+        if quiz_file is None:
+            quiz_file = os.path.join(tmp_dir, 'quizzes.json')
+            quiz_bank = generate_quiz_bank(random.Random(0), args.quizzes, args.questions,
+                                           tuple(args.languages.split(',')), 0.3, 20)
+            with open(quiz_file, 'w', encoding='utf-8') as file:
+                json.dump(quiz_bank, file, ensure_ascii=False)
+
+        compile_time = best_time(lambda: compile_quiz_file(quiz_file), 1)
+        assert load_compiled(quiz_file) == json_load(quiz_file)
+        print(f"Quiz file:      {os.path.getsize(quiz_file) / 1024 / 1024:8.1f} MB")
+        print(f"Compiled bank:  {os.path.getsize(compiled_path(quiz_file)) / 1024 / 1024:8.1f} MB, "
+              f"compiled in {compile_time * 1000:.1f} ms")
+        print(f"json.load:      {best_time(lambda: json_load(quiz_file), args.repeat) * 1000:8.1f} ms")
+        print(f"plugin JSON:    {best_time(lambda: QuizFile(quiz_file).load(), args.repeat) * 1000:8.1f} ms")
+        compiled_time = best_time(lambda: QuizFile(quiz_file, compiled=True).load(), args.repeat)
+        print(f"compiled:       {compiled_time * 1000:8.1f} ms")
+        touched_time = best_time(lambda: QuizFile(quiz_file, compiled=True).load(), args.repeat,
+                                 lambda: os.utime(quiz_file))
+        print(f"compiled, hash: {touched_time * 1000:8.1f} ms")
+        print(f"lazy index:     {best_time(lambda: QuizFile(quiz_file, lazy=True).load(), args.repeat) * 1000:8.1f} ms")
+        for name, function in (('json.load', lambda: json_load(quiz_file)),
+                               (f"lazy, {args.used:.0%} used", lambda: lazy_load(quiz_file, args.used))):
+            peak, retained = memory(function)
+            print(f"{name + ':':<16}{peak / 1024 / 1024:8.1f} MB peak, {retained / 1024 / 1024:.1f} MB retained")
+        if args.quiz_file is not None:
+            os.remove(compiled_path(quiz_file))
+
+
+if __name__ == '__main__':
+    main()
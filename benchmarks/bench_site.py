@@ -0,0 +1,143 @@
+"""
+End-to-end benchmark running real `mkdocs build` commands on a synthetic site, see `site_generator.py`.
+
+Each build runs in its own process and reports:
+    - the total wall time of the build,
+    - the plugin time, the difference with the build of the same site without the quiz plugin,
+    - the peak resident memory of the build process,
+    - the size of the generated site.
+
+Usage:
+    python benchmarks/bench_site.py [--pages 5000] [--quizzes 20000] [--languages en,fr,de] [--builds 3]
+    python benchmarks/bench_site.py --project /tmp/synthetic_site --option cache=true --option render_mode=payload
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from site_generator import generate_site
+
+# ru_maxrss is in kilobytes on Linux and in bytes on macOS
+RSS_UNIT = 1 if sys.platform == 'darwin' else 1024
+
+
+def run_build(config_path, site_dir):
+    """
+    Runs `mkdocs build` in a new process.
+
+    Args:
+        config_path (str): The path of the `mkdocs.yml` file.
+        site_dir (str): The output directory of the build.
+
+    Returns:
+        tuple: The wall time of the build in seconds and the peak resident memory of the process in bytes, None when
+            the platform does not report it.
+    """
+    start = time.perf_counter()
+    # The quiz file is resolved from the working directory, as when running `mkdocs build` in the project
+    process = subprocess.Popen([sys.executable, '-m', 'mkdocs', 'build', '-q', '-f', config_path, '-d', site_dir],
+                               cwd=os.path.dirname(config_path))
+    if hasattr(os, 'wait4'):
+        # os.wait4 returns the resource usage of this child only, unlike resource.getrusage(RUSAGE_CHILDREN)
+        _, status, usage = os.wait4(process.pid, 0)
+        elapsed = time.perf_counter() - start
+        process.returncode = -os.WTERMSIG(status) if os.WIFSIGNALED(status) else os.WEXITSTATUS(status)
+        peak_rss = usage.ru_maxrss * RSS_UNIT
+    else:
+        process.wait()
+        elapsed = time.perf_counter() - start
+        # The highest peak of all the builds run so far, the benchmarked builds run before the baseline ones
+        peak_rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * RSS_UNIT if resource else None
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, process.args)
+    return elapsed, peak_rss
+
+
+def directory_size(path):
+    """
+    Returns:
+        int: The total size of the files under `path`, in bytes.
+    """
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names)
+
+
+def without_plugin(config_path):
+    """
+    Writes a copy of `mkdocs.yml` without any plugin, next to it.
+
+    Returns:
+        str: The path of the copy.
+    """
+    path = os.path.join(os.path.dirname(config_path), 'mkdocs_without_plugin.yml')
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write("site_name: Synthetic site\nplugins: []\n")
+    return path
+
+
+def parse_option(option):
+    name, _, value = option.partition('=')
+    try:
+        return name, json.loads(value)
+    except ValueError:
+        return name, value
+
+
+def best_build(config_path, site_dir, builds):
+    """
+    Returns:
+        tuple: The best wall time and the highest peak resident memory of `builds` builds, see `run_build`.
+    """
+    results = [run_build(config_path, site_dir) for _ in range(builds)]
+    peak_rss = [rss for _, rss in results if rss is not None]
+    return min(elapsed for elapsed, _ in results), max(peak_rss) if peak_rss else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--project', help='directory of the generated project, a temporary one by default')
+    parser.add_argument('--pages', type=int, default=500, help='number of pages')
+    parser.add_argument('--quizzes', type=int, default=2000, help='number of quizzes')
+    parser.add_argument('--questions', type=int, default=5, help='average number of questions per quiz')
+    parser.add_argument('--languages', default='en,fr,de', help='comma separated languages of the quiz bank')
+    parser.add_argument('--media-ratio', type=float, default=0.3, help='share of questions with media')
+    parser.add_argument('--option', action='append', default=[], metavar='NAME=VALUE',
+                        help='plugin option of the benchmarked builds, can be repeated')
+    parser.add_argument('--builds', type=int, default=3, help='number of builds, the fastest one is reported')
+    parser.add_argument('--no-baseline', action='store_true',
+                        help='skip the builds without the plugin, the plugin time is then not reported')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        project = os.path.abspath(args.project or os.path.join(tmp_dir, 'project'))
+        start = time.perf_counter()
+        config_path = generate_site(project, pages=args.pages, quizzes=args.quizzes, questions=args.questions,
+                                    languages=tuple(args.languages.split(',')), media_ratio=args.media_ratio,
+                                    plugin_options=dict(parse_option(option) for option in args.option))
+        print(f"Generated {args.pages} pages and {args.quizzes} quizzes "
+              f"({os.path.getsize(os.path.join(project, 'quizzes.json')) / 1024 / 1024:.1f} MB quiz file) "
+              f"in {time.perf_counter() - start:.1f} s")
+
+        site_dir = os.path.join(tmp_dir, 'site')
+        total_time, peak_rss = best_build(config_path, site_dir, args.builds)
+        print(f"Total time:  {total_time:8.2f} s")
+        if not args.no_baseline:
+            baseline_time, _ = best_build(without_plugin(config_path), os.path.join(tmp_dir, 'baseline'),
+                                          args.builds)
+            print(f"Plugin time: {total_time - baseline_time:8.2f} s (build without the plugin: "
+                  f"{baseline_time:.2f} s)")
+        if peak_rss is not None:
+            print(f"Peak RSS:    {peak_rss / 1024 / 1024:8.1f} MB")
+        print(f"Output size: {directory_size(site_dir) / 1024 / 1024:8.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
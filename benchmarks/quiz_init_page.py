@@ -0,0 +1,78 @@
+"""
+Generates a synthetic page with a 1,000 question quiz to measure the client-side initialization of quiz.js.
+
+The script is inlined in the page between two DOMContentLoaded listeners, the time between them is the time
+spent by quiz.js on DOMContentLoaded. The time until the first quiz is hydrated is also reported, both are
+printed in the page and in the browser console. Open the generated page in a browser to run it.
+
+To compare with a previous version of the script:
+    git show <revision>:mkdocs_quiz/static/quiz.js > /tmp/quiz_before.js
+    python benchmarks/quiz_init_page.py --script /tmp/quiz_before.js --output quiz_init_before.html
+    python benchmarks/quiz_init_page.py --output quiz_init_after.html
+"""
+import argparse
+import os
+
+from synthetic import ROOT_DIR, build_quiz, make_plugin
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>quiz.js initialization benchmark</title>
+<style>{css}</style>
+<script>
+window.benchmarkStart = 0;
+document.addEventListener("DOMContentLoaded", function () {{ window.benchmarkStart = performance.now(); }});
+</script>
+</head>
+<body>
+<pre id="benchmark-result">Running...</pre>
+{quizzes}
+<script>{script}</script>
+<script>
+document.addEventListener("DOMContentLoaded", function () {{
+    var init = performance.now() - window.benchmarkStart;
+    requestAnimationFrame(function () {{
+        setTimeout(function () {{
+            var hydrated = document.querySelectorAll(".quiz[data-hydrated]").length;
+            var result = "DOMContentLoaded handlers: " + init.toFixed(2) + " ms\\n" +
+                "Until first frame: " + (performance.now() - window.benchmarkStart).toFixed(2) + " ms\\n" +
+                "Questions: {question_count}, quizzes: {quiz_count}, hydrated quizzes: " + hydrated;
+            document.getElementById("benchmark-result").textContent = result;
+            console.log(result);
+        }}, 0);
+    }});
+}});
+</script>
+</body>
+</html>
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--questions', type=int, default=1000, help='total number of questions on the page')
+    parser.add_argument('--quizzes', type=int, default=10, help='number of quizzes the questions are split into')
+    parser.add_argument('--script', default=os.path.join(ROOT_DIR, 'mkdocs_quiz', 'static', 'quiz.js'),
+                        help='the quiz.js file to benchmark')
+    parser.add_argument('--output', default='quiz_init_benchmark.html', help='the generated HTML page')
+    args = parser.parse_args()
+
+    plugin = make_plugin()
+    per_quiz = max(1, args.questions // args.quizzes)
+    quizzes = [plugin.generate_quiz_html(build_quiz(per_quiz), f"quiz{i}") for i in range(args.quizzes)]
+
+    with open(args.script, 'r', encoding='utf-8') as file:
+        script = file.read()
+    with open(os.path.join(ROOT_DIR, 'mkdocs_quiz', 'static', 'quiz.css'), 'r', encoding='utf-8') as file:
+        css = file.read()
+
+    with open(args.output, 'w', encoding='utf-8') as file:
+        file.write(PAGE_TEMPLATE.format(css=css, quizzes='\n'.join(quizzes), script=script,
+                                        question_count=per_quiz * args.quizzes, quiz_count=args.quizzes))
+    print(f"Wrote {args.output} with {per_quiz * args.quizzes} questions in {args.quizzes} quizzes")
+
+
+if __name__ == '__main__':
+    main()
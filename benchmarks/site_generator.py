@@ -0,0 +1,168 @@
+"""
+Generates a synthetic MkDocs project using the quiz plugin: a docs tree of Markdown pages embedding quizzes,
+the matching quiz bank in several languages and the media files the questions reference.
+
+The generated project is deterministic for a given seed and builds offline.
+
+Usage:
+    python benchmarks/site_generator.py OUTPUT_DIR [--pages 5000] [--quizzes 20000] [--languages en,fr,de]
+"""
+import argparse
+import base64
+import json
+import os
+import random
+
+# 1x1 transparent PNG
+PNG = base64.b64decode('iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII=')
+MEDIA_FILES = {
+    'image': ('static/images/image{}.png', PNG),
+    'video': ('static/videos/video{}.mp4', b'\0' * 64),
+    'audio': ('static/audios/audio{}.mp3', b'\0' * 64),
+}
+WORDS = ("quiz", "answer", "question", "planet", "capital", "river", "number", "color", "element", "language",
+         "history", "ocean", "mountain", "theorem", "function", "library", "network", "protocol", "python", "docs")
+QUESTION_TYPES = ('multiple-choice', 'true-false', 'fill-in-the-blank')
+PAGES_PER_SECTION = 100
+
+
+def sentence(rng, word_count):
+    return ' '.join(rng.choice(WORDS) for _ in range(word_count)).capitalize()
+
+
+def translations(rng, languages, word_count):
+    """
+    Returns a text in every language, the words are tagged by language so each translation differs.
+    """
+    text = sentence(rng, word_count)
+    return {language: f"[{language}] {text}" for language in languages}
+
+
+def generate_question(rng, languages, media_ratio, media_count):
+    """
+    Generates one question of a random type, in the format of the quiz file.
+    """
+    question_type = rng.choice(QUESTION_TYPES)
+    question = {'type': question_type, 'question': translations(rng, languages, rng.randint(6, 14))}
+    if rng.random() < media_ratio:
+        media_type = rng.choice(tuple(MEDIA_FILES))
+        question['media'] = {
+            'type': media_type,
+            'src': './' + MEDIA_FILES[media_type][0].format(rng.randrange(media_count)),
+            'alt': translations(rng, languages, 2),
+        }
+    if question_type == 'fill-in-the-blank':
+        question['answer'] = translations(rng, languages, 1)
+        question['indice'] = translations(rng, languages, 6)
+        return question
+    option_count = 2 if question_type == 'true-false' else rng.randint(3, 5)
+    correct = rng.randrange(option_count)
+    question['options'] = [
+        {
+            'text': translations(rng, languages, rng.randint(1, 4)),
+            'correct': index == correct,
+            'indice': translations(rng, languages, rng.randint(4, 10)),
+        }
+        for index in range(option_count)
+    ]
+    return question
+
+
+def generate_quiz_bank(rng, quizzes, questions, languages, media_ratio, media_count):
+    """
+    Generates the quiz bank, the content of the quiz file, with quizzes named `quiz0`, `quiz1`...
+    """
+    quiz_bank = {'quizzes': {}}
+    for index in range(quizzes):
+        question_count = max(1, rng.randint(questions // 2, questions + questions // 2))
+        quiz_bank['quizzes'][f"quiz{index}"] = {
+            'questions': [generate_question(rng, languages, media_ratio, media_count) for _ in range(question_count)]
+        }
+    return quiz_bank
+
+
+def generate_page(rng, title, quiz_keys, paragraphs):
+    """
+    Generates the Markdown of a page embedding the given quizzes between paragraphs of text.
+    """
+    lines = [f"# {title}", ""]
+    for index in range(max(paragraphs, len(quiz_keys))):
+        lines.extend([f"## {sentence(rng, 3)}", "", sentence(rng, 60) + ".", ""])
+        if index < len(quiz_keys):
+            lines.extend([f"<!-- QUIZ_ID: {quiz_keys[index]} -->", ""])
+    return '\n'.join(lines)
+
+
+def generate_site(output_dir, pages=100, quizzes=400, questions=5, languages=('en', 'fr'), media_ratio=0.3,
+                  media_count=20, paragraphs=5, seed=0, plugin_options=None):
+    """
+    Generates a synthetic MkDocs project.
+
+    Args:
+        output_dir (str): The directory of the project, created if needed.
+        pages (int): The number of Markdown pages, grouped in sections of 100 pages.
+        quizzes (int): The number of quizzes, spread evenly over the pages.
+        questions (int): The average number of questions per quiz.
+        languages (tuple): The languages of the quiz bank, the first one is configured for the build.
+        media_ratio (float): The share of questions with an image, a video or an audio file.
+        media_count (int): The number of distinct files of each media type.
+        paragraphs (int): The number of text paragraphs per page.
+        seed (int): The seed of the random generator.
+        plugin_options (dict, optional): Additional options of the quiz plugin in the generated `mkdocs.yml`.
+
+    Returns:
+        str: The path of the generated `mkdocs.yml`.
+    """
+    rng = random.Random(seed)
+    docs_dir = os.path.join(output_dir, 'docs')
+
+    for media_type, (path, content) in MEDIA_FILES.items():
+        for index in range(media_count):
+            media_path = os.path.join(docs_dir, path.format(index))
+            os.makedirs(os.path.dirname(media_path), exist_ok=True)
+            with open(media_path, 'wb') as file:
+                file.write(content)
+
+    quiz_bank = generate_quiz_bank(rng, quizzes, questions, languages, media_ratio, media_count)
+    with open(os.path.join(output_dir, 'quizzes.json'), 'w', encoding='utf-8') as file:
+        json.dump(quiz_bank, file, ensure_ascii=False)
+
+    quiz_keys = list(quiz_bank['quizzes'])
+    with open(os.path.join(docs_dir, 'index.md'), 'w', encoding='utf-8') as file:
+        file.write(f"# Synthetic site\n\n{pages} pages, {quizzes} quizzes.\n")
+    for index in range(pages):
+        page_keys = quiz_keys[index * quizzes // pages:(index + 1) * quizzes // pages]
+        page_path = os.path.join(docs_dir, f"section{index // PAGES_PER_SECTION}", f"page{index}.md")
+        os.makedirs(os.path.dirname(page_path), exist_ok=True)
+        with open(page_path, 'w', encoding='utf-8') as file:
+            file.write(generate_page(rng, f"Page {index}", page_keys, paragraphs))
+
+    options = {'quiz_file': 'quizzes.json', 'language': languages[0]}
+    options.update(plugin_options or {})
+    config_path = os.path.join(output_dir, 'mkdocs.yml')
+    with open(config_path, 'w', encoding='utf-8') as file:
+        file.write("site_name: Synthetic site\nplugins:\n  - mkdocs_quizz:\n")
+        # JSON scalars are valid YAML
+        file.writelines(f"      {name}: {json.dumps(value)}\n" for name, value in options.items())
+    return config_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('output_dir', help='the directory of the generated project')
+    parser.add_argument('--pages', type=int, default=100, help='number of pages')
+    parser.add_argument('--quizzes', type=int, default=400, help='number of quizzes')
+    parser.add_argument('--questions', type=int, default=5, help='average number of questions per quiz')
+    parser.add_argument('--languages', default='en,fr', help='comma separated languages of the quiz bank')
+    parser.add_argument('--media-ratio', type=float, default=0.3, help='share of questions with media')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the random generator')
+    args = parser.parse_args()
+
+    config_path = generate_site(args.output_dir, pages=args.pages, quizzes=args.quizzes, questions=args.questions,
+                                languages=tuple(args.languages.split(',')), media_ratio=args.media_ratio,
+                                seed=args.seed)
+    print(f"Generated {config_path} with {args.pages} pages and {args.quizzes} quizzes")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,200 @@
+"""
+Scaling benchmarks of the plugin rendering and page hooks, run offline on synthetic data.
+
+Each case measures the best wall time over a few repetitions, the tracemalloc peak of one run and the size of
+the output, for:
+    - `generate_quiz_html` on quizzes of 10 to 10,000 questions,
+    - `on_page_markdown` then `on_post_page` on pages with 1 to 200 quiz placeholders, rendering the quizzes,
+    - `on_post_page` on pages of 10 KB to 5 MB.
+
+Results can be saved as a JSON baseline and later compared against it, the script then exits with status 1
+when the time or the peak memory of a case grew by more than the threshold.
+
+Usage:
+    python benchmarks/suite.py [--filter on_post_page] [--repeat 5]
+    python benchmarks/suite.py --save baseline.json
+    python benchmarks/suite.py --compare baseline.json [--threshold 0.25]
+"""
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+
+from mkdocs.structure.files import File
+from mkdocs.structure.pages import Page
+
+from synthetic import build_html, build_markdown, build_quiz, build_quiz_data, make_plugin
+
+QUESTION_COUNTS = (10, 100, 1000, 10000)
+PLACEHOLDER_COUNTS = (1, 10, 50, 200)
+PAGE_SIZES = (10 * 1024, 100 * 1024, 1024 * 1024, 5 * 1024 * 1024)
+
+CONFIG = {'site_url': None}
+
+
+def make_page(name='bench.md'):
+    """
+    Returns a page, as passed to the page hooks, for the file `name`.
+    """
+    return Page('Benchmark', File(name, 'docs', 'site', False), CONFIG)
+
+
+def quiz_html_cases():
+    """
+    Yields the `generate_quiz_html` cases: one quiz of a growing number of questions.
+    """
+    plugin = make_plugin()
+    for question_count in QUESTION_COUNTS:
+        quiz = build_quiz(question_count)
+        yield f"generate_quiz_html[questions={question_count}]", lambda: (None,), \
+            lambda _, quiz=quiz: plugin.generate_quiz_html(quiz, 'bench')
+
+
+def page_hooks_cases():
+    """
+    Yields the page cases: a 100 KB page with a growing number of placeholders, each one referencing a distinct
+    quiz of 10 questions, going through `on_page_markdown` then `on_post_page`. The quizzes are rendered when the
+    page is written, every store of the plugin is emptied before each run so they are rendered every time.
+    """
+    plugin = make_plugin()
+    plugin.quiz_data = build_quiz_data(max(PLACEHOLDER_COUNTS), 10)
+    quiz_keys = list(plugin.quiz_data['quizzes'])
+    for placeholder_count in PLACEHOLDER_COUNTS:
+        markdown = build_markdown(100 * 1024, quiz_keys[:placeholder_count])
+
+        def setup():
+            plugin.rendered_quizzes = {}
+            plugin.quiz_models = {}
+            plugin.quiz_dom_ids = {}
+            plugin.quiz_payloads = {}
+            plugin.quiz_pages = {}
+            plugin.quiz_uses = {}
+            return (make_page(),)
+
+        def run(page, markdown=markdown):
+            output = plugin.on_page_markdown(markdown, page, CONFIG, None)
+            return plugin.on_post_page(f"<html><body>{output}</body></html>", page, CONFIG)
+
+        yield f"page_hooks[placeholders={placeholder_count}]", setup, run
+
+
+def post_page_cases():
+    """
+    Yields the `on_post_page` cases: pages of a growing size with 1 or 200 quiz placeholders to inject. The quizzes
+    are already rendered so the injection is measured alone, see `page_hooks_cases` for the rendering.
+    """
+    plugin = make_plugin()
+    plugin.quiz_data = build_quiz_data(1, 10)
+    quiz_html = plugin.generate_quiz_html(plugin.quiz_data['quizzes']['quiz0'], 'quiz0')
+    for size in PAGE_SIZES:
+        for placeholder_count in (1, max(PLACEHOLDER_COUNTS)):
+            quiz_keys = [(f"bench{i}", 'en', f"bench{i}") for i in range(placeholder_count)]
+            output = build_html(size, [f"<!-- QUIZ_PLACEHOLDER_{dom_id} -->" for _, _, dom_id in quiz_keys])
+
+            def setup(quiz_keys=quiz_keys):
+                plugin.rendered_quizzes = {(quiz_id, language): (dom_id, quiz_html)
+                                           for quiz_id, language, dom_id in quiz_keys}
+                plugin.quiz_uses = {(quiz_id, language): 1 for quiz_id, language, _ in quiz_keys}
+                page = make_page()
+                page.meta['quiz_placeholder'] = quiz_keys
+                return (page,)
+
+            def run(page, output=output):
+                return plugin.on_post_page(output, page, CONFIG)
+
+            yield f"on_post_page[size={size // 1024}KB,placeholders={placeholder_count}]", setup, run
+
+
+def measure(setup, run, repeat):
+    """
+    Measures one case.
+
+    Args:
+        setup (callable): Returns the arguments of `run`, called before each run and not measured.
+        run (callable): The measured call, returns the produced string.
+        repeat (int): The number of timed runs, the best one is kept.
+
+    Returns:
+        dict: The best time in seconds, the tracemalloc peak in bytes and the output size in bytes.
+    """
+    best = None
+    for _ in range(repeat):
+        args = setup()
+        start = time.perf_counter()
+        result = run(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    # Memory is measured on a separate run, tracing slows down the code being timed
+    args = setup()
+    tracemalloc.start()
+    try:
+        result = run(*args)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {'time': best, 'peak_memory': peak, 'output_bytes': len(result.encode('utf-8'))}
+
+
+def compare(results, baseline, threshold):
+    """
+    Compares results with a baseline.
+
+    Args:
+        results (dict): The measurements of this run, by case name.
+        baseline (dict): The measurements of the baseline, by case name.
+        threshold (float): The allowed relative growth, 0.25 allowing a 25% slower or larger case.
+
+    Returns:
+        list: A description of each regression.
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        for metric in ('time', 'peak_memory'):
+            if reference[metric] and result[metric] > reference[metric] * (1 + threshold):
+                growth = result[metric] / reference[metric] - 1
+                regressions.append(f"{name}: {metric} {reference[metric]:.6g} -> {result[metric]:.6g} "
+                                   f"(+{growth:.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--filter', default='', help='only run the cases whose name contains this string')
+    parser.add_argument('--repeat', type=int, default=5, help='number of timed runs of each case')
+    parser.add_argument('--save', metavar='PATH', help='write the results as a JSON baseline')
+    parser.add_argument('--compare', metavar='PATH', help='compare the results with a JSON baseline')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='allowed relative growth of time and peak memory when comparing (default: 0.25)')
+    args = parser.parse_args()
+
+    results = {}
+    for cases in (quiz_html_cases, page_hooks_cases, post_page_cases):
+        for name, setup, run in cases():
+            if args.filter not in name:
+                continue
+            result = results[name] = measure(setup, run, args.repeat)
+            print(f"{name:<50} {result['time'] * 1000:10.2f} ms {result['peak_memory'] / 1024:12.1f} KB peak "
+                  f"{result['output_bytes'] / 1024:12.1f} KB out")
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.save}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as file:
+            regressions = compare(results, json.load(file), args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) above {args.threshold:.0%}:")
+            print('\n'.join(f"  {regression}" for regression in regressions))
+            sys.exit(1)
+        print(f"No regression above {args.threshold:.0%}")
+
+
+if __name__ == '__main__':
+    main()
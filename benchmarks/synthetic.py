@@ -0,0 +1,77 @@
+"""
+Synthetic quiz data and pages shared by the benchmarks, built from the mock quiz data of the test suite.
+"""
+import copy
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from mkdocs_quiz.plugin import QuizPlugin  # noqa: E402
+from tests.mock_quiz_data import mock_quiz_data  # noqa: E402
+
+PARAGRAPH = "<p>" + "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 8 + "</p>\n"
+
+
+def build_quiz(question_count):
+    """
+    Builds a quiz with `question_count` questions by cycling through the questions of the mock quiz data.
+    """
+    source_questions = mock_quiz_data['quizzes']['quiz1']['questions']
+    questions = []
+    for i in range(question_count):
+        question = copy.deepcopy(source_questions[i % len(source_questions)])
+        question['question']['en'] = f"{i + 1}. {question['question']['en']}"
+        questions.append(question)
+    return {'questions': questions}
+
+
+def build_quiz_data(quiz_count, question_count):
+    """
+    Builds quiz data with `quiz_count` quizzes named `quiz0`, `quiz1`... of `question_count` questions each.
+    """
+    quizzes = {}
+    for i in range(quiz_count):
+        quiz = build_quiz(question_count)
+        quiz['questions'][0]['question']['en'] = f"Quiz {i}: {quiz['questions'][0]['question']['en']}"
+        quizzes[f"quiz{i}"] = quiz
+    return {'quizzes': quizzes}
+
+
+def build_markdown(size, quiz_ids):
+    """
+    Builds a Markdown page of about `size` bytes with a `QUIZ_ID` placeholder for each of `quiz_ids`, spread
+    evenly through the page.
+    """
+    chunk_count = max(len(quiz_ids), size // len(PARAGRAPH), 1)
+    chunks = [PARAGRAPH] * chunk_count
+    step = chunk_count // max(len(quiz_ids), 1)
+    for i, quiz_id in enumerate(quiz_ids):
+        chunks[i * step] += f"\n<!-- QUIZ_ID: {quiz_id} -->\n\n"
+    return "# Benchmark\n\n" + "".join(chunks)
+
+
+def build_html(size, placeholders):
+    """
+    Builds a rendered HTML page of about `size` bytes containing the given quiz placeholder comments.
+    """
+    body = build_markdown(size, [])
+    chunks = body.split("\n")
+    step = max(len(chunks) // max(len(placeholders), 1), 1)
+    for i, placeholder in enumerate(placeholders):
+        chunks[min(i * step, len(chunks) - 1)] += placeholder
+    return "<html><head><title>Benchmark</title></head><body>" + "\n".join(chunks) + "</body></html>"
+
+
+def make_plugin(**options):
+    """
+    Returns a configured plugin, as after `on_config`, without quiz data.
+    """
+    plugin = QuizPlugin()
+    errors, _ = plugin.load_config(dict({'quiz_file': ''}, **options))
+    if errors:
+        raise ValueError(errors)
+    plugin.on_config({})
+    return plugin
@@ -0,0 +1,230 @@
+import gzip
+import hashlib
+import io
+import os
+import re
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, `.br` files are only written when it is installed
+    brotli = None
+
+# The plugin assets, keyed by the name used in `QuizPlugin.asset_urls`
+ASSETS = {'js': 'quiz.js', 'css': 'quiz.css'}
+
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_CSS_SPACES = re.compile(r'\s+')
+_CSS_PUNCTUATION = re.compile(r'\s*([{};,>])\s*')
+_WORD_CHARS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_$\\')
+# A `/` following one of these characters starts a regular expression literal, not a division
+_REGEX_PREFIX = frozenset('(,=:[!&|?{};+-*%<>~^')
+# No newline is needed after or before these characters, automatic semicolon insertion cannot apply
+_NO_NEWLINE_AFTER = frozenset('{([,;:=&|?*%<>!~^')
+_NO_NEWLINE_BEFORE = frozenset(')]},;.:?&|=*%<>')
+# A `/` following one of these keywords also starts a regular expression literal
+_REGEX_KEYWORDS = frozenset(('return', 'typeof', 'case', 'delete', 'void', 'in', 'instanceof', 'new', 'throw',
+                             'do', 'else', 'yield', 'await'))
+
+
+def minify_css(source):
+    """
+    Minifies a stylesheet by removing comments and the whitespace that is not needed.
+
+    Args:
+        source (str): The CSS source.
+
+    Returns:
+        str: The minified CSS.
+    """
+    css = _CSS_COMMENT.sub('', source)
+    css = _CSS_SPACES.sub(' ', css)
+    css = _CSS_PUNCTUATION.sub(r'\1', css)
+    css = css.replace(': ', ':').replace(';}', '}')
+    return css.strip()
+
+
+def minify_js(source):
+    """
+    Minifies a script by removing comments and the whitespace that is not needed. Strings, template literals
+    and regular expression literals are copied unchanged, and line breaks are kept wherever automatic
+    semicolon insertion could depend on them.
+
+    Args:
+        source (str): The JavaScript source.
+
+    Returns:
+        str: The minified JavaScript.
+    """
+    out = []
+    last = ''  # last significant character written
+    word = ''  # identifier or keyword ending at `last`
+    pending = None  # whitespace skipped since `last`: None, ' ' or '\n'
+    i = 0
+    length = len(source)
+
+    while i < length:
+        char = source[i]
+        if char in ' \t\r\n':
+            pending = '\n' if char == '\n' or pending == '\n' else ' '
+            i += 1
+            continue
+        if source.startswith('//', i):
+            end = source.find('\n', i)
+            i = length if end == -1 else end
+            continue
+        if source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            i = length if end == -1 else end + 2
+            pending = pending or ' '
+            continue
+
+        if pending and last:
+            if pending == '\n' and last not in _NO_NEWLINE_AFTER and char not in _NO_NEWLINE_BEFORE:
+                out.append('\n')
+            elif (last in _WORD_CHARS and char in _WORD_CHARS) or (last in '+-' and char == last):
+                out.append(' ')
+        pending = None
+
+        if char in '\'"`' or (char == '/' and (not last or last in _REGEX_PREFIX or word in _REGEX_KEYWORDS)):
+            end = _literal_end(source, i)
+            out.append(source[i:end])
+            last = source[end - 1]
+            word = ''
+            i = end
+            continue
+
+        if char in _WORD_CHARS:
+            word = word + char if out and out[-1] in _WORD_CHARS else char
+        else:
+            word = ''
+        out.append(char)
+        last = char
+        i += 1
+
+    return ''.join(out)
+
+
+def _literal_end(source, start):
+    """
+    Returns the index following the string, template or regular expression literal starting at `start`.
+    """
+    quote = source[start]
+    in_class = False
+    i = start + 1
+    while i < len(source):
+        char = source[i]
+        if char == '\\':
+            i += 2
+            continue
+        if quote == '`' and source.startswith('${', i):
+            i = _expression_end(source, i + 2)
+            continue
+        if quote == '/':
+            if char == '[':
+                in_class = True
+            elif char == ']':
+                in_class = False
+            elif char == '/' and not in_class:
+                return i + 1
+        elif char == quote:
+            return i + 1
+        i += 1
+    return len(source)
+
+
+def _expression_end(source, start):
+    """
+    Returns the index following the `${...}` expression of a template literal whose content starts at `start`,
+    the strings and nested template literals of the expression may contain braces.
+    """
+    depth = 1
+    i = start
+    while i < len(source):
+        char = source[i]
+        if char in '\'"`':
+            i = _literal_end(source, i)
+            continue
+        if char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return len(source)
+
+
+def fingerprint(name, content):
+    """
+    Adds a short hash of the content to a file name, e.g. `quiz.js` becomes `quiz.3fa9c2d1.js`.
+
+    Args:
+        name (str): The file name.
+        content (bytes): The file content.
+
+    Returns:
+        str: The fingerprinted file name.
+    """
+    base, ext = os.path.splitext(name)
+    return f"{base}.{hashlib.sha256(content).hexdigest()[:8]}{ext}"
+
+
+def build_assets(static_dir):
+    """
+    Minifies and fingerprints the plugin assets.
+
+    Args:
+        static_dir (str): The directory containing `quiz.js` and `quiz.css`.
+
+    Returns:
+        dict: For each asset key, a tuple with its fingerprinted URL relative to the site root and its content.
+    """
+    minifiers = {'js': minify_js, 'css': minify_css}
+    assets = {}
+    for key, name in ASSETS.items():
+        with open(os.path.join(static_dir, name), 'r', encoding='utf-8') as file:
+            content = minifiers[key](file.read()).encode('utf-8')
+        assets[key] = (f"static/{fingerprint(name, content)}", content)
+    return assets
+
+
+def gzip_compress(content):
+    """
+    Compresses content with gzip, the header has no modification time so the output only depends on the content.
+    `gzip.compress` only takes an `mtime` from Python 3.8.
+
+    Args:
+        content (bytes): The content to compress.
+
+    Returns:
+        bytes: The compressed content.
+    """
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode='wb', compresslevel=9, mtime=0) as file:
+        file.write(content)
+    return buffer.getvalue()
+
+
+def write_assets(site_dir, assets):
+    """
+    Writes the built assets to the site directory along with their precompressed `.gz` and `.br` versions.
+
+    Args:
+        site_dir (str): The site directory.
+        assets (dict): The assets returned by `build_assets`.
+
+    Returns:
+        list: The paths of the written files.
+    """
+    written = []
+    for url, content in assets.values():
+        path = os.path.join(site_dir, *url.split('/'))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        variants = [(path, content), (f"{path}.gz", gzip_compress(content))]
+        if brotli is not None:
+            variants.append((f"{path}.br", brotli.compress(content)))
+        for variant_path, data in variants:
+            with open(variant_path, 'wb') as file:
+                file.write(data)
+            written.append(variant_path)
+    return written
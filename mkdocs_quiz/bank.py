@@ -0,0 +1,555 @@
+import contextlib
+import gc
+import hashlib
+import json
+import marshal
+import os
+import struct
+import sys
+from collections import ChainMap
+from collections.abc import Mapping
+from json.decoder import WHITESPACE, scanstring
+
+from .cache import content_hash
+
+# Bump this whenever the layout of the compiled file changes so stale files are compiled again.
+BANK_VERSION = 2
+MAGIC = b'MKQB'
+# Magic, then the length of the JSON header
+HEADER_STRUCT = struct.Struct('>4sI')
+
+
+@contextlib.contextmanager
+def gc_paused():
+    """
+    Pauses the garbage collector. Decoding a large quiz bank allocates millions of containers, none of them
+    garbage, which otherwise trigger many useless collections.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def compiled_path(quiz_file, kind='bank'):
+    """
+    Returns the path of a compiled file of a quiz file, a hidden file next to it.
+
+    Args:
+        quiz_file (str): The path of the JSON quiz file.
+        kind (str): `bank` for the compiled quiz bank, `index` for the quiz offsets used by the lazy loader.
+
+    Returns:
+        str: The path of the compiled file.
+    """
+    directory, name = os.path.split(quiz_file)
+    return os.path.join(directory, f".{name}.{kind}")
+
+
+def source_signature(quiz_file):
+    """
+    Args:
+        quiz_file (str): The path of the JSON quiz file.
+
+    Returns:
+        dict: The size and modification time of the file, checked before trusting a compiled file.
+    """
+    stat = os.stat(quiz_file)
+    return {'size': stat.st_size, 'mtime': stat.st_mtime_ns}
+
+
+def _header(signature, digest):
+    # marshal data is only readable by the Python version that wrote it
+    return dict(signature, version=BANK_VERSION, python=list(sys.version_info[:2]), hash=digest)
+
+
+def _write(path, header, payload):
+    header_data = json.dumps(header).encode('utf-8')
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as file:
+        file.write(HEADER_STRUCT.pack(MAGIC, len(header_data)))
+        file.write(header_data)
+        file.write(payload)
+    os.replace(tmp_path, path)
+
+
+def _read(path):
+    """
+    Reads a compiled file.
+
+    Returns:
+        tuple: The header and a memoryview over the marshal data, or None if the file is missing or invalid.
+    """
+    try:
+        with open(path, 'rb') as file:
+            data = file.read()
+        magic, header_size = HEADER_STRUCT.unpack_from(data)
+        header = json.loads(data[HEADER_STRUCT.size:HEADER_STRUCT.size + header_size])
+    except (OSError, ValueError, struct.error):
+        return None
+    if not _valid_header(magic, header):
+        return None
+    return header, memoryview(data)[HEADER_STRUCT.size + header_size:]
+
+
+def _valid_header(magic, header):
+    return magic == MAGIC and isinstance(header, dict) and header.get('version') == BANK_VERSION \
+        and header.get('python') == list(sys.version_info[:2])
+
+
+def compiled_hash(quiz_file, signature, kind='bank'):
+    """
+    Reads the hash of a quiz file stored in the header of its compiled file, without reading the compiled data.
+
+    Args:
+        quiz_file (str): The path of the JSON quiz file.
+        signature (dict): The size and modification time of the quiz file, see `source_signature`.
+        kind (str): The kind of compiled file, see `compiled_path`.
+
+    Returns:
+        str: The SHA-256 digest of the quiz file, or None if the compiled file is missing, invalid or was not
+            written for this version of the quiz file.
+    """
+    try:
+        with open(compiled_path(quiz_file, kind), 'rb') as file:
+            magic, header_size = HEADER_STRUCT.unpack(file.read(HEADER_STRUCT.size))
+            header = json.loads(file.read(header_size))
+    except (OSError, ValueError, struct.error):
+        return None
+    if not _valid_header(magic, header) or header.get('size') != signature['size'] \
+            or header.get('mtime') != signature['mtime']:
+        return None
+    return header.get('hash')
+
+
+class CompiledQuizzes(dict):
+    """
+    The quizzes of a compiled quiz bank, along with the digests of the quizzes stored in the bank so they are not
+    computed again on every load.
+    """
+
+    def __init__(self, quizzes, digests):
+        """
+        Args:
+            quizzes (dict): Quiz key -> quiz.
+            digests (dict): Quiz key -> digest of the quiz.
+        """
+        super().__init__(quizzes)
+        self._digests = digests
+
+    def digests(self):
+        """
+        Returns:
+            dict: Quiz key -> digest of the quiz, as stored in the compiled quiz bank.
+        """
+        return self._digests
+
+
+def _with_digests(quiz_data, digests):
+    quizzes = quiz_data.get('quizzes') if isinstance(quiz_data, dict) else None
+    if isinstance(quizzes, dict):
+        quiz_data = dict(quiz_data, quizzes=CompiledQuizzes(quizzes, digests))
+    return quiz_data
+
+
+def compile_quiz_file(quiz_file):
+    """
+    Parses a JSON quiz file and writes its compiled quiz bank next to it, with the digest of every quiz.
+
+    Args:
+        quiz_file (str): The path of the JSON quiz file.
+
+    Returns:
+        dict: The parsed quiz data.
+
+    Raises:
+        json.JSONDecodeError: If the quiz file is not valid JSON.
+    """
+    signature = source_signature(quiz_file)
+    with open(quiz_file, 'rb') as file:
+        source = file.read()
+    with gc_paused():
+        quiz_data = json.loads(source)
+    quizzes = quiz_data.get('quizzes') if isinstance(quiz_data, dict) else None
+    digests = quiz_digests(quizzes) if isinstance(quizzes, dict) else {}
+    _write(compiled_path(quiz_file), _header(signature, hashlib.sha256(source).hexdigest()),
+           marshal.dumps((quiz_data, digests)))
+    return _with_digests(quiz_data, digests) if digests else quiz_data
+
+
+def load_compiled(quiz_file):
+    """
+    Loads the compiled quiz bank of a quiz file if it is up to date.
+
+    The compiled file is trusted when the size and modification time of the quiz file did not change. When only
+    the modification time changed, for example after a checkout, the hash of the quiz file is compared and the
+    compiled file is kept if the content is the same.
+
+    Args:
+        quiz_file (str): The path of the JSON quiz file.
+
+    Returns:
+        dict: The quiz data, or None if there is no up to date compiled file. The quizzes provide their digests
+            through a `digests` method.
+    """
+    compiled = _load_compiled_file(quiz_file, compiled_path(quiz_file))
+    if not isinstance(compiled, tuple) or len(compiled) != 2:
+        return None
+    return _with_digests(*compiled)
+
+
+def _load_compiled_file(quiz_file, path):
+    compiled = _read(path)
+    if compiled is None:
+        return None
+    header, payload = compiled
+    signature = source_signature(quiz_file)
+    if header['size'] != signature['size']:
+        return None
+    if header['mtime'] != signature['mtime']:
+        with open(quiz_file, 'rb') as file:
+            if hashlib.sha256(file.read()).hexdigest() != header['hash']:
+                return None
+        try:
+            _write(path, _header(signature, header['hash']), payload)
+        except OSError:
+            pass
+    try:
+        with gc_paused():
+            return marshal.loads(payload)
+    except (EOFError, ValueError, TypeError):
+        return None
+
+
+class IndexedQuizzes(Mapping):
+    """
+    Read-only mapping of the quizzes of a quiz file, each quiz is decoded from the file when it is accessed.
+    Only the byte range of every quiz is kept in memory, the plugin keeps the normalized quizzes it renders.
+    """
+
+    def __init__(self, quiz_file, index):
+        """
+        Args:
+            quiz_file (str): The path of the JSON quiz file.
+            index (dict): Quiz key -> (byte offset, byte length, content digest) of the quiz in the file.
+        """
+        self.quiz_file = quiz_file
+        self.index = index
+        self._decoded = set()
+
+    @property
+    def decoded_count(self):
+        """
+        The number of distinct quizzes decoded so far.
+        """
+        return len(self._decoded)
+
+    def __getitem__(self, quiz_key):
+        offset, length, _ = self.index[quiz_key]
+        with open(self.quiz_file, 'rb') as file:
+            file.seek(offset)
+            quiz = json.loads(file.read(length))
+        self._decoded.add(quiz_key)
+        return quiz
+
+    def __contains__(self, quiz_key):
+        return quiz_key in self.index
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def __len__(self):
+        return len(self.index)
+
+    def digests(self):
+        """
+        Returns:
+            dict: Quiz key -> digest of the quiz source, computed without decoding the quizzes.
+        """
+        return {quiz_key: digest for quiz_key, (_, _, digest) in self.index.items()}
+
+
+def quiz_digests(quizzes):
+    """
+    Computes a digest of every quiz, used to find the quizzes that changed between two builds. Sources that
+    already know the digests of their quizzes provide them through a `digests` method, so their quizzes are not
+    decoded or hashed again.
+
+    Args:
+        quizzes (Mapping): The quizzes, a ChainMap of several sources is looked up like a single mapping.
+
+    Returns:
+        dict: Quiz key -> digest.
+    """
+    if isinstance(quizzes, ChainMap):
+        digests = {}
+        for source in reversed(quizzes.maps):
+            digests.update(quiz_digests(source))
+        return digests
+    if hasattr(quizzes, 'digests'):
+        return quizzes.digests()
+    return {quiz_key: content_hash(quiz) for quiz_key, quiz in quizzes.items()}
+
+
+def _skip_whitespace(text, index):
+    return WHITESPACE.match(text, index).end()
+
+
+def _expect(text, index, char):
+    if text[index:index + 1] != char:
+        raise json.JSONDecodeError(f"Expecting '{char}'", text, index)
+    return _skip_whitespace(text, index + 1)
+
+
+def _scan_object(text, index, scan_member):
+    """
+    Scans the JSON object starting at `index`.
+
+    Args:
+        text (str): The JSON document.
+        index (int): The index of the opening brace of the object.
+        scan_member (callable): Called with the key and the index of the value of each member, returns the index
+            just after the value.
+
+    Returns:
+        int: The index just after the closing brace of the object.
+    """
+    index = _expect(text, index, '{')
+    if text[index:index + 1] == '}':
+        return index + 1
+    while True:
+        if text[index:index + 1] != '"':
+            raise json.JSONDecodeError("Expecting property name enclosed in double quotes", text, index)
+        key, end = scanstring(text, index + 1)
+        if not text[index:end].isascii():
+            # The text is decoded as Latin-1, keys with UTF-8 bytes are decoded again from their source bytes
+            key = json.loads(text[index:end].encode('latin-1'))
+        index = _expect(text, _skip_whitespace(text, end), ':')
+        index = _skip_whitespace(text, scan_member(key, index))
+        if text[index:index + 1] == '}':
+            return index + 1
+        index = _expect(text, index, ',')
+
+
+def build_index(text):
+    """
+    Scans the content of a JSON quiz file in one pass and records the byte range of every quiz. Each quiz is
+    decoded by the C scanner of the `json` module to find where it ends and is released right away, so the memory
+    used does not grow with the number of quizzes.
+
+    Args:
+        text (str): The content of the JSON quiz file decoded as Latin-1. Every byte is then one character, so
+            character offsets are byte offsets. JSON delimiters are ASCII and never part of a multi-byte UTF-8
+            sequence, only the keys with non-ASCII bytes are decoded again.
+
+    Returns:
+        dict: Quiz key -> (byte offset, byte length, content digest) of the quiz in the file.
+
+    Raises:
+        json.JSONDecodeError: If the quiz file is not valid JSON.
+    """
+    scan_once = json.JSONDecoder().scan_once
+    index = {}
+
+    def scan_value(start):
+        try:
+            return scan_once(text, start)[1]
+        except StopIteration:
+            raise json.JSONDecodeError("Expecting value", text, start) from None
+
+    def scan_quiz(quiz_key, start):
+        end = scan_value(start)
+        digest = hashlib.sha256(text[start:end].encode('latin-1')).hexdigest()
+        index[quiz_key] = (start, end - start, digest)
+        return end
+
+    def scan_member(key, start):
+        if key == 'quizzes' and text[start:start + 1] == '{':
+            # As with json.load, the last of duplicated keys wins
+            index.clear()
+            return _scan_object(text, start, scan_quiz)
+        return scan_value(start)
+
+    end = _skip_whitespace(text, _scan_object(text, _skip_whitespace(text, 0), scan_member))
+    if end != len(text):
+        raise json.JSONDecodeError("Extra data", text, end)
+    return index
+
+
+def compile_quiz_index(quiz_file):
+    """
+    Indexes a JSON quiz file and writes the index next to it, it is used by the lazy loader when the
+    `compile_quiz_file` option is enabled.
+
+    Args:
+        quiz_file (str): The path of the JSON quiz file.
+
+    Returns:
+        dict: Quiz key -> (byte offset, byte length, content digest) of the quiz in the file.
+
+    Raises:
+        json.JSONDecodeError: If the quiz file is not valid JSON.
+    """
+    signature = source_signature(quiz_file)
+    with open(quiz_file, 'rb') as file:
+        source = file.read()
+    digest = hashlib.sha256(source).hexdigest()
+    text = source.decode('latin-1')
+    del source
+    index = build_index(text)
+    _write(compiled_path(quiz_file, 'index'), _header(signature, digest), marshal.dumps(index))
+    return index
+
+
+def load_quiz_index(quiz_file, compiled=False):
+    """
+    Indexes a JSON quiz file for lazy loading.
+
+    Args:
+        quiz_file (str): The path of the JSON quiz file.
+        compiled (bool): Whether to store the index next to the quiz file and reuse it while the quiz file does
+            not change, it is validated like the compiled quiz bank.
+
+    Returns:
+        tuple: The quizzes, decoded on first access, and whether the index was read from the compiled file.
+
+    Raises:
+        json.JSONDecodeError: If the quiz file is not valid JSON.
+    """
+    if compiled:
+        index = _load_compiled_file(quiz_file, compiled_path(quiz_file, 'index'))
+        if isinstance(index, dict):
+            return IndexedQuizzes(quiz_file, index), True
+        try:
+            return IndexedQuizzes(quiz_file, compile_quiz_index(quiz_file)), False
+        except OSError:
+            # The directory of the quiz file may be read-only, the build goes on without the compiled index
+            pass
+    with open(quiz_file, 'rb') as file:
+        text = file.read().decode('latin-1')
+    return IndexedQuizzes(quiz_file, build_index(text)), False
+
+
+def load_quiz_file(quiz_file, compiled=False, lazy=False):
+    """
+    Loads a JSON quiz file.
+
+    Args:
+        quiz_file (str): The path of the JSON quiz file.
+        compiled (bool): Whether to load the compiled quiz bank next to the quiz file, compiling it first when it
+            is missing or out of date. With `lazy`, the index of the quiz file is compiled instead.
+        lazy (bool): Whether to only index the quiz file, each quiz is then decoded when first accessed.
+
+    Returns:
+        tuple: The quiz data and whether it was read from a compiled file.
+
+    Raises:
+        json.JSONDecodeError: If the quiz file is not valid JSON.
+    """
+    if lazy:
+        quizzes, from_compiled = load_quiz_index(quiz_file, compiled)
+        return {'quizzes': quizzes}, from_compiled
+    if not compiled:
+        with open(quiz_file, 'r') as file, gc_paused():
+            return json.load(file), False
+    quiz_data = load_compiled(quiz_file)
+    if quiz_data is not None:
+        return quiz_data, True
+    try:
+        return compile_quiz_file(quiz_file), False
+    except OSError:
+        # The directory of the quiz file may be read-only, the build goes on without the compiled file
+        with open(quiz_file, 'r') as file, gc_paused():
+            return json.load(file), False
+
+
+def file_hash(path):
+    """
+    Returns:
+        str: The SHA-256 digest of the content of a file.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class QuizFile(Mapping):
+    """
+    The quizzes of a JSON quiz file, as a read-only mapping of quiz keys to quizzes. The parsed quizzes and their
+    digests are kept in memory, `load` only reads the file again when its size and modification time changed and
+    its content hash changed too.
+    """
+
+    def __init__(self, path, compiled=False, lazy=False):
+        """
+        Args:
+            path (str): The path of the JSON quiz file.
+            compiled (bool): Whether to use the compiled quiz bank, see `load_quiz_file`.
+            lazy (bool): Whether to decode each quiz when first accessed, see `load_quiz_file`.
+        """
+        self.path = path
+        self.compiled = compiled
+        self.lazy = lazy
+        self.quizzes = None
+        self.signature = None
+        self.hash = None
+        self._digests = None
+
+    def __getitem__(self, quiz_key):
+        return self.quizzes[quiz_key]
+
+    def __contains__(self, quiz_key):
+        return quiz_key in self.quizzes
+
+    def __iter__(self):
+        return iter(self.quizzes)
+
+    def __len__(self):
+        return len(self.quizzes)
+
+    def digests(self):
+        """
+        Returns:
+            dict: Quiz key -> digest of the quiz, computed once per version of the quiz file.
+        """
+        if self._digests is None:
+            self._digests = quiz_digests(self.quizzes)
+        return self._digests
+
+    def load(self):
+        """
+        Loads the quiz file unless the quizzes in memory are still up to date.
+
+        Returns:
+            str: `reused` when the quizzes in memory were kept, `compiled` when they were read from a compiled file,
+                `parsed` otherwise.
+
+        Raises:
+            json.JSONDecodeError: If the quiz file is not valid JSON.
+        """
+        signature = source_signature(self.path)
+        if self.quizzes is not None:
+            if signature == self.signature:
+                return 'reused'
+            # Saving a file without changing it, or a checkout, only updates its modification time
+            if signature['size'] == self.signature['size'] and file_hash(self.path) == self.hash:
+                self.signature = signature
+                return 'reused'
+        self.quizzes = None
+        quiz_data, compiled = load_quiz_file(self.path, self.compiled, self.lazy)
+        # The compiled file was validated or written by this load, its header already holds the hash
+        digest = self.compiled and compiled_hash(self.path, signature, 'index' if self.lazy else 'bank')
+        if not digest:
+            digest = file_hash(self.path)
+        if source_signature(self.path) != signature:
+            # The file changed while it was read, the next load reads it again
+            digest = None
+        self.quizzes = quiz_data.get('quizzes', {})
+        self.signature, self.hash, self._digests = signature, digest, None
+        return 'compiled' if compiled else 'parsed'
+
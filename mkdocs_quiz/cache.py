@@ -0,0 +1,170 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+# Bump this whenever the generated quiz markup changes so stale entries are ignored.
+CACHE_VERSION = 2
+
+
+def content_hash(*parts):
+    """
+    Computes a stable SHA-256 digest for any JSON serializable values.
+
+    Args:
+        *parts: The values to hash. Dict keys are sorted so the digest does not depend on insertion order.
+
+    Returns:
+        str: The hexadecimal digest.
+    """
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class RenderCache:
+    """
+    Content-addressed on-disk cache for rendered quiz HTML.
+
+    Each entry is stored as `<key>.html` inside the cache directory and an `index.json` file keeps the
+    entries in least recently used order, so the cache survives between `mkdocs build` runs and
+    `mkdocs serve` rebuilds. When the total size goes over `max_size` the oldest entries are evicted.
+    """
+
+    INDEX_FILE = 'index.json'
+
+    def __init__(self, cache_dir, max_size):
+        """
+        Args:
+            cache_dir (str): The directory where the cache entries are stored.
+            max_size (int): The maximum total size of the cached HTML, in bytes.
+        """
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> size in bytes, least recently used first
+        self._size = 0
+        self._dirty = False
+        self._load_index()
+
+    @staticmethod
+    def make_key(quiz, options):
+        """
+        Builds the cache key of a quiz for a given set of rendering options.
+
+        Args:
+            quiz (dict): The quiz entry from the quiz file.
+            options (dict): The rendering options of the plugin.
+
+        Returns:
+            str: The cache key.
+        """
+        return content_hash(CACHE_VERSION, quiz, options)
+
+    @property
+    def size(self):
+        return self._size
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        """
+        Returns the cached HTML for a key and marks it as recently used.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            str: The cached HTML, or None on a cache miss.
+        """
+        if key in self._entries:
+            try:
+                with open(self._entry_path(key), 'r', encoding='utf-8') as file:
+                    html = file.read()
+            except OSError:
+                self._discard(key)
+            else:
+                self._entries.move_to_end(key)
+                self._dirty = True
+                self.hits += 1
+                return html
+        self.misses += 1
+        return None
+
+    def set(self, key, html):
+        """
+        Stores the HTML for a key, evicting the least recently used entries if the cache is full.
+
+        Args:
+            key (str): The cache key.
+            html (str): The rendered HTML.
+        """
+        data = html.encode('utf-8')
+        if len(data) > self.max_size:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._entry_path(key)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as file:
+            file.write(data)
+        os.replace(tmp_path, path)
+
+        if key in self._entries:
+            self._size -= self._entries.pop(key)
+        self._entries[key] = len(data)
+        self._size += len(data)
+        self._dirty = True
+        self._evict()
+
+    def reset_stats(self):
+        """
+        Resets the hit and miss counters, typically at the start of a build.
+        """
+        self.hits = 0
+        self.misses = 0
+
+    def save(self):
+        """
+        Writes the index to disk if it changed since it was loaded.
+        """
+        if not self._dirty:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        index_path = os.path.join(self.cache_dir, self.INDEX_FILE)
+        tmp_path = f"{index_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump({'version': CACHE_VERSION, 'entries': list(self._entries.items())}, file)
+        os.replace(tmp_path, index_path)
+        self._dirty = False
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.html")
+
+    def _load_index(self):
+        try:
+            with open(os.path.join(self.cache_dir, self.INDEX_FILE), 'r', encoding='utf-8') as file:
+                index = json.load(file)
+        except (OSError, ValueError):
+            return
+        if not isinstance(index, dict) or index.get('version') != CACHE_VERSION:
+            return
+        for key, size in index.get('entries', []):
+            self._entries[key] = size
+            self._size += size
+        self._evict()
+
+    def _evict(self):
+        while self._size > self.max_size and self._entries:
+            self._discard(next(iter(self._entries)))
+
+    def _discard(self, key):
+        self._size -= self._entries.pop(key)
+        self._dirty = True
+        try:
+            os.remove(self._entry_path(key))
+        except OSError:
+            pass
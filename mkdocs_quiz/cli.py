@@ -0,0 +1,49 @@
+import argparse
+import json
+import sys
+import time
+
+from .bank import compile_quiz_file, compile_quiz_index, compiled_path
+
+
+def compile_command(args):
+    status = 0
+    for quiz_file in args.quiz_files:
+        start = time.perf_counter()
+        try:
+            if args.index:
+                quiz_count = len(compile_quiz_index(quiz_file))
+                kind = 'index'
+            else:
+                quiz_count = len(compile_quiz_file(quiz_file).get('quizzes', {}))
+                kind = 'bank'
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Cannot compile {quiz_file}: {e}", file=sys.stderr)
+            status = 1
+            continue
+        print(f"Compiled {quiz_count} quizzes from {quiz_file} to {compiled_path(quiz_file, kind)} "
+              f"in {time.perf_counter() - start:.2f} s")
+    return status
+
+
+def main(argv=None):
+    """
+    Entry point of the `mkdocs-quiz` command.
+
+    Args:
+        argv (list, optional): The command line arguments, `sys.argv` by default.
+
+    Returns:
+        int: The exit status.
+    """
+    parser = argparse.ArgumentParser(prog='mkdocs-quiz', description='Tools for the mkdocs_quiz plugin.')
+    commands = parser.add_subparsers(dest='command', required=True)
+    compile_parser = commands.add_parser(
+        'compile', help='pre-warm the compiled quiz bank used when the compile_quiz_file option is enabled')
+    compile_parser.add_argument('--index', action='store_true',
+                                help='write the index used when lazy_loading is enabled too, instead of the bank')
+    compile_parser.add_argument('quiz_files', nargs='+', metavar='quiz_file', help='the JSON quiz files to compile')
+    compile_parser.set_defaults(handler=compile_command)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
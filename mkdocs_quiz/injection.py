@@ -0,0 +1,50 @@
+import re
+
+# Quiz placeholders left by `on_page_markdown` and the tags where the assets are injected, matched in one scan
+INJECTION_PATTERN = re.compile(r'<!-- QUIZ_PLACEHOLDER_\w+ -->|</head>|</body>')
+
+
+def iter_inject_html(content, placeholders, head_html='', body_html=''):
+    """
+    Generates the chunks of a rendered page with the quiz placeholders replaced and the asset tags injected, in a
+    single scan. The chunks can be written to a stream as they come, or joined once.
+
+    Args:
+        content (str): The rendered HTML content of the page.
+        placeholders (dict): The HTML of each quiz keyed by its placeholder comment.
+        head_html (str): The HTML inserted before the first `</head>` tag.
+        body_html (str): The HTML inserted before the first `</body>` tag.
+
+    Yields:
+        str: The successive chunks of the updated HTML content.
+    """
+    pending = {'</head>': head_html, '</body>': body_html}
+    position = 0
+    for match in INJECTION_PATTERN.finditer(content):
+        start, end = match.span()
+        yield content[position:start]
+        token = match.group(0)
+        if token in pending:
+            yield pending.pop(token)
+            yield token
+        else:
+            yield placeholders.get(token, token)
+        position = end
+    yield content[position:]
+
+
+def inject_html(content, placeholders, head_html='', body_html=''):
+    """
+    Replaces the quiz placeholders of a rendered page and injects the asset tags in a single scan, so the page
+    is copied once whatever the number of quizzes.
+
+    Args:
+        content (str): The rendered HTML content of the page.
+        placeholders (dict): The HTML of each quiz keyed by its placeholder comment.
+        head_html (str): The HTML inserted before the first `</head>` tag.
+        body_html (str): The HTML inserted before the first `</body>` tag.
+
+    Returns:
+        str: The updated HTML content.
+    """
+    return ''.join(iter_inject_html(content, placeholders, head_html, body_html))
@@ -0,0 +1,125 @@
+import sys
+from collections import namedtuple
+
+# Question types rendered by the plugin itself, the fields of the other types are kept in `Question.extra`
+BUILTIN_TYPES = frozenset(('multiple-choice', 'true-false', 'multi-choice', 'fill-in-the-blank'))
+# Fields of the quiz file normalized into the other fields of `Question`
+QUESTION_FIELDS = frozenset(('type', 'question', 'indice', 'media', 'options', 'answer'))
+
+# Compact, immutable representation of a quiz for one language, the language fallback is already applied and the
+# strings are interned so the many repeated ones, such as question types, "True"/"False" options or empty hints,
+# are stored once. `sample` is the number of questions drawn at random by `quiz.js` on each visit, 0 to show
+# all of them.
+Quiz = namedtuple('Quiz', 'questions sample')
+# `extra` holds the other fields of the questions of types not built in the plugin, for their renderer, None for
+# the built-in types
+Question = namedtuple('Question', 'type text hint media answer options extra')
+Option = namedtuple('Option', 'text correct indice')
+Media = namedtuple('Media', 'type src alt')
+
+
+def localize(texts, language, default=''):
+    """
+    Returns the text for a language from a dict of translations, falling back on English.
+
+    Args:
+        texts (dict): The translations keyed by language, may be None.
+        language (str): The wanted language.
+        default (str): The value returned when neither the language nor English is available.
+
+    Returns:
+        str: The localized text.
+    """
+    if not texts:
+        return default
+    return texts.get(language, texts.get('en', default))
+
+
+def normalize_quiz(quiz, language):
+    """
+    Turns a quiz of the quiz file into its compact representation for one language.
+
+    Args:
+        quiz (dict): The quiz data.
+        language (str): The language of the texts.
+
+    Returns:
+        Quiz: The normalized quiz, fill-in-the-blank answers are stripped and lowercased and the other questions
+            have options. The other fields of questions of types not built in the plugin are kept in `extra`,
+            translations, dicts keyed by language, are localized. An invalid `sample` is ignored.
+    """
+    return normalize_quiz_languages(quiz, (language,))[language]
+
+
+def normalize_quiz_languages(quiz, languages):
+    """
+    Turns a quiz of the quiz file into its compact representation for several languages, in a single traversal
+    of its questions.
+
+    Args:
+        quiz (dict): The quiz data.
+        languages (iterable): The languages of the texts.
+
+    Returns:
+        dict: The normalized quiz of each language, see `normalize_quiz`.
+    """
+    # Called for every quiz of a build, `localize` is inlined and the tuples are built without going through
+    # the Python level constructors of the named tuples
+    intern = sys.intern
+    new = tuple.__new__
+    empty = {}
+
+    def localizer(language):
+        def text(texts):
+            value = texts[language] if language in texts else texts.get('en', '')
+            # Texts may also be numbers, sys.intern only accepts strings
+            return intern(value) if type(value) is str else value
+        return text
+
+    def extra_fields(question, language, text):
+        extra = {}
+        for key, value in question.items():
+            if key in QUESTION_FIELDS:
+                continue
+            if isinstance(value, dict) and (language in value or 'en' in value):
+                value = text(value)
+            extra[key] = value
+        return extra
+
+    sample = quiz.get('sample')
+    if not isinstance(sample, int) or isinstance(sample, bool) or sample < 0:
+        sample = 0
+    questions = {language: [] for language in languages}
+    variants = [(questions[language], language, localizer(language)) for language in questions]
+
+    for question in quiz.get('questions', []):
+        quiz_type = intern(question.get('type', 'multiple-choice'))
+        texts = question['question']
+        hints = question.get('indice') or empty
+        media = question.get('media')
+        if media:
+            media_type = intern(media['type'])
+            media_src = intern(media['src'])
+            alts = media.get('alt') or empty
+        if quiz_type == 'fill-in-the-blank':
+            answers = question['answer']
+            options = None
+        else:
+            options = question.get('options', [])
+        builtin = quiz_type in BUILTIN_TYPES
+
+        for normalized, language, text in variants:
+            if options is None:
+                answer = intern(str(text(answers)).strip().lower())
+                localized_options = ()
+            else:
+                answer = None
+                localized_options = tuple([
+                    new(Option, (text(option['text']), bool(option['correct']), text(option.get('indice') or empty)))
+                    for option in options
+                ])
+            normalized.append(new(Question, (quiz_type, text(texts), text(hints),
+                                             new(Media, (media_type, media_src, text(alts))) if media else None,
+                                             answer, localized_options,
+                                             None if builtin else extra_fields(question, language, text))))
+    return {language: new(Quiz, (tuple(normalized), sample)) for language, normalized in questions.items()}
@@ -0,0 +1,51 @@
+import json
+from .cache import content_hash
+from .model import Quiz, normalize_quiz
+
+# Directory of the site where the quiz payloads are written
+PAYLOAD_DIR = 'quizzes'
+
+
+def build_payload(quiz, language):
+    """
+    Builds the compact client-side representation of a quiz for one language, `quiz.js` renders the quiz
+    from it. Only the fields needed by the client are kept and the language fallback is already applied.
+
+    Args:
+        quiz (dict or Quiz): The quiz data, or the quiz already normalized for the language.
+        language (str): The language of the payload.
+
+    Returns:
+        dict: The quiz payload.
+    """
+    if not isinstance(quiz, Quiz):
+        quiz = normalize_quiz(quiz, language)
+    questions = []
+    for question in quiz.questions:
+        entry = {'type': question.type, 'text': question.text, 'hint': question.hint}
+        if question.media:
+            entry['media'] = question.media._asdict()
+        if question.type == 'fill-in-the-blank':
+            entry['answer'] = question.answer
+        else:
+            entry['options'] = [option._asdict() for option in question.options]
+        questions.append(entry)
+    return {'questions': questions}
+
+
+def encode_payload(quiz_key, quiz, language):
+    """
+    Encodes the payload of a quiz and builds its URL. The URL contains a hash of the payload so it can be
+    cached by browsers and shared by all the pages embedding the quiz.
+
+    Args:
+        quiz_key (str): The quiz key in the quiz file.
+        quiz (dict or Quiz): The quiz data, or the quiz already normalized for the language.
+        language (str): The language of the payload.
+
+    Returns:
+        tuple: The payload URL relative to the site root and the encoded JSON payload.
+    """
+    payload = build_payload(quiz, language)
+    data = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return f"{PAYLOAD_DIR}/{quiz_key}.{language}.{content_hash(payload)[:8]}.json", data
@@ -1,14 +1,34 @@
 import re
-import uuid
 import json
+import logging
 from mkdocs.plugins import BasePlugin
 import os
 import warnings
+from collections import ChainMap
+from urllib.parse import urljoin
 from mkdocs.config import config_options
+from mkdocs.utils import get_relative_url
 from mkdocs.structure.files import File
+from .assets import build_assets, write_assets
+from .bank import IndexedQuizzes, QuizFile, quiz_digests
+from .cache import RenderCache, content_hash
+from .injection import inject_html
+from .model import BUILTIN_TYPES, Quiz, normalize_quiz, normalize_quiz_languages
+from .payload import encode_payload
+from .prerender import pool_renderers, render_in_pool
+from .profiling import Profiler, profiled
+from .quiz_dir import QuizDirectory
+from .renderers import (HINT_BUTTON, MEDIA, PAGE_CLOSE, PAGE_OPEN, PAGE_TEMPLATE_CLOSE, PAGE_TEMPLATE_OPEN,
+                        PAGINATION, PROGRESS_BAR, QUESTION_CLOSE, QUESTION_OPEN, QUESTION_TEXT, QUESTION_TEXT_CLOSE,
+                        QUIZ_CLOSE, QUIZ_OPEN, REFRESH_BUTTON, RENDERERS, SCORE, load_entry_points,
+                        renderer_signature)
 
 warnings.filterwarnings("ignore")
 
+log = logging.getLogger('mkdocs.plugins.mkdocs_quiz')
+
+QUIZ_ID_PATTERN = re.compile(r'<!-- QUIZ_ID: (\w+) -->')
+
 class QuizPlugin(BasePlugin):
     """
     Simple MkDocs plugin that generates interactive quizzes in MkDocs pages.
@@ -18,24 +38,80 @@ class QuizPlugin(BasePlugin):
 
     config_scheme = (
         ('quiz_file', config_options.Type(str, default='quizzes.json')),
+        ('quiz_dir', config_options.Type(str, default='')),
+        ('compile_quiz_file', config_options.Type(bool, default=False)),
+        ('lazy_loading', config_options.Type(bool, default=False)),
         ('language', config_options.Type(str, default='en')),
+        ('languages', config_options.Type(list, default=[])),
         ('show_refresh_button', config_options.Type(bool, default=True)),
         ('show_indice_on_answer', config_options.Type(bool, default=True)),
         ('show_score', config_options.Type(bool, default=True)),
         ('show_progress_bar', config_options.Type(bool, default=True)),
+        ('questions_per_page', config_options.Type(int, default=0)),  # 0 to show all the questions at once
         ('logging', config_options.Type(bool, default=False)),  
+        ('cache', config_options.Type(bool, default=False)),
+        ('cache_dir', config_options.Type(str, default='.cache/mkdocs_quiz')),
+        ('cache_max_size', config_options.Type(int, default=50)),  # in megabytes
+        ('asset_urls', config_options.Choice(('relative', 'absolute'), default='relative')),
+        ('defer_script', config_options.Type(bool, default=True)),
+        ('preload_assets', config_options.Type(bool, default=False)),
+        ('optimize_assets', config_options.Type(bool, default=False)),
+        ('render_mode', config_options.Choice(('html', 'payload'), default='html')),
+        ('prerender', config_options.Type(bool, default=False)),
+        ('prerender_workers', config_options.Type(int, default=0)),  # 0 for the number of CPUs
+        ('profile', config_options.Type(bool, default=False)),
+        ('profile_report', config_options.Type(str, default='mkdocs_quiz_profile.json')),
     )
 
-    def console_log(self, message):
+    # URLs of the plugin assets relative to the site root, set when the files are added in `on_files`
+    asset_urls = {'js': 'static/quiz.js', 'css': 'static/quiz.css'}
+    # Minified and fingerprinted assets written in `on_post_build` when `optimize_assets` is enabled
+    built_assets = None
+
+    render_cache = None
+    profiler = None
+    # Quizzes of `quiz_file` and `quiz_dir`, kept between `mkdocs serve` rebuilds so unchanged files are not read
+    # again
+    quiz_bank = None
+    quiz_directory = None
+    quiz_data = {'quizzes': {}}
+    # Whether the plugin runs in `mkdocs serve`, the rendered quizzes are then kept for the next rebuild
+    serving = False
+
+    def __init__(self):
+        super().__init__()
+        # The stores below are keyed by (quiz key, language)
+        # Rendered HTML kept in memory between `mkdocs serve` rebuilds: -> (element ID, html)
+        self.rendered_quizzes = {}
+        self.rendered_options = None
+        # Quizzes normalized for a language, rendered from: -> Quiz
+        self.quiz_models = {}
+        # Element IDs of the quizzes, known before the quizzes are rendered: -> element ID
+        self.quiz_dom_ids = {}
+        # JSON payloads of the quizzes in `payload` render mode: -> (URL, encoded payload)
+        self.quiz_payloads = {}
+        # Content hash of every quiz of the last loaded quiz file: quiz key -> hash
+        self.quiz_hashes = {}
+        # Reverse index built while pages are processed: quiz key -> source paths of the pages using it
+        self.quiz_pages = {}
+        # Number of pages of the build still to be written for each quiz used by the build: -> count
+        self.quiz_uses = {}
+
+    def console_log(self, message, *args):
         """
-        Prints a log message if logging is enabled in the plugin configuration.
+        Logs a diagnostic message on the `mkdocs.plugins.mkdocs_quiz` logger. Messages are logged at the INFO
+        level when logging is enabled in the plugin configuration, at the DEBUG level otherwise so they still
+        show with `mkdocs build --verbose`. The message is only formatted if the level is enabled.
 
         Args:
-            message (str): The message to print.
+            message (str): The message, with %-style placeholders.
+            *args: The values of the placeholders.
         """
-        if self.config.get('logging', True):
-            print(f"DEBUG MESSAGE: {message}")
+        level = logging.INFO if self.config.get('logging', False) else logging.DEBUG
+        if log.isEnabledFor(level):
+            log.log(level, message, *args)
 
+    @profiled
     def on_config(self, config):
         """
         Handles the MkDocs configuration loading event.
@@ -49,28 +125,336 @@ class QuizPlugin(BasePlugin):
             Config: The updated MkDocs configuration.
         """
         self.console_log("Running on_config...")
+        # Question types of third-party packages, registered once per process
+        load_entry_points()
+        self.profiler = Profiler() if self.config.get('profile', False) else None
         quiz_file_path = self.config.get('quiz_file')
         self.language = self.config.get('language', 'en')
+        # Languages rendered from the same quiz bank, the default one first
+        self.languages = list(dict.fromkeys([self.language, *self.config.get('languages', [])]))
         self.show_refresh_button = self.config.get('show_refresh_button', True)
         self.show_indice_on_answer = self.config.get('show_indice_on_answer', True)
         self.show_score = self.config.get('show_score', True)
         self.show_progress_bar = self.config.get('show_progress_bar', True)
-        self.console_log(f"Configuration - Language: {self.language}, Show refresh button: {self.show_refresh_button}")
+        self.questions_per_page = max(self.config.get('questions_per_page', 0), 0)
+        self.render_mode = self.config.get('render_mode', 'html')
+        self.console_log("Configuration - Language: %s, Show refresh button: %s", self.language, self.show_refresh_button)
+
+        # Set up the render cache, it is kept on disk so it survives between builds
+        if self.config.get('cache', False):
+            cache_dir = self.config.get('cache_dir', '.cache/mkdocs_quiz')
+            max_size = self.config.get('cache_max_size', 50) * 1024 * 1024
+            if self.render_cache is None or self.render_cache.cache_dir != cache_dir:
+                self.render_cache = RenderCache(cache_dir, max_size)
+            self.render_cache.max_size = max_size
+            self.render_cache.reset_stats()
+            self.console_log("Render cache enabled in %s with %d entries", cache_dir, len(self.render_cache))
+        else:
+            self.render_cache = None
 
         # Load quiz data
         if quiz_file_path and os.path.isfile(quiz_file_path):
+            compiled = self.config.get('compile_quiz_file', False)
+            lazy = self.config.get('lazy_loading', False)
+            if self.quiz_bank is None or (self.quiz_bank.path, self.quiz_bank.compiled, self.quiz_bank.lazy) != \
+                    (quiz_file_path, compiled, lazy):
+                self.quiz_bank = QuizFile(quiz_file_path, compiled, lazy)
             try:
-                with open(quiz_file_path, 'r') as file:
-                    self.quiz_data = json.load(file)
-                self.console_log(f"Loaded quiz data from {quiz_file_path}: {self.quiz_data}")
+                status = self.quiz_bank.load()
+                self.console_log("Loaded %d quizzes from %s (%s)", len(self.quiz_bank), quiz_file_path, status)
+                self.quiz_data = {'quizzes': self.quiz_bank}
             except json.JSONDecodeError as e:
-                self.console_log(f"JSON is invalid: {e}")
+                self.console_log("JSON is invalid: %s", e)
+                self.quiz_bank = None
                 self.quiz_data = {'quizzes': {}}
         else:
+            self.quiz_bank = None
             self.quiz_data = {'quizzes': {}}
+
+        quiz_dir = self.config.get('quiz_dir')
+        if quiz_dir:
+            if self.quiz_directory is None or self.quiz_directory.path != quiz_dir:
+                self.quiz_directory = QuizDirectory(quiz_dir)
+            self.quiz_directory.load()
+            self.console_log("Loaded %d quizzes from %s, %d files read", len(self.quiz_directory), quiz_dir,
+                             self.quiz_directory.reloaded)
+            # Quizzes of the directory take precedence over the ones of the quiz file
+            self.quiz_data = {'quizzes': ChainMap(self.quiz_directory, self.quiz_data['quizzes'])}
+        else:
+            self.quiz_directory = None
+
+        self.invalidate_rendered_quizzes()
         return config
-    
-    
+
+    def on_startup(self, command, dirty):
+        """
+        Handles the startup event. Defining it makes MkDocs keep the same plugin instance between
+        `mkdocs serve` rebuilds, so the rendered quizzes can be reused.
+
+        Args:
+            command (str): The MkDocs command being run.
+            dirty (bool): Whether the build is a dirty build.
+        """
+        self.console_log("Running on_startup for command: %s", command)
+        self.serving = command == 'serve'
+
+    def on_serve(self, server, config, builder):
+        """
+        Handles the serve event, the quiz file and directory are added to the files watched by the live-reload
+        server.
+
+        Args:
+            server (LiveReloadServer): The live-reload server.
+            config (Config): The MkDocs configuration object.
+            builder (Callable): The function rebuilding the site.
+
+        Returns:
+            LiveReloadServer: The live-reload server.
+        """
+        quiz_file_path = self.config.get('quiz_file')
+        if quiz_file_path and os.path.isfile(quiz_file_path):
+            self.console_log("Watching quiz file: %s", quiz_file_path)
+            server.watch(os.path.abspath(quiz_file_path))
+        quiz_dir = self.config.get('quiz_dir')
+        if quiz_dir and os.path.isdir(quiz_dir):
+            self.console_log("Watching quiz directory: %s", quiz_dir)
+            server.watch(os.path.abspath(quiz_dir))
+        return server
+
+    def invalidate_rendered_quizzes(self):
+        """
+        Compares the freshly loaded quiz data with the previous build and drops the rendered HTML of the quizzes
+        that changed, the other quizzes are not rendered again. Everything is dropped if the rendering options
+        changed. The reverse index of the previous build is used to report the affected pages.
+
+        The digests of the quizzes are only computed during `mkdocs serve`, a single build has no previous build
+        to compare with.
+        """
+        options = self.render_options()
+        if options != self.rendered_options:
+            self.rendered_quizzes = {}
+            self.quiz_models = {}
+            self.quiz_dom_ids = {}
+            self.quiz_payloads = {}
+            self.rendered_options = options
+
+        quiz_hashes = quiz_digests(self.quiz_data['quizzes']) if self.serving else {}
+        changed = set()
+        if self.quiz_hashes:
+            changed = {quiz_id for quiz_id in self.quiz_hashes.keys() | quiz_hashes.keys()
+                       if self.quiz_hashes.get(quiz_id) != quiz_hashes.get(quiz_id)}
+        if changed:
+            for store in (self.rendered_quizzes, self.quiz_models, self.quiz_dom_ids, self.quiz_payloads):
+                for key in [key for key in store if key[0] in changed]:
+                    del store[key]
+        for quiz_id in changed:
+            pages = self.quiz_pages.get(quiz_id)
+            if pages:
+                self.console_log("Quiz %s changed, affected pages: %s", quiz_id, pages)
+
+        self.quiz_hashes = quiz_hashes
+        self.quiz_pages = {}
+        self.quiz_uses = {}
+
+    def page_language(self, page, config):
+        """
+        Returns the language the quizzes of a page are rendered in. When `languages` is set, it is the `language`
+        of the page metadata, or the language being built by the i18n plugin, or the locale of the page file, the
+        first one among `languages`. It is the `language` option otherwise.
+
+        Args:
+            page (Page): The page object, None for the language of the build.
+            config (Config): The MkDocs configuration object.
+
+        Returns:
+            str: The language.
+        """
+        if len(self.languages) == 1:
+            return self.language
+        plugins = config.get('plugins') if hasattr(config, 'get') else None
+        i18n = plugins.get('i18n') if plugins else None
+        candidates = (
+            page.meta.get('language') if page is not None else None,
+            getattr(i18n, 'current_language', None),
+            getattr(page.file, 'locale', None) if page is not None else None,
+        )
+        for language in candidates:
+            if language in self.languages:
+                return language
+        return self.language
+
+    def render_quiz(self, quiz_id, language=None):
+        """
+        Returns the HTML of a quiz from the quiz file, reusing the HTML rendered by a previous build when the quiz
+        did not change. In `payload` render mode, and for the quizzes with a `sample` of their questions, the HTML
+        is a lightweight placeholder and the quiz payload is written to the site in `on_post_build`. Quizzes with
+        question types not built in the plugin are always rendered in the page, `quiz.js` cannot render them.
+
+        Args:
+            quiz_id (str): The quiz key in the quiz file.
+            language (str, optional): The language of the quiz, defaults to the `language` option.
+
+        Returns:
+            tuple: The element ID of the quiz and its generated HTML.
+        """
+        key = (quiz_id, language or self.language)
+        if key not in self.rendered_quizzes:
+            model = self.quiz_model(*key)
+            dom_id = self.quiz_element_id(*key)
+            sample = self.quiz_sample(model)
+            client_side = self.client_renderable(model)
+            if not client_side and (self.render_mode == 'payload' or model.sample):
+                log.warning("Quiz %s has question types quiz.js cannot render, it is rendered in the page with all "
+                            "its questions", quiz_id)
+            if sample or (self.render_mode == 'payload' and client_side):
+                payload_url, payload = encode_payload(quiz_id, model, key[1])
+                self.quiz_payloads[key] = (payload_url, payload)
+                quiz_html = self.generate_placeholder_html(dom_id, payload_url, sample)
+                emitted_bytes = len(payload)
+            else:
+                quiz_html = self.generate_quiz_html(model, quiz_id, dom_id, key[1])
+                emitted_bytes = len(quiz_html.encode('utf-8'))
+            self.rendered_quizzes[key] = (dom_id, quiz_html)
+            if self.profiler is not None:
+                self.profiler.record_quiz(self.profile_key(*key), emitted_bytes)
+        return self.rendered_quizzes[key]
+
+    def quiz_sample(self, quiz):
+        """
+        Returns the number of questions `quiz.js` draws from a quiz on each visit.
+
+        Args:
+            quiz (Quiz): The normalized quiz.
+
+        Returns:
+            int: The `sample` of the quiz, 0 when all the questions are shown.
+        """
+        if quiz.sample >= len(quiz.questions) or not self.client_renderable(quiz):
+            return 0
+        return quiz.sample
+
+    def client_renderable(self, quiz):
+        """
+        Tells whether `quiz.js` can render a quiz from its payload, it only knows the built-in question types.
+
+        Args:
+            quiz (Quiz): The normalized quiz.
+
+        Returns:
+            bool: Whether all the questions of the quiz are of built-in types.
+        """
+        return all(question.type in BUILTIN_TYPES for question in quiz.questions)
+
+    def profile_key(self, quiz_id, language):
+        """
+        Returns the name of a quiz in the profile report, the language is added for the other languages than the
+        default one.
+        """
+        return quiz_id if language == self.language else f"{quiz_id} ({language})"
+
+    def quiz_model(self, quiz_id, language=None):
+        """
+        Returns a quiz of the quiz file normalized for a language. The quiz is normalized once per build for all
+        the configured languages, in a single traversal of its questions.
+
+        Args:
+            quiz_id (str): The quiz key in the quiz file.
+            language (str, optional): The language of the quiz, defaults to the `language` option.
+
+        Returns:
+            Quiz: The normalized quiz.
+        """
+        language = language or self.language
+        model = self.quiz_models.get((quiz_id, language))
+        if model is None:
+            languages = self.languages if language in self.languages else (language,)
+            for variant, variant_model in normalize_quiz_languages(self.quiz_data['quizzes'][quiz_id],
+                                                                   languages).items():
+                self.quiz_models.setdefault((quiz_id, variant), variant_model)
+            model = self.quiz_models[(quiz_id, language)]
+        return model
+
+    def quiz_element_id(self, quiz_id, language=None):
+        """
+        Returns the element ID of a quiz of the quiz file, without rendering it.
+
+        Args:
+            quiz_id (str): The quiz key in the quiz file.
+            language (str, optional): The language of the quiz, defaults to the `language` option.
+
+        Returns:
+            str: The element ID of the quiz.
+        """
+        key = (quiz_id, language or self.language)
+        dom_id = self.quiz_dom_ids.get(key)
+        if dom_id is None:
+            dom_id = self.quiz_dom_ids[key] = self.quiz_dom_id(quiz_id, self.quiz_model(*key))
+        return dom_id
+
+    def prerender_quizzes(self, files, config):
+        """
+        Renders the quizzes referenced by the documentation pages in a pool of processes, before the pages are
+        rendered, so the page hooks only read the results. Quizzes already rendered by a previous build or found
+        in the render cache are not sent to the pool. The quizzes are rendered in the language of the build, see
+        `page_language`.
+
+        Args:
+            files (Files): The collection of MkDocs files.
+            config (Config): The MkDocs configuration object.
+        """
+        quizzes = self.quiz_data['quizzes']
+        language = self.page_language(None, config)
+        quiz_ids = set()
+        for file in files.documentation_pages():
+            try:
+                if file.abs_src_path is None:
+                    # Pages generated by other plugins, MkDocs >= 1.6
+                    content = file.content_string
+                else:
+                    # Quiz IDs are ASCII, invalid UTF-8 is left for MkDocs to report when it reads the page
+                    with open(file.abs_src_path, 'r', encoding='utf-8-sig', errors='replace') as source:
+                        content = source.read()
+            except OSError:
+                continue
+            if 'QUIZ_ID' in content:
+                quiz_ids.update(QUIZ_ID_PATTERN.findall(content))
+
+        renderers, unsent = pool_renderers()
+        jobs = []
+        for quiz_id in sorted(quiz_ids):
+            key = (quiz_id, language)
+            if key in self.rendered_quizzes or quiz_id not in quizzes:
+                continue
+            model = self.quiz_model(*key)
+            # Sampled quizzes are drawn by `quiz.js` from their payload
+            if self.quiz_sample(model):
+                continue
+            dom_id = self.quiz_element_id(*key)
+            if self.render_cache is not None:
+                quiz_html = self.render_cache.get(self.render_key(model, dom_id, language))
+                if quiz_html is not None:
+                    self.rendered_quizzes[key] = (dom_id, quiz_html)
+                    continue
+            # The workers cannot get the renderers of these types, the quiz is rendered with its page
+            if unsent and any(question.type in unsent for question in model.questions):
+                continue
+            jobs.append((key, model, dom_id))
+        self.console_log("Pre-rendering %d of %d referenced quizzes", len(jobs), len(quiz_ids))
+        # A single quiz is not worth starting the pool
+        if len(jobs) < 2:
+            return
+
+        dom_ids = {key: dom_id for key, _, dom_id in jobs}
+        models = {key: model for key, model, _ in jobs}
+        workers = self.config.get('prerender_workers', 0) or None
+        for key, quiz_html in render_in_pool(jobs, self.render_options(), workers, renderers):
+            self.rendered_quizzes[key] = (dom_ids[key], quiz_html)
+            if self.render_cache is not None:
+                self.render_cache.set(self.render_key(models[key], dom_ids[key], language), quiz_html)
+            if self.profiler is not None:
+                self.profiler.record_quiz(self.profile_key(*key), len(quiz_html.encode('utf-8')))
+
+    @profiled
     def on_files(self, files, config):
         """
         Handles the event when MkDocs files are loaded, see more on the MkDocs official documentation.
@@ -82,15 +466,28 @@ class QuizPlugin(BasePlugin):
         Returns:
             Files: The updated collection of MkDocs files.
         """
+        if self.config.get('prerender', False) and self.render_mode == 'html':
+            self.prerender_quizzes(files, config)
+
         plugin_dir = os.path.dirname(__file__)
-        js_file = File(os.path.join(plugin_dir, 'static', 'quiz.js'), config['docs_dir'], config['site_dir'], False)
-        css_file = File(os.path.join(plugin_dir, 'static', 'quiz.css'), config['docs_dir'], config['site_dir'], False)
-        self.console_log(f"Adding JS file: {js_file}")
-        self.console_log(f"Adding CSS file: {css_file}")
+        if self.config.get('optimize_assets', False):
+            # The assets are written with content-hashed names once the site is built
+            self.built_assets = build_assets(os.path.join(plugin_dir, 'static'))
+            self.asset_urls = {key: url for key, (url, _) in self.built_assets.items()}
+            self.console_log("Using optimized assets: %s", self.asset_urls)
+            return files
+
+        self.built_assets = None
+        js_file = File('static/quiz.js', plugin_dir, config['site_dir'], False)
+        css_file = File('static/quiz.css', plugin_dir, config['site_dir'], False)
+        self.console_log("Adding JS file: %s", js_file)
+        self.console_log("Adding CSS file: %s", css_file)
         files.append(js_file)
         files.append(css_file)
+        self.asset_urls = {'js': js_file.url, 'css': css_file.url}
         return files
 
+    @profiled
     def on_page_markdown(self, markdown, page, config, files):
         """
         Handles the Markdown content of a page before rendering, see more on the MkDocs official documentation.
@@ -105,20 +502,48 @@ class QuizPlugin(BasePlugin):
         Returns:
             str: The updated Markdown content with quiz placeholders replaced.
         """
-        quiz_placeholder_pattern = re.compile(r'<!-- QUIZ_ID: (\w+) -->')
-        matches = quiz_placeholder_pattern.findall(markdown)
-        self.console_log(f"Running on_page_markdown... Found quiz placeholders: {matches}")
-
-        for quiz_id in matches:
-            if quiz_id in self.quiz_data['quizzes']:
-                self.console_log(f"Generating HTML for quiz ID: {quiz_id}")
-                quiz_html = self.generate_quiz_html(self.quiz_data['quizzes'][quiz_id])
-                placeholder = f"<!-- QUIZ_PLACEHOLDER_{quiz_id} -->"
-                markdown = markdown.replace(f'<!-- QUIZ_ID: {quiz_id} -->', placeholder)
-                page.meta['quiz_placeholder'] = page.meta.get('quiz_placeholder', []) + [(placeholder, quiz_html)]
-        
+        # Most pages have no quiz, skip the regex work for them
+        if 'QUIZ_ID' not in markdown:
+            return markdown
+
+        quizzes = self.quiz_data['quizzes']
+        language = self.page_language(page, config)
+        page_quizzes = {}  # quiz key -> element ID
+        used_dom_ids = set()
+        quiz_keys = []
+
+        def replace_placeholder(match):
+            quiz_id = match.group(1)
+            if quiz_id not in quizzes:
+                return match.group(0)
+            if quiz_id not in page_quizzes:
+                page_quizzes[quiz_id] = self.quiz_element_id(quiz_id, language)
+                self.quiz_pages.setdefault(quiz_id, set()).add(page.file.src_path)
+                self.quiz_uses[(quiz_id, language)] = self.quiz_uses.get((quiz_id, language), 0) + 1
+            base_dom_id = page_quizzes[quiz_id]
+
+            # A quiz embedded several times on the same page needs distinct element IDs, the other instances are
+            # renamed when the page is written
+            dom_id = base_dom_id
+            instance = 1
+            while dom_id in used_dom_ids:
+                instance += 1
+                dom_id = f"{base_dom_id}_{instance}"
+            used_dom_ids.add(dom_id)
+            quiz_keys.append((quiz_id, language, dom_id))
+            return f"<!-- QUIZ_PLACEHOLDER_{dom_id} -->"
+
+        markdown = QUIZ_ID_PATTERN.sub(replace_placeholder, markdown)
+        if self.profiler is not None:
+            self.profiler.record_page(page.file.src_path, len(quiz_keys))
+        self.console_log("Running on_page_markdown... Replaced %d quiz placeholders", len(quiz_keys))
+        if quiz_keys:
+            # Only the keys of the quizzes are kept with the page, the quizzes are rendered when the page is
+            # written and shared with the other pages using them
+            page.meta['quiz_placeholder'] = quiz_keys
         return markdown
     
+    @profiled
     def on_post_page(self, output_content, page, config):
         """
         Handles the post-render event for a page.
@@ -131,144 +556,349 @@ class QuizPlugin(BasePlugin):
         Returns:
             str: The updated HTML content with quizzes and script/style injections.
         """
-        if 'quiz_placeholder' in page.meta:
-            for placeholder, quiz_html in page.meta['quiz_placeholder']:
-                self.console_log(f"Replacing placeholder: {placeholder} with quiz HTML")
-                output_content = output_content.replace(placeholder, quiz_html)
-        # Inject the JavaScript and CSS into the page
-        script_tag = '<script src="static/quiz.js"></script>'
-        link_tag = '<link rel="stylesheet" href="static/quiz.css">'
-        output_content = output_content.replace('</body>', f'{script_tag}</body>')
-        output_content = output_content.replace('</head>', f'{link_tag}</head>')
+        # Pages without quizzes don't need the assets, leave them untouched
+        if not page.meta.get('quiz_placeholder'):
+            return output_content
+
+        placeholders = self.resolve_placeholders(page)
+        self.console_log("Replacing %d quiz placeholders", len(placeholders))
+        # Inject the JavaScript and CSS into the page, in the same pass as the quizzes
+        head_html, body_html = self.asset_tags(page, config)
+        output_content = inject_html(output_content, placeholders, head_html=head_html, body_html=body_html)
+        self.release_page_quizzes(page)
         return output_content
 
+    def resolve_placeholders(self, page):
+        """
+        Looks up the HTML of the quizzes of a page in the render store, rendering the quizzes not rendered yet. A
+        quiz used by several pages is rendered once, an instance of a quiz embedded several times on a page gets
+        its own element IDs.
+
+        Args:
+            page (Page): The page object, with the quiz keys left by `on_page_markdown`.
+
+        Returns:
+            dict: The HTML of each quiz keyed by its placeholder comment.
+        """
+        placeholders = {}
+        for quiz_id, language, dom_id in page.meta.get('quiz_placeholder', ()):
+            if (quiz_id, language) not in self.rendered_quizzes:
+                self.console_log("Generating HTML for quiz ID: %s, language: %s", quiz_id, language)
+            base_dom_id, quiz_html = self.render_quiz(quiz_id, language)
+            # All the IDs of the quiz are prefixed with its element ID so they are renamed in one go
+            if dom_id != base_dom_id:
+                quiz_html = quiz_html.replace(base_dom_id, dom_id)
+            placeholders[f"<!-- QUIZ_PLACEHOLDER_{dom_id} -->"] = quiz_html
+        return placeholders
+
+    def release_page_quizzes(self, page):
+        """
+        Drops the HTML of the quizzes of a written page from the render store once no other page of the build
+        uses them, so the markup of all the quizzes is not held until the end of the build. The store is kept
+        during `mkdocs serve` for the next rebuild.
+
+        Args:
+            page (Page): The written page.
+        """
+        for key in {(quiz_id, language) for quiz_id, language, _ in page.meta.pop('quiz_placeholder', ())}:
+            uses = self.quiz_uses.get(key, 0) - 1
+            # The key is kept, the quizzes used by the build are the keys of `quiz_uses`
+            self.quiz_uses[key] = max(uses, 0)
+            if uses <= 0 and not self.serving:
+                self.rendered_quizzes.pop(key, None)
+                self.quiz_models.pop(key, None)
+
+    def asset_url(self, url, page, config):
+        """
+        Resolves the URL of a plugin asset for a page, relative to the page URL by default or against `site_url`
+        when `asset_urls` is set to `absolute`.
+
+        Args:
+            url (str): The asset URL relative to the site root.
+            page (Page): The page object.
+            config (Config): The MkDocs configuration object.
+
+        Returns:
+            str: The resolved URL.
+        """
+        site_url = config.get('site_url')
+        if self.config.get('asset_urls', 'relative') == 'absolute' and site_url:
+            return urljoin(site_url if site_url.endswith('/') else f"{site_url}/", url)
+        return get_relative_url(url, page.url)
+
+    def asset_tags(self, page, config):
+        """
+        Builds the tags loading the quiz stylesheet and script on a page.
+
+        Args:
+            page (Page): The page object.
+            config (Config): The MkDocs configuration object.
+
+        Returns:
+            tuple: The HTML to insert in the head and at the end of the body of the page.
+        """
+        js_url = self.asset_url(self.asset_urls['js'], page, config)
+        css_url = self.asset_url(self.asset_urls['css'], page, config)
+        head_html = f'<link rel="stylesheet" href="{css_url}">'
+        if self.config.get('preload_assets', False):
+            head_html = f'<link rel="preload" href="{js_url}" as="script">{head_html}'
+        defer = ' defer' if self.config.get('defer_script', True) else ''
+        body_html = f'<script src="{js_url}"{defer}></script>'
+        return head_html, body_html
+
+    def on_post_build(self, config):
+        """
+        Handles the post-build event, it writes the optimized assets, saves the render cache index and reports
+        its hit/miss counts.
+
+        Args:
+            config (Config): The MkDocs configuration object.
+        """
+        if self.built_assets is not None:
+            written = write_assets(config['site_dir'], self.built_assets)
+            self.console_log("Wrote optimized assets: %s", written)
+        if self.quiz_payloads:
+            self.write_payloads(config['site_dir'])
+        if self.profiler is not None:
+            self.profiler.stop()
+            report_path = self.config.get('profile_report', 'mkdocs_quiz_profile.json')
+            self.profiler.write_report(report_path)
+            log.info("Profile written to %s\n  %s", report_path, '\n  '.join(self.profiler.summary()))
+        if self.quiz_bank is not None and isinstance(self.quiz_bank.quizzes, IndexedQuizzes):
+            self.console_log("Decoded %d of %d quizzes", self.quiz_bank.quizzes.decoded_count, len(self.quiz_bank))
+        if self.render_cache is not None:
+            self.render_cache.save()
+            self.console_log("Render cache: %d hits, %d misses, %d entries (%d bytes)", self.render_cache.hits,
+                             self.render_cache.misses, len(self.render_cache), self.render_cache.size)
+
+        # The quizzes are not needed anymore, the loaded files and the rendered quizzes are only kept for the
+        # next `mkdocs serve` rebuild, or for the builds of the other languages run by the i18n plugin in the
+        # same process
+        self.quiz_data = {'quizzes': {}}
+        if not self.serving and len(self.languages) == 1:
+            self.quiz_bank = None
+            self.quiz_directory = None
+            self.rendered_quizzes = {}
+            self.quiz_models = {}
+            self.quiz_dom_ids = {}
+            self.quiz_payloads = {}
+
+    def render_key(self, quiz, dom_id, language=None):
+        """
+        Returns the render cache key of a quiz.
+
+        Args:
+            quiz (Quiz): The quiz, normalized for its language.
+            dom_id (str): The element ID of the quiz.
+            language (str, optional): The language of the quiz, defaults to the `language` option.
+
+        Returns:
+            str: The key of the quiz HTML in the render cache.
+        """
+        return RenderCache.make_key(quiz, dict(self.render_options(), language=language or self.language,
+                                               dom_id=dom_id))
+
+    def render_options(self):
+        """
+        Returns the plugin options that change the generated quiz HTML, they are part of the render cache key.
+
+        Returns:
+            dict: The rendering options.
+        """
+        return {
+            'language': self.language,
+            'show_refresh_button': self.show_refresh_button,
+            'show_indice_on_answer': self.show_indice_on_answer,
+            'show_score': self.show_score,
+            'show_progress_bar': self.show_progress_bar,
+            'questions_per_page': self.questions_per_page,
+            'render_mode': self.render_mode,
+            'question_types': renderer_signature(),
+        }
+
+    def write_payloads(self, site_dir):
+        """
+        Writes the JSON payloads of the quizzes used by the pages of this build to the site directory, once per
+        quiz whatever the number of pages embedding it.
+
+        Args:
+            site_dir (str): The site directory.
+        """
+        written = 0
+        for key in self.quiz_uses:
+            if key not in self.quiz_payloads:
+                continue
+            payload_url, payload = self.quiz_payloads[key]
+            path = os.path.join(site_dir, *payload_url.split('/'))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as file:
+                file.write(payload)
+            written += 1
+        if written:
+            self.console_log("Wrote %d quiz payloads", written)
+
+    def quiz_attributes(self, dom_id):
+        """
+        Builds the attributes of the quiz container, they carry the display options to `quiz.js`.
+
+        Args:
+            dom_id (str): The element ID of the quiz.
+
+        Returns:
+            str: The attributes of the quiz `<div>`.
+        """
+        show_refresh_button = 'true' if self.show_refresh_button else 'false'
+        show_indice_on_answer = 'true' if self.show_indice_on_answer else 'false'
+        show_score = 'true' if self.show_score else 'false'
+        show_progress_bar = 'true' if self.show_progress_bar else 'false'
+        attributes = f"class='quiz' id='quiz-{dom_id}' data-show-refresh-button='{show_refresh_button}' data-show-indice-on-answer='{show_indice_on_answer}' data-show-score='{show_score}' data-show-progress-bar='{show_progress_bar}' data-score='0'"
+        if self.questions_per_page:
+            attributes += f" data-questions-per-page='{self.questions_per_page}'"
+        return attributes
+
+    def generate_placeholder_html(self, dom_id, payload_url, sample=0):
+        """
+        Generates the empty quiz container used in `payload` render mode and for sampled quizzes, `quiz.js` fetches
+        the payload and renders the quiz when it gets close to the viewport.
+
+        Args:
+            dom_id (str): The element ID of the quiz.
+            payload_url (str): The URL of the quiz payload, relative to the site root.
+            sample (int): The number of questions drawn at random from the payload, 0 to show all of them.
+
+        Returns:
+            str: The generated HTML for the placeholder.
+        """
+        sample_attribute = f" data-sample='{sample}'" if sample else ''
+        return f"<div {self.quiz_attributes(dom_id)} data-quiz-src='{payload_url}'{sample_attribute}></div>"
+
     def generate_media_html(self, media):
         """
         Generates the HTML for media elements (images, videos, or audio) in quiz questions.
 
         Args:
-            media (dict): A dictionary containing media information. Should contain the keys 'type' and 'src' (and optionally 'alt').
+            media (Media): The media of a normalized question.
 
         Returns:
             str: The generated HTML for the media.
         """
-        self.console_log(f"Generating media HTML for media type: {media['type']}")
-        if media['type'] == 'image':
-            return f"<img src='{media['src']}' alt='{media['alt'][self.language]}' class='media-content mb-4'>"
-        elif media['type'] == 'video':
-            return f"<video controls class='media-content mb-4'><source src='{media['src']}' type='video/mp4'>Your browser does not support the video tag.</video>"
-        elif media['type'] == 'audio':
-            return f"<audio controls class='media-content mb-4'><source src='{media['src']}' type='audio/mpeg'>Your browser does not support the audio element.</audio>"
-        return ''
+        render = MEDIA.get(media.type)
+        return render(media) if render else ''
+
+    def quiz_dom_id(self, quiz_key, quiz):
+        """
+        Builds the stable element ID of a quiz from its key and a hash of its content, so unchanged quizzes
+        keep the same IDs from one build to the next.
+
+        Args:
+            quiz_key (str): The quiz key in the quiz file, or None if unknown.
+            quiz (Quiz): The quiz, normalized for the configured language. Hashing it is much cheaper than hashing
+                the raw quiz with all its languages.
+
+        Returns:
+            str: The element ID, it only contains word characters.
+        """
+        return f"{quiz_key or 'quiz'}_{content_hash(quiz)[:8]}"
+
+    @profiled
+    def generate_quiz_html(self, quiz, quiz_key=None, dom_id=None, language=None):
+        """
+        Returns the HTML for a quiz, from the render cache when it is enabled and the quiz was already rendered
+        with the same options.
+
+        Args:
+            quiz (dict or Quiz): The quiz data, or the quiz already normalized for its language.
+            quiz_key (str, optional): The quiz key in the quiz file, used to build the element IDs.
+            dom_id (str, optional): The element ID of the quiz, defaults to `quiz_dom_id(quiz_key, quiz)`.
+            language (str, optional): The language of the quiz, defaults to the `language` option.
 
-    def generate_quiz_html(self, quiz):
+        Returns:
+            str: The generated HTML for the quiz.
+        """
+        language = language or self.language
+        if not isinstance(quiz, Quiz):
+            quiz = normalize_quiz(quiz, language)
+        if dom_id is None:
+            dom_id = self.quiz_dom_id(quiz_key, quiz)
+        if self.render_cache is None:
+            return self.build_quiz_html(quiz, dom_id)
+
+        key = self.render_key(quiz, dom_id, language)
+        quiz_html = self.render_cache.get(key)
+        if quiz_html is None:
+            quiz_html = self.build_quiz_html(quiz, dom_id)
+            self.render_cache.set(key, quiz_html)
+        return quiz_html
+
+    def build_quiz_html(self, quiz, dom_id):
         """
         This method builds the entire HTML structure for the quiz, including questions, options, media, and
         additional features like refresh buttons and progress bars.
 
         Args:
-            quiz (dict): The quiz data. Should contain a list of questions and other quiz-related metadata.
+            quiz (Quiz): The quiz, normalized for the configured language.
+            dom_id (str): The element ID of the quiz, question IDs are derived from it and the question index.
 
         Returns:
             str: The generated HTML for the quiz.
         """
-        quiz_id = uuid.uuid4().hex
-        questions = quiz.get('questions', [])
-        self.console_log(f"Generating quiz HTML for quiz ID: {quiz_id}, total questions: {len(questions)}")
-        show_refresh_button = 'true' if self.show_refresh_button else 'false'
-        show_indice_on_answer = 'true' if self.show_indice_on_answer else 'false'
-        show_score = 'true' if self.show_score else 'false'
-        show_progress_bar = 'true' if self.show_progress_bar else 'false'
-        quiz_html = f"<div class='quiz' id='quiz-{quiz_id}' data-show-refresh-button='{show_refresh_button}' data-show-indice-on-answer='{show_indice_on_answer}' data-show-score='{show_score}' data-show-progress-bar='{show_progress_bar}' data-score='0'>"
+        quiz_html = ''.join(self.iter_quiz_html(quiz, dom_id))
+        self.console_log("Generated HTML for quiz ID: %s", dom_id)
+        return quiz_html
+
+    def iter_quiz_html(self, quiz, dom_id):
+        """
+        Generates the HTML of a quiz in chunks, so it can be joined once or written to a stream without building
+        intermediate strings, the memory and time used grow linearly with the number of questions.
+
+        Args:
+            quiz (Quiz): The quiz, normalized for the configured language.
+            dom_id (str): The element ID of the quiz, question IDs are derived from it and the question index.
+
+        Yields:
+            str: The successive chunks of the quiz HTML.
+        """
+        quiz_id = dom_id
+        questions = quiz.questions
+        self.console_log("Generating quiz HTML for quiz ID: %s, total questions: %d", quiz_id, len(questions))
+        show_indice = self.show_indice_on_answer
+        per_page = self.questions_per_page
+        paginated = 0 < per_page < len(questions)
+        yield QUIZ_OPEN(self.quiz_attributes(quiz_id))
 
         # Add progress bar if enabled
         if self.show_progress_bar:
-            quiz_html += """
-            <div class="progress-bar-container">
-                <div class="progress-bar" style="width: 0%;"></div>
-            </div>
-            """
-
-        for question in questions:
-            question_id = uuid.uuid4().hex
-            question_text = question['question'].get(self.language, question['question']['en'])
-            media = question.get('media', None)
-            quiz_type = question.get('type', 'multiple-choice')
-            self.console_log(f"Processing question ID: {question_id}, Type: {quiz_type}, Text: {question_text}")
-            quiz_html += f"<div class='question p-4 border border-gray-200 rounded-lg shadow-md mb-6' id='question-{question_id}' data-quiz-id='{quiz_id}' data-question-id='{question_id}' data-quiz-type='{quiz_type}'>"
-
-            if media:
-                quiz_html += self.generate_media_html(media)
-
-            quiz_html += f"<p class='font-bold text-lg mb-4'>{question_text}"
-            if self.show_indice_on_answer:
-                quiz_html += f""" <button class='hint-button' data-indice='{question.get("indice", {}).get(self.language, question.get("indice", {}).get("en", ""))}'><i class='fa fa-lightbulb-o'></i></button>"""
-            quiz_html += f"</p>"
-
-            if quiz_type in ['multiple-choice', 'true-false']:
-                options = question.get('options', [])
-                quiz_html += f"<ul class='list-none p-0'>"
-                self.console_log(f"Multiple choice/true-false options: {options}")
-                for i, option in enumerate(options):
-                    text = option['text'].get(self.language, option['text']['en'])
-                    indice = option.get('indice', {}).get(self.language, option.get('indice', {}).get('en', ''))
-                    correct = 'correct' if option['correct'] else 'incorrect'
-                    quiz_html += f"""
-                        <li class='{correct} p-2 mb-2 border border-gray-200 rounded-lg cursor-pointer hover:bg-gray-100' data-quiz-id='{quiz_id}' data-question-id='{question_id}' data-option-id='{i}' data-indice='{indice}'>
-                            {text}
-                        </li>
-                    """
-                quiz_html += "</ul>"
-                if self.show_indice_on_answer:
-                    quiz_html += f"<div class='indice mt-4 p-3 border border-yellow-300 bg-yellow-100 text-yellow-700 rounded-lg hidden' id='indice-{question_id}'></div>"
-                quiz_html += f"<div class='feedback mt-4 p-3 rounded-lg hidden' id='feedback-{question_id}'></div>"
-            
-            elif quiz_type == 'fill-in-the-blank':
-                self.console_log("Processing fill-in-the-blank question...")
-                answer = question['answer'].get(self.language, question['answer']['en']).strip().lower()
-                self.console_log(f"Fill-in-the-blank question with answer: {answer}")
-                indice = question.get('indice', {}).get(self.language, question.get('indice', {}).get('en', ''))
-                self.console_log(f"Indice for fill-in-the-blank: {indice}")
-                
-                quiz_html += f"""
-                    <input type='text' class='answer-input p-2 mb-2 border border-gray-200 rounded-lg' id='answer-{question_id}' data-answer='{answer}'>
-                    <button class='submit-answer bg-blue-500 text-white p-2 rounded-lg' data-question-id='{question_id}'>Submit</button>
-                
-                """
-                if self.show_indice_on_answer and indice:
-                    self.console_log(f"Showing indice for fill-in-the-blank question ID: {question_id}")
-                    quiz_html += f"""
-                    <div class='indice mt-4 p-3 border border-yellow-300 bg-yellow-100 text-yellow-700 rounded-lg hidden' id='indice-{question_id}'>{indice}</div>
-                    """
-                quiz_html += f"<div class='feedback mt-4 p-3 rounded-lg hidden' id='feedback-{question_id}'></div>"
-                self.console_log(f"Generated HTML for fill-in-the-blank question ID: {question_id}")
-                    
-            elif quiz_type == 'multi-choice':
-                options = question.get('options', [])
-                quiz_html += f"<ul class='list-none p-0'>"
-                for i, option in enumerate(options):
-                    text = option['text'].get(self.language, option['text']['en'])
-                    indice = option.get('indice', {}).get(self.language, option.get('indice', {}).get('en', ''))
-                    correct = 'correct' if option['correct'] else 'incorrect'
-                    quiz_html += f"""
-                        <li class='{correct} p-2 mb-2 border border-gray-200 rounded-lg cursor-pointer hover:bg-gray-100' data-quiz-id='{quiz_id}' data-question-id='{question_id}' data-option-id='{i}' data-indice='{indice}'>
-                            <input type="checkbox" class="multi-choice-checkbox" data-option-id="{i}"> <span>{text}</span>
-                        </li>
-                    """
-                quiz_html += "</ul>"
-                if self.show_indice_on_answer:
-                    quiz_html += f"<div class='indice mt-4 p-3 border border-yellow-300 bg-yellow-100 text-yellow-700 rounded-lg hidden' id='indice-{question_id}'></div>"
-                quiz_html += f"<div class='feedback mt-4 p-3 rounded-lg hidden' id='feedback-{question_id}'></div>"
-                quiz_html += f"<button class='submit-multi-choice bg-blue-500 text-white p-2 rounded-lg' data-quiz-id='{quiz_id}' data-question-id='{question_id}'>Submit</button>"
-
-            quiz_html += "</div>"
+            yield PROGRESS_BAR
+
+        for index, question in enumerate(questions):
+            # Only the first page is laid out, the next ones are templates until `quiz.js` shows them
+            if paginated and index % per_page == 0:
+                if index == 0:
+                    yield PAGE_OPEN
+                else:
+                    yield PAGE_CLOSE if index == per_page else PAGE_TEMPLATE_CLOSE
+                    yield PAGE_TEMPLATE_OPEN(index // per_page)
+            question_id = f"{quiz_id}_{index}"
+            yield QUESTION_OPEN(quiz_id, question_id, question.type)
+            if question.media:
+                yield self.generate_media_html(question.media)
+            yield QUESTION_TEXT(question.text)
+            if show_indice:
+                yield HINT_BUTTON(question.hint)
+            yield QUESTION_TEXT_CLOSE
+            renderer = RENDERERS.get(question.type)
+            if renderer is not None:
+                yield renderer.render(question, quiz_id, question_id, show_indice)
+            yield QUESTION_CLOSE
+
+        if paginated:
+            yield PAGE_TEMPLATE_CLOSE
+            yield PAGINATION(-(-len(questions) // per_page))
 
         if self.show_refresh_button:
-            quiz_html += "<button class='refresh-quiz bg-blue-500 text-white p-2 rounded-lg mt-4'>Refresh</button>"
-        
+            yield REFRESH_BUTTON
+
         if self.show_score:
-            quiz_html += "<div class='score mt-4 text-lg font-bold hidden'>Score: 0</div>"
-        
-        quiz_html += "</div>"
-        self.console_log(f"Generated HTML for quiz ID: {quiz_id}")
-        return quiz_html
+            yield SCORE
+
+        yield QUIZ_CLOSE
@@ -0,0 +1,87 @@
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+from .renderers import BUILTIN_RENDERERS, RENDERER_VERSIONS, RENDERERS, register_renderer
+
+# Plugin rendering the quizzes in a worker process, created once per worker by `_init_worker`
+_worker_plugin = None
+
+
+def pool_renderers():
+    """
+    Collects the renderers registered in place of or in addition to the built-in ones, to register them again in the
+    worker processes: a worker that is not forked, as on Windows and macOS, only gets the renderers of the entry
+    points and would miss the ones registered with `register_renderer` in this process.
+
+    Returns:
+        tuple: Question type -> (renderer, version) of the renderers sent to the workers, and the set of question
+            types whose renderer cannot be pickled, the quizzes using them are not pre-rendered.
+    """
+    renderers, unsent = {}, set()
+    for question_type, renderer in RENDERERS.items():
+        if renderer is BUILTIN_RENDERERS.get(question_type):
+            continue
+        try:
+            pickle.dumps(renderer)
+        except Exception:
+            # For example an instance of a class defined in a function
+            unsent.add(question_type)
+            continue
+        renderers[question_type] = (renderer, RENDERER_VERSIONS.get(question_type))
+    return renderers, unsent
+
+
+def _init_worker(options, renderers):
+    """
+    Sets up the plugin of a worker process with the rendering options of the build, it does not load any quiz,
+    the normalized quizzes are sent with the work.
+
+    Args:
+        options (dict): The rendering options, see `QuizPlugin.render_options`.
+        renderers (dict): The renderers registered in the build process, see `pool_renderers`.
+    """
+    global _worker_plugin
+    from .plugin import QuizPlugin
+    plugin = QuizPlugin()
+    plugin.config = dict(options, quiz_file='', quiz_dir='', cache=False, profile=False)
+    plugin.on_config({})
+    for question_type, (renderer, version) in renderers.items():
+        register_renderer(question_type, renderer, version)
+    _worker_plugin = plugin
+
+
+def _render_batch(batch):
+    """
+    Renders a batch of quizzes in a worker process.
+
+    Args:
+        batch (list): (quiz key, normalized quiz, element ID) of each quiz.
+
+    Returns:
+        list: (quiz key, HTML) of each quiz.
+    """
+    return [(quiz_id, _worker_plugin.build_quiz_html(model, dom_id)) for quiz_id, model, dom_id in batch]
+
+
+def render_in_pool(jobs, options, max_workers=None, renderers=None):
+    """
+    Renders quizzes in a pool of processes, the quizzes are split in a few batches per worker so a large quiz does
+    not keep the other workers waiting and each batch is worth the cost of sending it.
+
+    Args:
+        jobs (list): (quiz key, normalized quiz, element ID) of each quiz to render.
+        options (dict): The rendering options, see `QuizPlugin.render_options`.
+        max_workers (int, optional): The number of worker processes, defaults to the number of CPUs.
+        renderers (dict, optional): The renderers to register in the workers, see `pool_renderers`.
+
+    Yields:
+        tuple: The quiz key and the HTML of each quiz, as the batches complete.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    batch_count = max_workers * 4
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                             initargs=(options, renderers or {})) as executor:
+        batches = [jobs[index::batch_count] for index in range(min(batch_count, len(jobs)))]
+        for rendered in executor.map(_render_batch, batches):
+            yield from rendered
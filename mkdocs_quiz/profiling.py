@@ -0,0 +1,144 @@
+import functools
+import json
+import os
+import time
+import tracemalloc
+
+
+def profiled(method):
+    """
+    Decorates a plugin method so its wall time and call count are recorded when the `profile` option is enabled.
+    The time spent in hooks receiving a page is also attributed to that page.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self.config.get('profile', False):
+            return method(self, *args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            # `on_config` creates the profiler, it only exists once the first call returns
+            if self.profiler is not None:
+                page = kwargs.get('page', args[1] if len(args) > 1 else None)
+                self.profiler.record_call(name, elapsed, getattr(getattr(page, 'file', None), 'src_path', None))
+
+    return wrapper
+
+
+class Profiler:
+    """
+    Collects the build-time measurements of the quiz plugin: wall time and call count of its hooks, time and
+    quiz count of each page, size of each rendered quiz and tracemalloc peak memory.
+    """
+
+    def __init__(self):
+        self.start_time = time.perf_counter()
+        self.hooks = {}  # hook name -> {'calls': int, 'time': float}
+        self.pages = {}  # page source path -> {'quizzes': int, 'time': float}
+        self.quizzes = {}  # quiz key -> {'renders': int, 'bytes': int}
+        self.peak_memory = None
+        self._owns_tracemalloc = not tracemalloc.is_tracing()
+        if self._owns_tracemalloc:
+            tracemalloc.start()
+
+    def record_call(self, name, elapsed, page=None):
+        """
+        Records one call of a hook.
+
+        Args:
+            name (str): The name of the hook.
+            elapsed (float): The wall time of the call, in seconds.
+            page (str, optional): The source path of the page the hook was called for.
+        """
+        hook = self.hooks.setdefault(name, {'calls': 0, 'time': 0.0})
+        hook['calls'] += 1
+        hook['time'] += elapsed
+        if page is not None:
+            self.pages.setdefault(page, {'quizzes': 0, 'time': 0.0})['time'] += elapsed
+
+    def record_page(self, page, quiz_count):
+        """
+        Records the number of quizzes of a page.
+
+        Args:
+            page (str): The source path of the page.
+            quiz_count (int): The number of quiz placeholders replaced on the page.
+        """
+        self.pages.setdefault(page, {'quizzes': 0, 'time': 0.0})['quizzes'] = quiz_count
+
+    def record_quiz(self, quiz_key, emitted_bytes):
+        """
+        Records the size of the HTML, or of the payload in `payload` render mode, emitted for a quiz.
+
+        Args:
+            quiz_key (str): The quiz key in the quiz file.
+            emitted_bytes (int): The size of the emitted HTML or payload, in bytes.
+        """
+        quiz = self.quizzes.setdefault(quiz_key, {'renders': 0, 'bytes': 0})
+        quiz['renders'] += 1
+        quiz['bytes'] = emitted_bytes
+
+    def stop(self):
+        """
+        Stops the memory tracing and records the peak memory of the build.
+        """
+        if tracemalloc.is_tracing():
+            self.peak_memory = tracemalloc.get_traced_memory()[1]
+            if self._owns_tracemalloc:
+                tracemalloc.stop()
+
+    def report(self):
+        """
+        Returns:
+            dict: The collected measurements, ready to be serialized as JSON.
+        """
+        return {
+            'total_time': time.perf_counter() - self.start_time,
+            'peak_memory': self.peak_memory,
+            'hooks': self.hooks,
+            'pages': self.pages,
+            'quizzes': self.quizzes,
+        }
+
+    def write_report(self, path):
+        """
+        Writes the JSON report.
+
+        Args:
+            path (str): The path of the report file.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.report(), file, indent=2, sort_keys=True)
+
+    def summary(self, limit=5):
+        """
+        Builds a short human readable summary of the report.
+
+        Args:
+            limit (int): The number of slowest pages and largest quizzes listed.
+
+        Returns:
+            list: The lines of the summary.
+        """
+        lines = []
+        for name, hook in sorted(self.hooks.items()):
+            lines.append(f"{name}: {hook['calls']} calls, {hook['time'] * 1000:.1f} ms")
+        if self.peak_memory is not None:
+            lines.append(f"Peak traced memory: {self.peak_memory / 1024 / 1024:.1f} MB")
+        slowest_pages = sorted(self.pages.items(), key=lambda item: item[1]['time'], reverse=True)[:limit]
+        if slowest_pages:
+            lines.append("Slowest pages:")
+            lines.extend(f"  {page}: {stats['time'] * 1000:.1f} ms, {stats['quizzes']} quizzes"
+                         for page, stats in slowest_pages)
+        largest_quizzes = sorted(self.quizzes.items(), key=lambda item: item[1]['bytes'], reverse=True)[:limit]
+        if largest_quizzes:
+            lines.append("Largest quizzes:")
+            lines.extend(f"  {quiz_key}: {stats['bytes']} bytes" for quiz_key, stats in largest_quizzes)
+        return lines
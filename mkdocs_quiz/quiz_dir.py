@@ -0,0 +1,121 @@
+import json
+import logging
+import os
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+
+from .bank import gc_paused
+from .cache import content_hash
+
+log = logging.getLogger('mkdocs.plugins.mkdocs_quiz')
+
+
+class QuizDirectory(Mapping):
+    """
+    Quizzes stored in a directory of JSON files, as a read-only mapping of quiz keys to quizzes.
+
+    A file either holds one quiz, `{"questions": [...]}`, named after the file, `capitals.json` for the
+    `capitals` quiz, or a section of quizzes in the format of the quiz file, `{"quizzes": {...}}`. Files are
+    found recursively. When `load` is called again, only the files whose size or modification time changed are
+    read again.
+    """
+
+    def __init__(self, path, max_workers=None):
+        """
+        Args:
+            path (str): The directory of the quiz files.
+            max_workers (int, optional): The number of threads reading the files.
+        """
+        self.path = path
+        self.max_workers = max_workers
+        self.reloaded = 0
+        self._files = {}  # file path -> (size, mtime, quizzes, digests)
+        self._quizzes = {}
+        self._digests = {}
+
+    def __getitem__(self, quiz_key):
+        return self._quizzes[quiz_key]
+
+    def __iter__(self):
+        return iter(self._quizzes)
+
+    def __len__(self):
+        return len(self._quizzes)
+
+    def digests(self):
+        """
+        Returns:
+            dict: Quiz key -> content hash of the quiz, computed when its file was read.
+        """
+        return self._digests
+
+    def scan(self):
+        """
+        Lists the quiz files of the directory, each directory is listed once.
+
+        Returns:
+            dict: File path -> (size, modification time) of every JSON file.
+        """
+        found = {}
+        directories = [self.path]
+        while directories:
+            with os.scandir(directories.pop()) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.'):
+                        continue
+                    if entry.is_dir():
+                        directories.append(entry.path)
+                    elif entry.name.endswith('.json') and entry.is_file():
+                        stat = entry.stat()
+                        found[entry.path] = (stat.st_size, stat.st_mtime_ns)
+        return found
+
+    def load(self):
+        """
+        Reads the new and changed quiz files in parallel and forgets the removed ones. Invalid files are reported
+        and skipped.
+
+        Returns:
+            QuizDirectory: The directory itself, holding the quizzes of all the files.
+        """
+        found = self.scan() if os.path.isdir(self.path) else {}
+        changed = [path for path, signature in found.items() if self._files.get(path, (None, None))[:2] != signature]
+        for path in self._files.keys() - found.keys():
+            del self._files[path]
+        if changed:
+            # The collector is paused around the whole pool, pausing it per thread would race
+            with ThreadPoolExecutor(self.max_workers) as pool, gc_paused():
+                for path, quizzes in zip(changed, pool.map(self._read_file, changed)):
+                    if quizzes is None:
+                        self._files.pop(path, None)
+                    else:
+                        digests = {quiz_key: content_hash(quiz) for quiz_key, quiz in quizzes.items()}
+                        self._files[path] = found[path] + (quizzes, digests)
+        self.reloaded = len(changed)
+
+        self._quizzes = {}
+        self._digests = {}
+        sources = {}
+        for path in sorted(self._files):
+            _, _, quizzes, digests = self._files[path]
+            for quiz_key in quizzes.keys() & sources.keys():
+                log.warning("Quiz %s is defined in %s and %s, the latter is used", quiz_key, sources[quiz_key], path)
+            sources.update(dict.fromkeys(quizzes, path))
+            self._quizzes.update(quizzes)
+            self._digests.update(digests)
+        return self
+
+    @staticmethod
+    def _read_file(path):
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError) as e:
+            log.warning("Cannot load quiz file %s: %s", path, e)
+            return None
+        if isinstance(data, dict) and isinstance(data.get('quizzes'), dict):
+            return data['quizzes']
+        if isinstance(data, dict) and 'questions' in data:
+            return {os.path.splitext(os.path.basename(path))[0]: data}
+        log.warning("Quiz file %s has neither a quizzes nor a questions key", path)
+        return None
@@ -0,0 +1,241 @@
+import logging
+import sys
+
+from .model import BUILTIN_TYPES
+
+log = logging.getLogger('mkdocs.plugins.mkdocs_quiz')
+
+# Entry point group third-party packages register question types in, the entry point name is the question type
+# and its value a QuestionRenderer subclass
+ENTRY_POINT_GROUP = 'mkdocs_quiz.question_types'
+
+
+# Templates of the quiz HTML, the ones with placeholders are functions of the values to insert
+QUIZ_OPEN = lambda attributes: f"<div {attributes}>"
+PROGRESS_BAR = """
+            <div class="progress-bar-container">
+                <div class="progress-bar" style="width: 0%;"></div>
+            </div>
+            """
+QUESTION_OPEN = lambda quiz_id, question_id, quiz_type: (
+    f"<div class='question p-4 border border-gray-200 rounded-lg shadow-md mb-6' id='question-{question_id}' "
+    f"data-quiz-id='{quiz_id}' data-question-id='{question_id}' data-quiz-type='{quiz_type}'>")
+IMAGE = lambda src, alt: f"<img src='{src}' alt='{alt}' class='media-content mb-4'>"
+VIDEO = lambda src: (
+    f"<video controls class='media-content mb-4'><source src='{src}' type='video/mp4'>"
+    "Your browser does not support the video tag.</video>")
+AUDIO = lambda src: (
+    f"<audio controls class='media-content mb-4'><source src='{src}' type='audio/mpeg'>"
+    "Your browser does not support the audio element.</audio>")
+QUESTION_TEXT = lambda text: f"<p class='font-bold text-lg mb-4'>{text}"
+HINT_BUTTON = lambda hint: (
+    f" <button class='hint-button' data-indice='{hint}'><i class='fa fa-lightbulb-o'></i></button>")
+QUESTION_TEXT_CLOSE = "</p>"
+QUESTION_CLOSE = "</div>"
+# Pages of a paginated quiz, the first one is shown and the next ones stay inert in `<template>` elements until
+# `quiz.js` reaches them
+PAGE_OPEN = "<div class='quiz-page' data-page='0'>"
+PAGE_CLOSE = "</div>"
+PAGE_TEMPLATE_OPEN = lambda page: f"<template class='quiz-page' data-page='{page}'>"
+PAGE_TEMPLATE_CLOSE = "</template>"
+PAGINATION = lambda pages: (
+    "<div class='quiz-pagination flex items-center justify-between mt-4'>"
+    "<button class='quiz-previous bg-blue-500 text-white p-2 rounded-lg' disabled>Previous</button>"
+    f"<span class='quiz-page-number'>1 / {pages}</span>"
+    "<button class='quiz-next bg-blue-500 text-white p-2 rounded-lg'>Next</button></div>")
+REFRESH_BUTTON = "<button class='refresh-quiz bg-blue-500 text-white p-2 rounded-lg mt-4'>Refresh</button>"
+SCORE = "<div class='score mt-4 text-lg font-bold hidden'>Score: 0</div>"
+QUIZ_CLOSE = "</div>"
+
+OPTIONS_OPEN = "<ul class='list-none p-0'>"
+OPTIONS_CLOSE = "</ul>"
+OPTION = lambda quiz_id, question_id, index, correct, indice, text: f"""
+                        <li class='{correct} p-2 mb-2 border border-gray-200 rounded-lg cursor-pointer hover:bg-gray-100' data-quiz-id='{quiz_id}' data-question-id='{question_id}' data-option-id='{index}' data-indice='{indice}'>
+                            {text}
+                        </li>
+                    """
+CHECKBOX_OPTION = lambda quiz_id, question_id, index, correct, indice, text: f"""
+                        <li class='{correct} p-2 mb-2 border border-gray-200 rounded-lg cursor-pointer hover:bg-gray-100' data-quiz-id='{quiz_id}' data-question-id='{question_id}' data-option-id='{index}' data-indice='{indice}'>
+                            <input type="checkbox" class="multi-choice-checkbox" data-option-id="{index}"> <span>{text}</span>
+                        </li>
+                    """
+INDICE = lambda question_id: (
+    "<div class='indice mt-4 p-3 border border-yellow-300 bg-yellow-100 text-yellow-700 rounded-lg hidden' "
+    f"id='indice-{question_id}'></div>")
+FEEDBACK = lambda question_id: (
+    f"<div class='feedback mt-4 p-3 rounded-lg hidden' id='feedback-{question_id}'></div>")
+ANSWER_INPUT = lambda question_id, answer: f"""
+                    <input type='text' class='answer-input p-2 mb-2 border border-gray-200 rounded-lg' id='answer-{question_id}' data-answer='{answer}'>
+                    <button class='submit-answer bg-blue-500 text-white p-2 rounded-lg' data-question-id='{question_id}'>Submit</button>
+                
+                """
+ANSWER_HINT = lambda question_id, hint: f"""
+                    <div class='indice mt-4 p-3 border border-yellow-300 bg-yellow-100 text-yellow-700 rounded-lg hidden' id='indice-{question_id}'>{hint}</div>
+                    """
+SUBMIT_MULTI_CHOICE = lambda quiz_id, question_id: (
+    f"<button class='submit-multi-choice bg-blue-500 text-white p-2 rounded-lg' data-quiz-id='{quiz_id}' "
+    f"data-question-id='{question_id}'>Submit</button>")
+
+MEDIA = {
+    'image': lambda media: IMAGE(media.src, media.alt),
+    'video': lambda media: VIDEO(media.src),
+    'audio': lambda media: AUDIO(media.src),
+}
+
+
+class QuestionRenderer:
+    """
+    Renders the answer part of the questions of one type, between the question text and the end of the question.
+    Third-party packages add question types by subclassing it and registering the subclass in the
+    `mkdocs_quiz.question_types` entry point group, under the name of the type.
+    """
+
+    def render(self, question, quiz_id, question_id, show_indice):
+        """
+        Args:
+            question (Question): The normalized question. Questions of types not built in the plugin have the
+                options of multiple-choice ones and their other fields in `extra`, localized when they hold
+                translations.
+            quiz_id (str): The element ID of the quiz.
+            question_id (str): The element ID of the question.
+            show_indice (bool): Whether hints are shown, the `show_indice_on_answer` option.
+
+        Returns:
+            str: The HTML of the answer part of the question.
+        """
+        raise NotImplementedError
+
+
+class ChoiceRenderer(QuestionRenderer):
+    """
+    Multiple-choice and true/false questions, a single option is selected.
+    """
+    option = staticmethod(OPTION)
+
+    def render(self, question, quiz_id, question_id, show_indice):
+        option = self.option
+        parts = [OPTIONS_OPEN]
+        parts.extend(option(quiz_id, question_id, index, 'correct' if choice.correct else 'incorrect', choice.indice,
+                            choice.text) for index, choice in enumerate(question.options))
+        parts.append(OPTIONS_CLOSE)
+        if show_indice:
+            parts.append(INDICE(question_id))
+        parts.append(FEEDBACK(question_id))
+        return ''.join(parts)
+
+
+class MultiChoiceRenderer(ChoiceRenderer):
+    """
+    Questions with several correct options, selected with checkboxes and submitted with a button.
+    """
+    option = staticmethod(CHECKBOX_OPTION)
+
+    def render(self, question, quiz_id, question_id, show_indice):
+        return super().render(question, quiz_id, question_id, show_indice) + SUBMIT_MULTI_CHOICE(quiz_id, question_id)
+
+
+class FillInTheBlankRenderer(QuestionRenderer):
+    """
+    Questions answered by typing a word.
+    """
+
+    def render(self, question, quiz_id, question_id, show_indice):
+        html = ANSWER_INPUT(question_id, question.answer)
+        if show_indice and question.hint:
+            html += ANSWER_HINT(question_id, question.hint)
+        return html + FEEDBACK(question_id)
+
+
+RENDERERS = {
+    'multiple-choice': ChoiceRenderer(),
+    'true-false': ChoiceRenderer(),
+    'multi-choice': MultiChoiceRenderer(),
+    'fill-in-the-blank': FillInTheBlankRenderer(),
+}
+BUILTIN_RENDERERS = dict(RENDERERS)
+# Question type -> version of the package providing its renderer, when known
+RENDERER_VERSIONS = {}
+
+_entry_points_loaded = False
+
+
+def register_renderer(question_type, renderer, version=None):
+    """
+    Registers the renderer of a question type, replacing the current one.
+
+    Args:
+        question_type (str): The `type` of the questions in the quiz file.
+        renderer (QuestionRenderer): The renderer.
+        version (str, optional): The version of the package providing the renderer, rendered quizzes are cached
+            per version. The `__version__` of the module of the renderer is used by default.
+    """
+    RENDERERS[question_type] = renderer
+    if version is None:
+        version = getattr(sys.modules.get(type(renderer).__module__), '__version__', None)
+    RENDERER_VERSIONS[question_type] = version
+
+
+def renderer_signature():
+    """
+    Describes the renderers registered in place of or in addition to the built-in ones, it is part of the render
+    cache key so installing or upgrading a package of question types renders the quizzes again.
+
+    Returns:
+        list: A [question type, renderer class, version] entry per registered renderer, sorted by type.
+    """
+    return [[question_type, f"{type(renderer).__module__}.{type(renderer).__qualname__}",
+             RENDERER_VERSIONS.get(question_type)]
+            for question_type, renderer in sorted(RENDERERS.items())
+            if renderer is not BUILTIN_RENDERERS.get(question_type)]
+
+
+def _iter_entry_points(group):
+    """
+    Returns the entry points of a group. `importlib.metadata` is only available from Python 3.8, its
+    `importlib_metadata` backport or `pkg_resources` are used on older versions.
+
+    Args:
+        group (str): The entry point group.
+
+    Returns:
+        Iterable: The entry points, with a `name` and a `load` method.
+    """
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        try:
+            from importlib_metadata import entry_points
+        except ImportError:
+            import pkg_resources
+            return list(pkg_resources.iter_entry_points(group))
+    found = entry_points()
+    return found.select(group=group) if hasattr(found, 'select') else found.get(group, ())
+
+
+def _entry_point_target(entry_point):
+    # `pkg_resources` entry points have no `value`
+    value = getattr(entry_point, 'value', None)
+    return value if value is not None else f"{entry_point.module_name}:{'.'.join(entry_point.attrs)}"
+
+
+def load_entry_points():
+    """
+    Registers the question types of the `mkdocs_quiz.question_types` entry point group, once per process.
+    Built-in types cannot be replaced through entry points, a broken entry point is reported and skipped.
+    """
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+    for entry_point in _iter_entry_points(ENTRY_POINT_GROUP):
+        if entry_point.name in BUILTIN_TYPES:
+            log.warning("Question type %s of %s is built in, it is not replaced", entry_point.name,
+                        _entry_point_target(entry_point))
+            continue
+        try:
+            renderer = entry_point.load()
+            register_renderer(entry_point.name, renderer() if isinstance(renderer, type) else renderer,
+                              getattr(getattr(entry_point, 'dist', None), 'version', None))
+        except Exception as e:
+            log.warning("Cannot load question type %s from %s: %s", entry_point.name,
+                        _entry_point_target(entry_point), e)
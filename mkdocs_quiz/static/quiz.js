@@ -1,60 +1,497 @@
-document.addEventListener("DOMContentLoaded", function () {
-    const quizzes = document.querySelectorAll('.quiz');
-
-    quizzes.forEach(quiz => {
-        const questions = quiz.querySelectorAll('.question');
-
-        questions.forEach(question => {
-            const quizType = question.getAttribute('data-quiz-type');
-            const feedbackDiv = question.querySelector('.feedback');
-
-            if (quizType === 'multiple-choice' || quizType === 'true-false') {
-                const options = question.querySelectorAll('li');
-                const indiceDiv = question.querySelector('.indice');
-
-                options.forEach(option => {
-                    option.addEventListener('click', () => {
-                        option.parentElement.querySelectorAll('li').forEach(li => li.classList.remove('selected', 'font-bold', 'border-blue-500', 'bg-blue-100'));
-                        option.classList.add('selected', 'font-bold', 'border-blue-500', 'bg-blue-100');
-
-                        // Show feedback and indice for incorrect answers
-                        if (option.classList.contains('incorrect')) {
-                            indiceDiv.textContent = option.getAttribute('data-indice');
-                            indiceDiv.classList.remove('hidden');
-                            option.classList.add('bg-red-100', 'border-red-500', 'text-red-700');
-                            feedbackDiv.textContent = "Incorrect!";
-                            feedbackDiv.classList.add('bg-red-100', 'border-red-500', 'text-red-700');
-                        } else {
-                            indiceDiv.classList.add('hidden');
-                            option.classList.add('bg-green-100', 'border-green-500', 'text-green-700');
-                            feedbackDiv.textContent = "Correct!";
-                            feedbackDiv.classList.add('bg-green-100', 'border-green-500', 'text-green-700');
-                        }
-                        feedbackDiv.classList.remove('hidden');
-                    });
-                });
-            } else if (quizType === 'fill-in-the-blank') {
-                const submitButton = question.querySelector('.submit-answer');
-                const answerInput = question.querySelector(`#answer-${question.id.split('-')[1]}`);
-                const indiceDiv = question.querySelector('.indice');
-                const correctAnswer = question.getAttribute('data-answer');
-
-                submitButton.addEventListener('click', () => {
-                    if (answerInput.value.trim().toLowerCase() === correctAnswer.trim().toLowerCase()) {
-                        answerInput.classList.add('bg-green-100', 'border-green-500', 'text-green-700');
-                        indiceDiv.classList.add('hidden');
-                        feedbackDiv.textContent = "Correct!";
-                        feedbackDiv.classList.add('bg-green-100', 'border-green-500', 'text-green-700');
-                    } else {
-                        answerInput.classList.add('bg-red-100', 'border-red-500', 'text-red-700');
-                        indiceDiv.classList.remove('hidden');
-                        feedbackDiv.textContent = "Incorrect!";
-                        feedbackDiv.classList.add('bg-red-100', 'border-red-500', 'text-red-700');
-                    }
-                    feedbackDiv.classList.remove('hidden');
-                });
-            }
-        });
-    });
-});
+/*
+ * Interactive quizzes generated by the mkdocs_quiz plugin.
+ *
+ * Quizzes are hydrated lazily, when they get close to the viewport. Each quiz gets a single delegated click
+ * listener and a small state object holding its answers, so the score and progress bar never need to be
+ * read back from the DOM.
+ *
+ * In the `payload` render mode the page only contains an empty quiz container, the quiz is fetched from its
+ * JSON payload and rendered with the same markup as the plugin when it is hydrated.
+ *
+ * Quizzes with a `data-sample` attribute are always rendered from their payload, a bank of questions of which
+ * a random subset is drawn. The seed of the draw is kept in `data-sample-seed`, the refresh button draws a new
+ * subset.
+ *
+ * Quizzes with a `data-questions-per-page` attribute are paginated: only the first page of questions is in the
+ * document, the next ones stay inert in `<template>` elements and are moved into the document when they are
+ * reached. The score and progress bar count the questions of every page.
+ */
+(function () {
+    "use strict";
 
+    const SELECTED_CLASSES = ["selected", "font-bold", "border-blue-500", "bg-blue-100"];
+    const CORRECT_CLASSES = ["bg-green-100", "border-green-500", "text-green-700"];
+    const INCORRECT_CLASSES = ["bg-red-100", "border-red-500", "text-red-700"];
+    const RESULT_CLASSES = [...CORRECT_CLASSES, ...INCORRECT_CLASSES];
+    // Quizzes are hydrated a bit before they scroll into view
+    const HYDRATION_MARGIN = "200px";
+    // Payload URLs are relative to the site root, the script lives in its `static/` directory
+    const SCRIPT_SRC = document.currentScript && document.currentScript.src;
+    const SITE_ROOT = SCRIPT_SRC ? new URL("..", SCRIPT_SRC) : new URL(".", document.baseURI);
+    const OPTION_CLASSES = "p-2 mb-2 border border-gray-200 rounded-lg cursor-pointer hover:bg-gray-100";
+    const payloadRequests = new Map(); // payload URL -> promise, quizzes embedded twice are fetched once
+
+    function createElement(tag, className, attributes) {
+        const element = document.createElement(tag);
+        if (className) {
+            element.className = className;
+        }
+        Object.entries(attributes || {}).forEach(([name, value]) => element.setAttribute(name, value));
+        return element;
+    }
+
+    function renderMedia(media) {
+        if (media.type === "image") {
+            return createElement("img", "media-content mb-4", { src: media.src, alt: media.alt });
+        }
+        if (media.type !== "video" && media.type !== "audio") {
+            return null;
+        }
+        const element = createElement(media.type, "media-content mb-4", { controls: "" });
+        element.appendChild(createElement("source", null, {
+            src: media.src,
+            type: media.type === "video" ? "video/mp4" : "audio/mpeg",
+        }));
+        return element;
+    }
+
+    function renderQuestion(quizId, index, question, showIndice) {
+        const questionId = `${quizId}_${index}`;
+        const ids = { "data-quiz-id": quizId, "data-question-id": questionId };
+        const div = createElement("div", "question p-4 border border-gray-200 rounded-lg shadow-md mb-6", {
+            id: `question-${questionId}`, ...ids, "data-quiz-type": question.type,
+        });
+        if (question.media) {
+            const media = renderMedia(question.media);
+            if (media) {
+                div.appendChild(media);
+            }
+        }
+
+        const text = createElement("p", "font-bold text-lg mb-4");
+        text.innerHTML = question.text;
+        if (showIndice) {
+            const hintButton = createElement("button", "hint-button", { "data-indice": question.hint });
+            hintButton.appendChild(createElement("i", "fa fa-lightbulb-o"));
+            text.append(" ", hintButton);
+        }
+        div.appendChild(text);
+
+        const indiceDiv = createElement("div", "indice mt-4 p-3 border border-yellow-300 bg-yellow-100 text-yellow-700 rounded-lg hidden", {
+            id: `indice-${questionId}`,
+        });
+        const feedbackDiv = createElement("div", "feedback mt-4 p-3 rounded-lg hidden", { id: `feedback-${questionId}` });
+
+        if (question.type === "fill-in-the-blank") {
+            div.appendChild(createElement("input", "answer-input p-2 mb-2 border border-gray-200 rounded-lg", {
+                type: "text", id: `answer-${questionId}`, "data-answer": question.answer,
+            }));
+            const submitButton = createElement("button", "submit-answer bg-blue-500 text-white p-2 rounded-lg", {
+                "data-question-id": questionId,
+            });
+            submitButton.textContent = "Submit";
+            div.appendChild(submitButton);
+            if (showIndice && question.hint) {
+                indiceDiv.textContent = question.hint;
+                div.appendChild(indiceDiv);
+            }
+            div.appendChild(feedbackDiv);
+            return div;
+        }
+
+        const list = createElement("ul", "list-none p-0");
+        (question.options || []).forEach((option, optionId) => {
+            const li = createElement("li", `${option.correct ? "correct" : "incorrect"} ${OPTION_CLASSES}`, {
+                ...ids, "data-option-id": optionId, "data-indice": option.indice,
+            });
+            if (question.type === "multi-choice") {
+                const span = document.createElement("span");
+                span.innerHTML = option.text;
+                li.append(createElement("input", "multi-choice-checkbox", { type: "checkbox", "data-option-id": optionId }), " ", span);
+            } else {
+                li.innerHTML = option.text;
+            }
+            list.appendChild(li);
+        });
+        div.appendChild(list);
+        if (showIndice) {
+            div.appendChild(indiceDiv);
+        }
+        div.appendChild(feedbackDiv);
+        if (question.type === "multi-choice") {
+            const submitButton = createElement("button", "submit-multi-choice bg-blue-500 text-white p-2 rounded-lg", ids);
+            submitButton.textContent = "Submit";
+            div.appendChild(submitButton);
+        }
+        return div;
+    }
+
+    // Seeded pseudo-random generator (mulberry32), returns numbers in [0, 1)
+    function seededRandom(seed) {
+        let state = seed >>> 0;
+        return function () {
+            state = (state + 0x6D2B79F5) >>> 0;
+            let t = Math.imul(state ^ (state >>> 15), state | 1);
+            t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+            return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+        };
+    }
+
+    function newSeed() {
+        if (window.crypto && window.crypto.getRandomValues) {
+            return window.crypto.getRandomValues(new Uint32Array(1))[0];
+        }
+        return Math.floor(Math.random() * 4294967296);
+    }
+
+    // Draws `count` questions with a partial Fisher-Yates shuffle, they keep their order in the bank
+    function drawQuestions(questions, count, seed) {
+        const random = seededRandom(seed);
+        const indexes = questions.map((question, index) => index);
+        for (let i = 0; i < count; i++) {
+            const j = i + Math.floor(random() * (indexes.length - i));
+            [indexes[i], indexes[j]] = [indexes[j], indexes[i]];
+        }
+        return indexes.slice(0, count).sort((a, b) => a - b).map(index => questions[index]);
+    }
+
+    function sampleQuestions(quiz, payload, redraw) {
+        const sample = parseInt(quiz.getAttribute("data-sample"), 10);
+        if (!(sample > 0 && sample < payload.questions.length)) {
+            return payload.questions;
+        }
+        let seed = parseInt(quiz.getAttribute("data-sample-seed"), 10);
+        if (redraw || isNaN(seed)) {
+            seed = newSeed();
+            quiz.setAttribute("data-sample-seed", seed);
+        }
+        return drawQuestions(payload.questions, sample, seed);
+    }
+
+    function questionsPerPage(quiz) {
+        return parseInt(quiz.getAttribute("data-questions-per-page"), 10) || 0;
+    }
+
+    // Renders the questions, grouped in pages like the plugin does when the quiz is paginated
+    function renderQuestions(quiz, questions) {
+        const quizId = quiz.id.replace(/^quiz-/, "");
+        const showIndice = quiz.getAttribute("data-show-indice-on-answer") === "true";
+        const perPage = questionsPerPage(quiz);
+        const fragment = document.createDocumentFragment();
+        let container = fragment;
+        questions.forEach((question, index) => {
+            if (perPage > 0 && perPage < questions.length && index % perPage === 0) {
+                const page = index / perPage;
+                const element = createElement(page ? "template" : "div", "quiz-page", { "data-page": page });
+                fragment.appendChild(element);
+                container = page ? element.content : element;
+            }
+            container.appendChild(renderQuestion(quizId, index, question, showIndice));
+        });
+        return fragment;
+    }
+
+    function renderPagination(pages) {
+        const pagination = createElement("div", "quiz-pagination flex items-center justify-between mt-4");
+        const previousButton = createElement("button", "quiz-previous bg-blue-500 text-white p-2 rounded-lg", { disabled: "" });
+        previousButton.textContent = "Previous";
+        const pageNumber = createElement("span", "quiz-page-number");
+        pageNumber.textContent = `1 / ${pages}`;
+        const nextButton = createElement("button", "quiz-next bg-blue-500 text-white p-2 rounded-lg");
+        nextButton.textContent = "Next";
+        pagination.append(previousButton, pageNumber, nextButton);
+        return pagination;
+    }
+
+    function renderQuiz(quiz, payload) {
+        const option = name => quiz.getAttribute(`data-${name}`) === "true";
+        const fragment = document.createDocumentFragment();
+        if (option("show-progress-bar")) {
+            const container = createElement("div", "progress-bar-container");
+            container.appendChild(createElement("div", "progress-bar", { style: "width: 0%;" }));
+            fragment.appendChild(container);
+        }
+        const questions = sampleQuestions(quiz, payload, false);
+        fragment.appendChild(renderQuestions(quiz, questions));
+        const perPage = questionsPerPage(quiz);
+        if (perPage > 0 && perPage < questions.length) {
+            fragment.appendChild(renderPagination(Math.ceil(questions.length / perPage)));
+        }
+        if (option("show-refresh-button")) {
+            const refreshButton = createElement("button", "refresh-quiz bg-blue-500 text-white p-2 rounded-lg mt-4");
+            refreshButton.textContent = "Refresh";
+            fragment.appendChild(refreshButton);
+        }
+        if (option("show-score")) {
+            const scoreDiv = createElement("div", "score mt-4 text-lg font-bold hidden");
+            scoreDiv.textContent = "Score: 0";
+            fragment.appendChild(scoreDiv);
+        }
+        quiz.appendChild(fragment);
+    }
+
+    function fetchPayload(src) {
+        const url = new URL(src, SITE_ROOT).href;
+        if (!payloadRequests.has(url)) {
+            payloadRequests.set(url, fetch(url).then(response => {
+                if (!response.ok) {
+                    throw new Error(`Could not load quiz ${url}: ${response.status}`);
+                }
+                return response.json();
+            }).catch(error => {
+                payloadRequests.delete(url);
+                throw error;
+            }));
+        }
+        return payloadRequests.get(url);
+    }
+
+    // Counts the questions of the quiz, including the ones of the pages not shown yet
+    function countQuestions(quiz) {
+        let total = quiz.querySelectorAll(".question").length;
+        quiz.querySelectorAll("template.quiz-page").forEach(template => {
+            total += template.content.querySelectorAll(".question").length;
+        });
+        return total;
+    }
+
+    function createState(quiz, payload) {
+        return {
+            quiz: quiz,
+            payload: payload || null,
+            total: countQuestions(quiz),
+            results: new Map(), // question id -> whether the last answer was correct
+            page: 0,
+            progressBar: quiz.querySelector(".progress-bar"),
+            scoreDiv: quiz.querySelector(".score"),
+            pagination: quiz.querySelector(".quiz-pagination"),
+        };
+    }
+
+    // Shows a page of a paginated quiz, its questions are moved out of their template the first time
+    function showPage(state, index) {
+        if (!state.pagination) {
+            return;
+        }
+        const pages = state.quiz.querySelectorAll(".quiz-page");
+        if (index < 0 || index >= pages.length) {
+            return;
+        }
+        let current = pages[index];
+        if (current.tagName === "TEMPLATE") {
+            const page = createElement("div", "quiz-page", { "data-page": index });
+            page.appendChild(current.content);
+            current.replaceWith(page);
+            current = page;
+        }
+        state.quiz.querySelectorAll("div.quiz-page").forEach(page => {
+            page.hidden = page !== current;
+        });
+        state.page = index;
+        state.pagination.querySelector(".quiz-previous").disabled = index === 0;
+        state.pagination.querySelector(".quiz-next").disabled = index === pages.length - 1;
+        state.pagination.querySelector(".quiz-page-number").textContent = `${index + 1} / ${pages.length}`;
+    }
+
+    function updateScore(state) {
+        let score = 0;
+        state.results.forEach(correct => {
+            if (correct) {
+                score += 1;
+            }
+        });
+        state.quiz.setAttribute("data-score", score);
+        if (state.progressBar) {
+            const progress = state.total ? (state.results.size / state.total) * 100 : 0;
+            state.progressBar.style.width = `${progress}%`;
+        }
+        if (state.scoreDiv) {
+            state.scoreDiv.textContent = `Score: ${score} / ${state.total}`;
+            state.scoreDiv.classList.toggle("hidden", state.results.size === 0);
+        }
+    }
+
+    function showIndice(question, visible, text) {
+        const indiceDiv = question.querySelector(".indice");
+        if (!indiceDiv) {
+            return;
+        }
+        if (visible && text !== undefined) {
+            indiceDiv.textContent = text;
+        }
+        indiceDiv.classList.toggle("hidden", !visible || !indiceDiv.textContent);
+    }
+
+    function recordAnswer(state, question, correct) {
+        const feedbackDiv = question.querySelector(".feedback");
+        if (feedbackDiv) {
+            feedbackDiv.textContent = correct ? "Correct!" : "Incorrect!";
+            feedbackDiv.classList.remove("hidden", ...RESULT_CLASSES);
+            feedbackDiv.classList.add(...(correct ? CORRECT_CLASSES : INCORRECT_CLASSES));
+        }
+        state.results.set(question.getAttribute("data-question-id"), correct);
+        updateScore(state);
+    }
+
+    function selectOption(state, question, option) {
+        option.parentElement.querySelectorAll("li").forEach(li => li.classList.remove(...SELECTED_CLASSES, ...RESULT_CLASSES));
+        const correct = option.classList.contains("correct");
+        option.classList.add(...SELECTED_CLASSES, ...(correct ? CORRECT_CLASSES : INCORRECT_CLASSES));
+        showIndice(question, !correct, option.getAttribute("data-indice"));
+        recordAnswer(state, question, correct);
+    }
+
+    function submitMultiChoice(state, question) {
+        let firstMistake = null;
+        question.querySelectorAll("li").forEach(li => {
+            const checked = li.querySelector(".multi-choice-checkbox").checked;
+            if (checked !== li.classList.contains("correct") && firstMistake === null) {
+                firstMistake = li;
+            }
+        });
+        const correct = firstMistake === null;
+        showIndice(question, !correct, correct ? undefined : firstMistake.getAttribute("data-indice"));
+        recordAnswer(state, question, correct);
+    }
+
+    function submitAnswer(state, question) {
+        const answerInput = question.querySelector(".answer-input");
+        const expected = (answerInput.getAttribute("data-answer") || "").trim().toLowerCase();
+        const correct = answerInput.value.trim().toLowerCase() === expected;
+        answerInput.classList.remove(...RESULT_CLASSES);
+        answerInput.classList.add(...(correct ? CORRECT_CLASSES : INCORRECT_CLASSES));
+        showIndice(question, !correct);
+        recordAnswer(state, question, correct);
+    }
+
+    // Replaces the questions of a sampled quiz with a new draw from its payload
+    function redraw(state) {
+        const quiz = state.quiz;
+        quiz.querySelectorAll(".quiz-page, .question").forEach(element => element.remove());
+        const questions = sampleQuestions(quiz, state.payload, true);
+        quiz.insertBefore(renderQuestions(quiz, questions), quiz.querySelector(".quiz-pagination, .refresh-quiz, .score"));
+        state.total = questions.length;
+    }
+
+    function refresh(state) {
+        const quiz = state.quiz;
+        if (state.payload && quiz.hasAttribute("data-sample")) {
+            redraw(state);
+            state.results.clear();
+            updateScore(state);
+            showPage(state, 0);
+            return;
+        }
+        quiz.querySelectorAll("li").forEach(li => li.classList.remove(...SELECTED_CLASSES, ...RESULT_CLASSES));
+        quiz.querySelectorAll(".multi-choice-checkbox").forEach(checkbox => {
+            checkbox.checked = false;
+        });
+        quiz.querySelectorAll(".answer-input").forEach(input => {
+            input.value = "";
+            input.classList.remove(...RESULT_CLASSES);
+        });
+        quiz.querySelectorAll(".feedback, .indice").forEach(div => div.classList.add("hidden"));
+        state.results.clear();
+        updateScore(state);
+        showPage(state, 0);
+    }
+
+    function onClick(state, event) {
+        const target = event.target;
+        if (target.closest(".refresh-quiz")) {
+            refresh(state);
+            return;
+        }
+        if (target.closest(".quiz-next")) {
+            showPage(state, state.page + 1);
+            return;
+        }
+        if (target.closest(".quiz-previous")) {
+            showPage(state, state.page - 1);
+            return;
+        }
+        const question = target.closest(".question");
+        if (!question) {
+            return;
+        }
+        const quizType = question.getAttribute("data-quiz-type");
+
+        const hintButton = target.closest(".hint-button");
+        if (hintButton) {
+            showIndice(question, true, hintButton.getAttribute("data-indice"));
+        } else if (target.closest(".submit-answer")) {
+            submitAnswer(state, question);
+        } else if (target.closest(".submit-multi-choice")) {
+            submitMultiChoice(state, question);
+        } else {
+            const option = target.closest("li");
+            if (!option || !question.contains(option)) {
+                return;
+            }
+            if (quizType === "multi-choice") {
+                const checkbox = option.querySelector(".multi-choice-checkbox");
+                if (checkbox && target !== checkbox) {
+                    checkbox.checked = !checkbox.checked;
+                }
+            } else if (quizType === "multiple-choice" || quizType === "true-false") {
+                selectOption(state, question, option);
+            }
+        }
+    }
+
+    function onKeydown(state, event) {
+        if (event.key === "Enter" && event.target.classList.contains("answer-input")) {
+            submitAnswer(state, event.target.closest(".question"));
+        }
+    }
+
+    function attach(quiz, payload) {
+        const state = createState(quiz, payload);
+        quiz.addEventListener("click", event => onClick(state, event));
+        quiz.addEventListener("keydown", event => onKeydown(state, event));
+    }
+
+    function hydrate(quiz) {
+        if (quiz.hasAttribute("data-hydrated")) {
+            return;
+        }
+        quiz.setAttribute("data-hydrated", "true");
+        const src = quiz.getAttribute("data-quiz-src");
+        if (!src) {
+            attach(quiz);
+            return;
+        }
+        fetchPayload(src).then(payload => {
+            renderQuiz(quiz, payload);
+            attach(quiz, payload);
+        }).catch(error => {
+            quiz.removeAttribute("data-hydrated");
+            console.error(error);
+        });
+    }
+
+    function init() {
+        const quizzes = document.querySelectorAll(".quiz");
+        if (!("IntersectionObserver" in window)) {
+            quizzes.forEach(hydrate);
+            return;
+        }
+        const observer = new IntersectionObserver(entries => {
+            entries.forEach(entry => {
+                if (entry.isIntersecting) {
+                    observer.unobserve(entry.target);
+                    hydrate(entry.target);
+                }
+            });
+        }, { rootMargin: HYDRATION_MARGIN });
+        quizzes.forEach(quiz => observer.observe(quiz));
+    }
+
+    window.mkdocsQuiz = { hydrate: hydrate };
+
+    if (document.readyState === "loading") {
+        document.addEventListener("DOMContentLoaded", init);
+    } else {
+        init();
+    }
+})();
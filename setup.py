@@ -26,6 +26,9 @@ setup(
     entry_points={
         'mkdocs.plugins': [
             'mkdocs_quizz = mkdocs_quiz.plugin:QuizPlugin'
+        ],
+        'console_scripts': [
+            'mkdocs-quiz = mkdocs_quiz.cli:main'
         ]
     },
     keywords='mkdocs plugin quiz',
@@ -0,0 +1,68 @@
+import gzip
+import os
+import tempfile
+from mkdocs.structure.files import Files
+from .base_test_case import BaseTestCase
+from mkdocs_quiz.assets import fingerprint, gzip_compress, minify_css, minify_js
+
+
+class TestAssets(BaseTestCase):
+
+    def test_minify_css(self):
+        css = """
+        /* Quiz container */
+        .quiz li:hover,
+        .quiz li.selected {
+            border: 1px solid #e0e0e0;
+            margin: 20px 0;
+        }
+        """
+        self.assertEqual(minify_css(css), '.quiz li:hover,.quiz li.selected{border:1px solid #e0e0e0;margin:20px 0}')
+
+    def test_minify_js_keeps_literals(self):
+        js = """
+        // Comment
+        const text = "a // not a comment";  /* block */
+        const path = `#answer-${id}`;
+        const pattern = /a\\/b[/]/g;
+        """
+        self.assertEqual(minify_js(js),
+                         'const text="a // not a comment";const path=`#answer-${id}`;const pattern=/a\\/b[/]/g;')
+
+    def test_minify_js_keeps_line_breaks_for_asi(self):
+        self.assertEqual(minify_js("let a = i++\nj = a - -b\nreturn x"), "let a=i++\nj=a- -b\nreturn x")
+
+    def test_minify_js_nested_template_literals(self):
+        self.assertEqual(minify_js('const s = `x ${b ? `y  z` : ""} w  v`;\nlet t = `a ${ {k: "}"}.k }  b`'),
+                         'const s=`x ${b ? `y  z` : ""} w  v`;let t=`a ${ {k: "}"}.k }  b`')
+
+    def test_minify_js_regex_after_keyword(self):
+        self.assertEqual(minify_js("function f(x) {\n  return /a  b/.test(x)\n}\nlet y = typeof /c  d/, z = a / 2 / b"),
+                         "function f(x){return/a  b/.test(x)}\nlet y=typeof/c  d/,z=a/2/b")
+
+    def test_fingerprint(self):
+        self.assertEqual(fingerprint('quiz.js', b'a'), fingerprint('quiz.js', b'a'))
+        self.assertNotEqual(fingerprint('quiz.js', b'a'), fingerprint('quiz.js', b'b'))
+        self.assertRegex(fingerprint('quiz.js', b'a'), r'^quiz\.[0-9a-f]{8}\.js$')
+
+    def test_gzip_compress_is_reproducible(self):
+        compressed = gzip_compress(b'quiz' * 100)
+        self.assertEqual(gzip.decompress(compressed), b'quiz' * 100)
+        self.assertEqual(compressed[4:8], b'\x00\x00\x00\x00')  # no modification time in the header
+        self.assertEqual(gzip_compress(b'quiz' * 100), compressed)
+
+    def test_optimized_assets_are_written(self):
+        self.load_plugin_config()
+        self.plugin.config['optimize_assets'] = True
+        self.plugin.on_files(Files([]), self.config)
+        js_url = self.plugin.asset_urls['js']
+        self.assertRegex(js_url, r'^static/quiz\.[0-9a-f]{8}\.js$')
+        self.assertRegex(self.plugin.asset_urls['css'], r'^static/quiz\.[0-9a-f]{8}\.css$')
+
+        with tempfile.TemporaryDirectory() as site_dir:
+            self.plugin.on_post_build({'site_dir': site_dir})
+            with open(os.path.join(site_dir, js_url), 'rb') as file:
+                content = file.read()
+            with open(os.path.join(site_dir, f"{js_url}.gz"), 'rb') as file:
+                self.assertEqual(gzip.decompress(file.read()), content)
+        self.assertNotIn(b'\n    ', content)
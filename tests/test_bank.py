@@ -0,0 +1,247 @@
+import copy
+import io
+import json
+import os
+import tempfile
+from contextlib import redirect_stdout
+from unittest.mock import patch
+from mkdocs.structure.pages import Page
+from mkdocs.structure.files import File
+from .base_test_case import BaseTestCase
+from .mock_quiz_data import mock_quiz_data
+from mkdocs_quiz.bank import (QuizFile, compile_quiz_file, compiled_path, load_compiled, load_quiz_file,
+                              load_quiz_index, quiz_digests)
+from mkdocs_quiz.cli import main
+
+
+class TestCompiledQuizBank(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.quiz_file = os.path.join(self.tmp_dir.name, 'quizzes.json')
+        self.write_quiz_file(mock_quiz_data)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write_quiz_file(self, quiz_data):
+        with open(self.quiz_file, 'w') as file:
+            json.dump(quiz_data, file)
+
+    def test_compiled_bank_is_written_next_to_the_quiz_file(self):
+        quiz_data, compiled = load_quiz_file(self.quiz_file, compiled=True)
+        self.assertFalse(compiled)
+        self.assertEqual(quiz_data, mock_quiz_data)
+        self.assertTrue(os.path.isfile(os.path.join(self.tmp_dir.name, '.quizzes.json.bank')))
+
+        with patch('mkdocs_quiz.bank.compile_quiz_file') as compile_quiz:
+            quiz_data, compiled = load_quiz_file(self.quiz_file, compiled=True)
+        compile_quiz.assert_not_called()
+        self.assertTrue(compiled)
+        self.assertEqual(quiz_data, mock_quiz_data)
+
+    def test_changed_quiz_file_is_compiled_again(self):
+        compile_quiz_file(self.quiz_file)
+        quiz_data = copy.deepcopy(mock_quiz_data)
+        quiz_data['quizzes']['quiz2'] = quiz_data['quizzes']['quiz1']
+        self.write_quiz_file(quiz_data)
+
+        self.assertIsNone(load_compiled(self.quiz_file))
+        self.assertEqual(load_quiz_file(self.quiz_file, compiled=True), (quiz_data, False))
+        self.assertEqual(load_compiled(self.quiz_file), quiz_data)
+
+    def test_touched_quiz_file_is_validated_by_hash(self):
+        compile_quiz_file(self.quiz_file)
+        stat = os.stat(self.quiz_file)
+        os.utime(self.quiz_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.assertEqual(load_compiled(self.quiz_file), mock_quiz_data)
+
+        # Same size and modification time, different content
+        with open(self.quiz_file, 'r+') as file:
+            content = file.read()
+            file.seek(0)
+            file.write(content.replace('Paris', 'Pari$'))
+        os.utime(self.quiz_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10 ** 9))
+        self.assertIsNone(load_compiled(self.quiz_file))
+
+    def test_invalid_compiled_bank_is_ignored(self):
+        with open(compiled_path(self.quiz_file), 'wb') as file:
+            file.write(b'not a compiled bank')
+        self.assertIsNone(load_compiled(self.quiz_file))
+        self.assertEqual(load_quiz_file(self.quiz_file, compiled=True), (mock_quiz_data, False))
+
+    def test_plugin_loads_the_compiled_bank(self):
+        compile_quiz_file(self.quiz_file)
+        self.load_plugin_config(quiz_file=self.quiz_file)
+        self.assertEqual(self.plugin.quiz_data, mock_quiz_data)
+
+        self.plugin.config['compile_quiz_file'] = True
+        with patch('mkdocs_quiz.bank.json.load') as load, patch('mkdocs_quiz.bank.compile_quiz_file') as compile_quiz:
+            self.plugin.on_config(self.config)
+        load.assert_not_called()
+        compile_quiz.assert_not_called()
+        self.assertEqual(self.plugin.quiz_data, mock_quiz_data)
+
+    def test_compiled_bank_stores_the_digests(self):
+        digests = quiz_digests(mock_quiz_data['quizzes'])
+        compile_quiz_file(self.quiz_file)
+        quiz_file = QuizFile(self.quiz_file, compiled=True)
+        self.assertEqual(quiz_file.load(), 'compiled')
+        with patch('mkdocs_quiz.bank.content_hash') as content_hash:
+            self.assertEqual(quiz_file.digests(), digests)
+        content_hash.assert_not_called()
+
+    def test_compile_command(self):
+        with redirect_stdout(io.StringIO()) as output:
+            self.assertEqual(main(['compile', self.quiz_file]), 0)
+        self.assertIn('Compiled 1 quizzes', output.getvalue())
+        self.assertEqual(load_compiled(self.quiz_file), mock_quiz_data)
+
+        with patch('sys.stderr', new_callable=io.StringIO) as errors:
+            self.assertEqual(main(['compile', os.path.join(self.tmp_dir.name, 'missing.json')]), 1)
+        self.assertIn('Cannot compile', errors.getvalue())
+
+    def test_compile_command_writes_the_index(self):
+        with redirect_stdout(io.StringIO()) as output:
+            self.assertEqual(main(['compile', '--index', self.quiz_file]), 0)
+        self.assertIn('.quizzes.json.index', output.getvalue())
+        quizzes, compiled = load_quiz_index(self.quiz_file, compiled=True)
+        self.assertTrue(compiled)
+        self.assertEqual(dict(quizzes), mock_quiz_data['quizzes'])
+
+
+class TestLazyQuizLoading(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.quiz_file = os.path.join(self.tmp_dir.name, 'quizzes.json')
+        self.quiz_data = copy.deepcopy(mock_quiz_data)
+        self.quiz_data['version'] = 'é'
+        self.quiz_data['quizzes']['quizé'] = {'questions': [{'type': 'fill-in-the-blank', 'question': {'en': '€'}}]}
+        self.quiz_data['quizzes']['quiz2'] = self.quiz_data['quizzes']['quiz1']
+        with open(self.quiz_file, 'w', encoding='utf-8') as file:
+            json.dump(self.quiz_data, file, ensure_ascii=False, indent=2)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_quizzes_are_decoded_on_first_access(self):
+        quizzes, compiled = load_quiz_index(self.quiz_file)
+        self.assertFalse(compiled)
+        self.assertEqual(list(quizzes), ['quiz1', 'quizé', 'quiz2'])
+        self.assertIn('quizé', quizzes)
+        self.assertEqual(quizzes.decoded_count, 0)
+
+        self.assertEqual(quizzes['quizé'], self.quiz_data['quizzes']['quizé'])
+        self.assertEqual(quizzes['quiz2'], self.quiz_data['quizzes']['quiz2'])
+        self.assertEqual(quizzes['quiz2'], self.quiz_data['quizzes']['quiz2'])
+        self.assertEqual(quizzes.decoded_count, 2)
+        self.assertEqual(dict(quizzes), self.quiz_data['quizzes'])
+
+    def test_escaped_keys(self):
+        # json.dump escapes non-ASCII characters by default, keys can mix escapes and raw UTF-8 bytes
+        self.quiz_data['quizzes']['café 日本'] = self.quiz_data['quizzes']['quiz1']
+        with open(self.quiz_file, 'w', encoding='utf-8') as file:
+            file.write(json.dumps(self.quiz_data).replace('"quiz2"', '"quiz2 \\u00e9 é"'))
+        quizzes, _ = load_quiz_index(self.quiz_file)
+        self.assertEqual(list(quizzes), ['quiz1', 'quizé', 'quiz2 é é', 'café 日本'])
+        self.assertEqual(quizzes['café 日本'], self.quiz_data['quizzes']['quiz1'])
+
+    def test_invalid_quiz_file(self):
+        for content in ('{"quizzes": {"quiz1": {},}}', '{"quizzes": {"quiz1": tru}}', '{"quizzes": {}} {}', '[]'):
+            with open(self.quiz_file, 'w') as file:
+                file.write(content)
+            with self.assertRaises(json.JSONDecodeError):
+                load_quiz_index(self.quiz_file)
+
+    def test_compiled_index_is_reused(self):
+        self.assertFalse(load_quiz_index(self.quiz_file, compiled=True)[1])
+        self.assertTrue(os.path.isfile(compiled_path(self.quiz_file, 'index')))
+        with patch('mkdocs_quiz.bank.build_index') as build_index:
+            quizzes, compiled = load_quiz_index(self.quiz_file, compiled=True)
+        build_index.assert_not_called()
+        self.assertTrue(compiled)
+        self.assertEqual(quizzes['quiz1'], self.quiz_data['quizzes']['quiz1'])
+
+    def test_plugin_only_decodes_used_quizzes(self):
+        self.load_plugin_config(quiz_file=self.quiz_file)
+        self.plugin.config['lazy_loading'] = True
+        self.plugin.on_config(self.config)
+
+        page = Page('Sample Page', File('sample_page.md', 'docs', 'site', False), self.config)
+        markdown = self.plugin.on_page_markdown("<!-- QUIZ_ID: quiz2 -->", page, self.config, None)
+        self.assertEqual(self.plugin.quiz_bank.quizzes.decoded_count, 1)
+        quiz_html, = self.plugin.resolve_placeholders(page).values()
+        self.assertIn('What is the capital of France?', quiz_html)
+        self.assertNotIn('QUIZ_ID', markdown)
+
+
+class TestQuizFileReuse(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.quiz_file = os.path.join(self.tmp_dir.name, 'quizzes.json')
+        self.write_quiz_file(mock_quiz_data)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write_quiz_file(self, quiz_data, mtime_offset=0):
+        with open(self.quiz_file, 'w') as file:
+            json.dump(quiz_data, file)
+        stat = os.stat(self.quiz_file)
+        os.utime(self.quiz_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + mtime_offset))
+
+    def test_unchanged_quiz_file_is_reused(self):
+        quiz_file = QuizFile(self.quiz_file)
+        self.assertEqual(quiz_file.load(), 'parsed')
+        digests = quiz_file.digests()
+
+        with patch('mkdocs_quiz.bank.load_quiz_file') as load:
+            self.assertEqual(quiz_file.load(), 'reused')
+            # Same content, newer modification time
+            self.write_quiz_file(mock_quiz_data, mtime_offset=10 ** 9)
+            self.assertEqual(quiz_file.load(), 'reused')
+        load.assert_not_called()
+        self.assertIs(quiz_file.digests(), digests)
+
+        quiz_data = copy.deepcopy(mock_quiz_data)
+        quiz_data['quizzes']['quiz2'] = quiz_data['quizzes']['quiz1']
+        self.write_quiz_file(quiz_data, mtime_offset=2 * 10 ** 9)
+        self.assertEqual(quiz_file.load(), 'parsed')
+        self.assertEqual(sorted(quiz_file), ['quiz1', 'quiz2'])
+        self.assertEqual(quiz_file.digests()['quiz1'], digests['quiz1'])
+
+    def test_compiled_quiz_file_is_not_hashed_again(self):
+        for lazy in (False, True):
+            quiz_file = QuizFile(self.quiz_file, compiled=True, lazy=lazy)
+            with patch('mkdocs_quiz.bank.file_hash') as hash_file:
+                self.assertEqual(quiz_file.load(), 'parsed')
+                self.assertEqual(QuizFile(self.quiz_file, compiled=True, lazy=lazy).load(), 'compiled')
+            hash_file.assert_not_called()
+
+            # Only a newer modification time, the hash of the header is compared to the content
+            self.write_quiz_file(mock_quiz_data, mtime_offset=10 ** 9)
+            self.assertEqual(quiz_file.load(), 'reused')
+
+            modified_data = copy.deepcopy(mock_quiz_data)
+            modified_data['quizzes']['quiz2'] = modified_data['quizzes']['quiz1']
+            self.write_quiz_file(modified_data, mtime_offset=2 * 10 ** 9)
+            self.assertEqual(quiz_file.load(), 'parsed')
+            self.assertEqual(sorted(quiz_file), ['quiz1', 'quiz2'])
+            self.write_quiz_file(mock_quiz_data)
+
+    def test_plugin_reuses_the_quiz_file_between_rebuilds(self):
+        self.load_plugin_config(quiz_file=self.quiz_file, logging=True)
+        quiz_bank = self.plugin.quiz_bank
+        with self.assertLogs('mkdocs.plugins.mkdocs_quiz', level='INFO') as logs:
+            self.plugin.on_config(self.config)
+        self.assertIs(self.plugin.quiz_bank, quiz_bank)
+        self.assertIn(f"Loaded 1 quizzes from {self.quiz_file} (reused)", '\n'.join(logs.output))
+
+        self.plugin.config['lazy_loading'] = True
+        self.plugin.on_config(self.config)
+        self.assertIsNot(self.plugin.quiz_bank, quiz_bank)
@@ -0,0 +1,74 @@
+import os
+import tempfile
+from .base_test_case import BaseTestCase
+from .mock_quiz_data import mock_quiz_data
+from mkdocs_quiz.cache import RenderCache
+
+
+class TestRenderCache(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.tmp_dir.name, 'cache')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def load_cached_plugin_config(self, **kwargs):
+        self.load_plugin_config(**kwargs)
+        self.plugin.config.update({'cache': True, 'cache_dir': self.cache_dir, 'cache_max_size': 1})
+        self.plugin.on_config(self.config)
+
+    def test_key_depends_on_quiz_and_options(self):
+        quiz = mock_quiz_data['quizzes']['quiz1']
+        options = {'language': 'en', 'show_score': True}
+        key = RenderCache.make_key(quiz, options)
+
+        self.assertEqual(key, RenderCache.make_key(quiz, dict(options)))
+        self.assertNotEqual(key, RenderCache.make_key(quiz, {'language': 'fr', 'show_score': True}))
+        self.assertNotEqual(key, RenderCache.make_key({'questions': []}, options))
+
+    def test_lru_eviction(self):
+        cache = RenderCache(self.cache_dir, max_size=30)
+        cache.set('a', 'x' * 10)
+        cache.set('b', 'y' * 10)
+        cache.get('a')  # 'b' is now the least recently used entry
+        cache.set('c', 'z' * 15)
+
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIn('c', cache)
+        self.assertFalse(os.path.exists(os.path.join(self.cache_dir, 'b.html')))
+        self.assertLessEqual(cache.size, 30)
+
+    def test_hit_and_miss_counts(self):
+        cache = RenderCache(self.cache_dir, max_size=1024)
+        self.assertIsNone(cache.get('missing'))
+        cache.set('key', '<div></div>')
+        self.assertEqual(cache.get('key'), '<div></div>')
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_cache_persists_between_builds(self):
+        self.load_cached_plugin_config()
+        quiz = mock_quiz_data['quizzes']['quiz1']
+        quiz_html = self.plugin.generate_quiz_html(quiz)
+        self.plugin.on_post_build(self.config)
+        self.assertEqual(self.plugin.render_cache.misses, 1)
+
+        # A new plugin instance simulates the next `mkdocs build`
+        self.plugin = self.plugin.__class__()
+        self.load_cached_plugin_config()
+        self.assertEqual(self.plugin.generate_quiz_html(quiz), quiz_html)
+        self.assertEqual((self.plugin.render_cache.hits, self.plugin.render_cache.misses), (1, 0))
+
+    def test_cache_misses_when_options_change(self):
+        self.load_cached_plugin_config(show_score=True)
+        quiz = mock_quiz_data['quizzes']['quiz1']
+        self.plugin.generate_quiz_html(quiz)
+        self.plugin.on_post_build(self.config)
+
+        self.load_cached_plugin_config(show_score=False)
+        quiz_html = self.plugin.generate_quiz_html(quiz)
+        self.assertEqual(self.plugin.render_cache.misses, 1)
+        self.assertNotIn("class='score", quiz_html)
@@ -1,7 +1,11 @@
+import inspect
 from bs4 import BeautifulSoup  # Import BeautifulSoup to parse the generated HTML
 from .base_test_case import BaseTestCase  # Import the BaseTestCase from your shared setup
 from mkdocs.structure.pages import Page
 from mkdocs.structure.files import File
+from unittest.mock import patch
+from .mock_quiz_data import mock_quiz_data
+from mkdocs_quiz.model import normalize_quiz
 
 
 class TestHTMLGeneration(BaseTestCase):
@@ -85,7 +89,7 @@ class TestHTMLGeneration(BaseTestCase):
         updated_markdown = self.plugin.on_page_markdown(markdown, page, self.config, None)
 
         # Replace placeholders with quiz HTML
-        for placeholder, quiz_html in page.meta.get('quiz_placeholder', []):
+        for placeholder, quiz_html in self.plugin.resolve_placeholders(page).items():
             updated_markdown = updated_markdown.replace(placeholder, quiz_html)
 
         soup = BeautifulSoup(updated_markdown, 'html.parser')
@@ -297,3 +301,83 @@ class TestHTMLGeneration(BaseTestCase):
         self.assertEqual(img_tag['src'], './static/images/test.png')
         self.assertEqual(img_tag['alt'], 'Paris')
 
+
+    def test_quiz_ids_are_deterministic(self):
+        self.load_plugin_config()
+        quiz = mock_quiz_data['quizzes']['quiz1']
+        quiz_html = self.plugin.generate_quiz_html(quiz, 'quiz1')
+
+        # A fresh plugin instance simulates the next build
+        self.plugin = self.plugin.__class__()
+        self.load_plugin_config()
+        self.assertEqual(self.plugin.generate_quiz_html(quiz, 'quiz1'), quiz_html)
+
+        soup = BeautifulSoup(quiz_html, 'html.parser')
+        quiz_div = soup.find('div', class_='quiz')
+        self.assertTrue(quiz_div['id'].startswith('quiz-quiz1_'))
+        question_ids = [div['data-question-id'] for div in soup.find_all('div', class_='question')]
+        self.assertEqual(question_ids, [f"{quiz_div['id'][len('quiz-'):]}_{i}" for i in range(3)])
+
+    def test_quiz_embedded_twice_gets_distinct_ids(self):
+        self.load_plugin_config()
+        self.plugin.quiz_data = mock_quiz_data
+        markdown = "<!-- QUIZ_ID: quiz1 -->\n\nSome text\n\n<!-- QUIZ_ID: quiz1 -->"
+        file = File('sample_page.md', 'docs', 'site', False)
+        page = Page('Sample Page', file, self.config)
+
+        updated_markdown = self.plugin.on_page_markdown(markdown, page, self.config, None)
+        for placeholder, quiz_html in self.plugin.resolve_placeholders(page).items():
+            updated_markdown = updated_markdown.replace(placeholder, quiz_html)
+
+        soup = BeautifulSoup(updated_markdown, 'html.parser')
+        quiz_ids = [div['id'] for div in soup.find_all('div', class_='quiz')]
+        self.assertEqual(len(quiz_ids), 2)
+        self.assertEqual(len(set(quiz_ids)), 2)
+        element_ids = [tag['id'] for tag in soup.find_all(id=True)]
+        self.assertEqual(len(element_ids), len(set(element_ids)))
+
+    def test_quiz_embedded_twice_is_rendered_once(self):
+        self.load_plugin_config()
+        self.plugin.quiz_data = mock_quiz_data
+        markdown = "<!-- QUIZ_ID: quiz1 -->\n\n<!-- QUIZ_ID: unknown -->\n\n<!-- QUIZ_ID: quiz1 -->"
+        page = Page('Sample Page', File('sample_page.md', 'docs', 'site', False), self.config)
+
+        with patch.object(self.plugin, 'generate_quiz_html', wraps=self.plugin.generate_quiz_html) as generate_quiz_html:
+            updated_markdown = self.plugin.on_page_markdown(markdown, page, self.config, None)
+            self.assertEqual(len(page.meta['quiz_placeholder']), 2)
+            self.plugin.on_post_page(f"<body>{updated_markdown}</body>", page, self.config)
+        self.assertEqual(generate_quiz_html.call_count, 1)
+        self.assertIn('<!-- QUIZ_ID: unknown -->', updated_markdown)
+        self.assertNotIn('<!-- QUIZ_ID: quiz1 -->', updated_markdown)
+
+    def test_page_without_quiz_is_left_untouched(self):
+        self.load_plugin_config()
+        self.plugin.quiz_data = mock_quiz_data
+        markdown = "# Sample Page\n\nNo quiz here."
+        page = Page('Sample Page', File('sample_page.md', 'docs', 'site', False), self.config)
+
+        self.assertIs(self.plugin.on_page_markdown(markdown, page, self.config, None), markdown)
+        self.assertNotIn('quiz_placeholder', page.meta)
+
+    def test_iter_quiz_html(self):
+        self.load_plugin_config()
+        quiz = normalize_quiz(mock_quiz_data['quizzes']['quiz1'], 'en')
+        chunks = list(self.plugin.iter_quiz_html(quiz, 'quiz1_abc'))
+        self.assertGreater(len(chunks), len(quiz.questions))
+        self.assertEqual(''.join(chunks), self.plugin.build_quiz_html(quiz, 'quiz1_abc'))
+
+    def test_quiz_html_is_generated_question_by_question(self):
+        # How the generation time scales with the number of questions is measured by benchmarks/suite.py
+        self.load_plugin_config()
+        questions = mock_quiz_data['quizzes']['quiz1']['questions']
+        quiz = normalize_quiz({'questions': questions * 100}, 'en')
+
+        chunks = self.plugin.iter_quiz_html(quiz, 'quiz1_abc')
+        self.assertTrue(inspect.isgenerator(chunks))
+        chunks = list(chunks)
+        # No chunk accumulates the HTML of several questions, the quiz HTML is only joined once
+        self.assertEqual(sum(chunk.count("data-quiz-type=") for chunk in chunks), len(quiz.questions))
+        self.assertTrue(all(chunk.count("data-quiz-type=") <= 1 for chunk in chunks))
+        with patch.object(self.plugin, 'iter_quiz_html', return_value=iter(chunks)) as iter_quiz_html:
+            self.assertEqual(self.plugin.build_quiz_html(quiz, 'quiz1_abc'), ''.join(chunks))
+        iter_quiz_html.assert_called_once_with(quiz, 'quiz1_abc')
@@ -0,0 +1,75 @@
+import copy
+import json
+import os
+import tempfile
+from unittest.mock import MagicMock, patch
+from mkdocs.structure.pages import Page
+from mkdocs.structure.files import File
+from .base_test_case import BaseTestCase
+from .mock_quiz_data import mock_quiz_data
+
+
+class TestIncrementalRebuild(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.quiz_file = os.path.join(self.tmp_dir.name, 'quizzes.json')
+        self.quiz_data = copy.deepcopy(mock_quiz_data)
+        self.quiz_data['quizzes']['quiz2'] = copy.deepcopy(mock_quiz_data['quizzes']['quiz1'])
+        self.write_quiz_file()
+        self.plugin.on_startup(command='serve', dirty=False)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write_quiz_file(self):
+        with open(self.quiz_file, 'w') as file:
+            json.dump(self.quiz_data, file)
+
+    def build_pages(self):
+        for name, quiz_id in (('page1.md', 'quiz1'), ('page2.md', 'quiz2')):
+            page = Page(name, File(name, 'docs', 'site', False), self.config)
+            markdown = self.plugin.on_page_markdown(f"<!-- QUIZ_ID: {quiz_id} -->", page, self.config, None)
+            self.plugin.on_post_page(f"<body>{markdown}</body>", page, self.config)
+
+    def test_reverse_index(self):
+        self.load_plugin_config(quiz_file=self.quiz_file)
+        self.build_pages()
+        self.assertEqual(self.plugin.quiz_pages, {'quiz1': {'page1.md'}, 'quiz2': {'page2.md'}})
+
+    def test_only_changed_quizzes_are_rendered_again(self):
+        self.load_plugin_config(quiz_file=self.quiz_file)
+        self.build_pages()
+
+        self.quiz_data['quizzes']['quiz2']['questions'][0]['question']['en'] = 'What is the capital of Italy?'
+        self.write_quiz_file()
+        self.plugin.on_config(self.config)
+
+        with patch.object(self.plugin, 'build_quiz_html', wraps=self.plugin.build_quiz_html) as build_quiz_html:
+            self.build_pages()
+        self.assertEqual(build_quiz_html.call_count, 1)
+        self.assertEqual(build_quiz_html.call_args[0][0].questions[0].text, 'What is the capital of Italy?')
+
+    def test_option_change_renders_everything_again(self):
+        self.load_plugin_config(quiz_file=self.quiz_file)
+        self.build_pages()
+
+        self.plugin.config['show_score'] = False
+        self.plugin.on_config(self.config)
+        with patch.object(self.plugin, 'build_quiz_html', wraps=self.plugin.build_quiz_html) as build_quiz_html:
+            self.build_pages()
+        self.assertEqual(build_quiz_html.call_count, 2)
+
+    def test_single_build_does_not_compute_digests(self):
+        self.plugin.on_startup(command='build', dirty=False)
+        with patch('mkdocs_quiz.plugin.quiz_digests') as quiz_digests:
+            self.load_plugin_config(quiz_file=self.quiz_file)
+        quiz_digests.assert_not_called()
+        self.assertEqual(self.plugin.quiz_hashes, {})
+
+    def test_quiz_file_is_watched(self):
+        self.load_plugin_config(quiz_file=self.quiz_file)
+        server = MagicMock()
+        self.assertIs(self.plugin.on_serve(server, self.config, None), server)
+        server.watch.assert_called_once_with(os.path.abspath(self.quiz_file))
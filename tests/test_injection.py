@@ -0,0 +1,117 @@
+from mkdocs.structure.pages import Page
+from mkdocs.structure.files import File
+from .base_test_case import BaseTestCase
+from .mock_quiz_data import mock_quiz_data
+from mkdocs_quiz.injection import inject_html, iter_inject_html
+
+
+class TestInjection(BaseTestCase):
+
+    def test_inject_html(self):
+        content = ("<html><head><title>Page</title></head><body>"
+                   "<p>Intro</p><!-- QUIZ_PLACEHOLDER_a --><p>Middle</p><!-- QUIZ_PLACEHOLDER_b -->"
+                   "<!-- QUIZ_PLACEHOLDER_unknown --></body></html>")
+        placeholders = {
+            '<!-- QUIZ_PLACEHOLDER_a -->': "<div class='quiz'>A</div>",
+            '<!-- QUIZ_PLACEHOLDER_b -->': "<div class='quiz'>B</div>",
+        }
+        output = inject_html(content, placeholders, head_html='<link>', body_html='<script></script>')
+
+        self.assertEqual(output, (
+            "<html><head><title>Page</title><link></head><body>"
+            "<p>Intro</p><div class='quiz'>A</div><p>Middle</p><div class='quiz'>B</div>"
+            "<!-- QUIZ_PLACEHOLDER_unknown --><script></script></body></html>"))
+
+    def test_iter_inject_html(self):
+        content = "<head></head><body><!-- QUIZ_PLACEHOLDER_a --></body>"
+        chunks = list(iter_inject_html(content, {'<!-- QUIZ_PLACEHOLDER_a -->': 'A'}, head_html='<link>'))
+        self.assertIn('A', chunks)
+        self.assertEqual(''.join(chunks), "<head><link></head><body>A</body>")
+
+    def test_assets_are_injected_once(self):
+        output = inject_html("<head></head><head></head><body></body>", {}, head_html='<link>')
+        self.assertEqual(output.count('<link>'), 1)
+
+    def test_on_post_page(self):
+        self.load_plugin_config()
+        page = Page('Sample Page', File('sample_page.md', 'docs', 'site', False), self.config)
+        self.plugin.rendered_quizzes[('a', 'en')] = ('a', "<div class='quiz'>A</div>")
+        page.meta['quiz_placeholder'] = [('a', 'en', 'a')]
+
+        output = self.plugin.on_post_page("<head></head><body><!-- QUIZ_PLACEHOLDER_a --></body>", page, self.config)
+        self.assertIn("<div class='quiz'>A</div>", output)
+        self.assertIn('quiz.js', output)
+        self.assertIn('quiz.css', output)
+
+    def test_page_without_quiz_gets_no_assets(self):
+        self.load_plugin_config()
+        page = Page('Sample Page', File('sample_page.md', 'docs', 'site', False), self.config)
+        content = "<head></head><body><p>No quiz</p></body>"
+        self.assertEqual(self.plugin.on_post_page(content, page, self.config), content)
+
+    def test_asset_urls_are_relative_to_the_page(self):
+        self.load_plugin_config()
+        page = Page('Nested Page', File('guide/nested/page.md', 'docs', 'site', True), self.config)
+        self.plugin.rendered_quizzes[('a', 'en')] = ('a', "<div class='quiz'>A</div>")
+        page.meta['quiz_placeholder'] = [('a', 'en', 'a')]
+
+        output = self.plugin.on_post_page("<head></head><body><!-- QUIZ_PLACEHOLDER_a --></body>", page, self.config)
+        self.assertIn('<link rel="stylesheet" href="../../../static/quiz.css"></head>', output)
+        self.assertIn('<script src="../../../static/quiz.js" defer></script></body>', output)
+
+    def test_absolute_asset_urls_and_preload(self):
+        self.load_plugin_config()
+        self.plugin.config.update({'asset_urls': 'absolute', 'preload_assets': True, 'defer_script': False})
+        self.config['site_url'] = 'https://example.com/docs'
+        page = Page('Nested Page', File('guide/page.md', 'docs', 'site', True), self.config)
+        self.plugin.rendered_quizzes[('a', 'en')] = ('a', "<div class='quiz'>A</div>")
+        page.meta['quiz_placeholder'] = [('a', 'en', 'a')]
+
+        output = self.plugin.on_post_page("<head></head><body><!-- QUIZ_PLACEHOLDER_a --></body>", page, self.config)
+        self.assertIn('<link rel="preload" href="https://example.com/docs/static/quiz.js" as="script">', output)
+        self.assertIn('<script src="https://example.com/docs/static/quiz.js"></script>', output)
+
+    def build_page(self, name, markdown):
+        page = Page(name, File(name, 'docs', 'site', False), self.config)
+        self.plugin.on_page_markdown(markdown, page, self.config, None)
+        return page
+
+    def test_quizzes_are_rendered_when_written_and_released_after_their_last_page(self):
+        self.load_plugin_config()
+        self.plugin.quiz_data = mock_quiz_data
+        page1 = self.build_page('page1.md', "<!-- QUIZ_ID: quiz1 -->\n\n<!-- QUIZ_ID: quiz1 -->")
+        page2 = self.build_page('page2.md', "<!-- QUIZ_ID: quiz1 -->")
+        dom_id = self.plugin.quiz_element_id('quiz1')
+        self.assertEqual(self.plugin.rendered_quizzes, {})
+        self.assertEqual(page1.meta['quiz_placeholder'], [('quiz1', 'en', dom_id), ('quiz1', 'en', f"{dom_id}_2")])
+
+        output = self.plugin.on_post_page(f"<body><!-- QUIZ_PLACEHOLDER_{dom_id} --><!-- QUIZ_PLACEHOLDER_{dom_id}_2 -->"
+                                          "</body>", page1, self.config)
+        self.assertIn(f"id='quiz-{dom_id}'", output)
+        self.assertIn(f"id='quiz-{dom_id}_2'", output)
+        self.assertNotIn('quiz_placeholder', page1.meta)
+        self.assertIn(('quiz1', 'en'), self.plugin.rendered_quizzes)
+
+        output = self.plugin.on_post_page(f"<body><!-- QUIZ_PLACEHOLDER_{dom_id} --></body>", page2, self.config)
+        self.assertIn(f"id='quiz-{dom_id}'", output)
+        self.assertEqual(self.plugin.rendered_quizzes, {})
+
+    def test_rendered_quizzes_are_kept_when_serving(self):
+        self.load_plugin_config()
+        self.plugin.on_startup(command='serve', dirty=False)
+        self.plugin.quiz_data = mock_quiz_data
+        page = self.build_page('page1.md', "<!-- QUIZ_ID: quiz1 -->")
+        dom_id = self.plugin.quiz_element_id('quiz1')
+        self.plugin.on_post_page(f"<body><!-- QUIZ_PLACEHOLDER_{dom_id} --></body>", page, self.config)
+        self.plugin.on_post_build(self.config)
+        self.assertIn(('quiz1', 'en'), self.plugin.rendered_quizzes)
+        self.assertEqual(self.plugin.quiz_data, {'quizzes': {}})
+
+    def test_quiz_data_is_released_after_the_build(self):
+        self.load_plugin_config()
+        self.plugin.quiz_data = mock_quiz_data
+        self.build_page('page1.md', "<!-- QUIZ_ID: quiz1 -->")
+        self.plugin.on_post_build(self.config)
+        self.assertEqual(self.plugin.quiz_data, {'quizzes': {}})
+        self.assertEqual(self.plugin.rendered_quizzes, {})
+        self.assertEqual(self.plugin.quiz_models, {})
@@ -0,0 +1,82 @@
+import json
+import os
+import tempfile
+from types import SimpleNamespace
+from unittest.mock import patch
+from mkdocs.structure.pages import Page
+from mkdocs.structure.files import File
+from .base_test_case import BaseTestCase
+from .mock_quiz_data import mock_quiz_data
+from mkdocs_quiz import plugin as plugin_module
+from mkdocs_quiz.model import normalize_quiz, normalize_quiz_languages
+
+
+class TestLanguages(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.quiz_file = os.path.join(self.tmp_dir.name, 'quizzes.json')
+        with open(self.quiz_file, 'w') as file:
+            json.dump(mock_quiz_data, file)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def load_languages_config(self, languages=('fr', 'de'), **options):
+        self.load_plugin_config(quiz_file=self.quiz_file)
+        self.plugin.config.update(dict({'languages': list(languages)}, **options))
+        self.plugin.on_config(self.config)
+
+    def write_page(self, name, config, language=None, locale=None):
+        file = File(name, 'docs', 'site', False)
+        if locale:
+            file.locale = locale
+        page = Page(name, file, self.config)
+        if language:
+            page.meta['language'] = language
+        markdown = self.plugin.on_page_markdown("<!-- QUIZ_ID: quiz1 -->", page, config, None)
+        return self.plugin.on_post_page(f"<head></head><body>{markdown}</body>", page, config)
+
+    def test_normalize_quiz_languages(self):
+        quiz = mock_quiz_data['quizzes']['quiz1']
+        variants = normalize_quiz_languages(quiz, ['en', 'fr', 'de'])
+        self.assertEqual(list(variants), ['en', 'fr', 'de'])
+        for language, model in variants.items():
+            self.assertEqual(model, normalize_quiz(quiz, language))
+
+    def test_page_language(self):
+        self.load_languages_config()
+        config = {'plugins': {'i18n': SimpleNamespace(current_language='de')}}
+        self.assertIn('Quelle est la capitale de la France?', self.write_page('fr.md', self.config, language='fr'))
+        self.assertIn('Quelle est la capitale de la France?', self.write_page('fr.md', self.config, locale='fr'))
+        self.assertIn('What is the capital of France?', self.write_page('it.md', self.config, language='it'))
+        # The language built by the i18n plugin comes before the locale of the file, a page falling back on the
+        # default language is rendered in the language of the site
+        self.assertIn('What is the capital of France?', self.write_page('de.md', config, locale='en'))
+        self.assertEqual(self.plugin.page_language(None, config), 'de')
+
+    def test_single_language_ignores_page_language(self):
+        self.load_plugin_config(quiz_file=self.quiz_file, language='fr')
+        self.assertIn('Quelle est la capitale de la France?', self.write_page('en.md', self.config, language='en'))
+
+    def test_languages_are_normalized_in_one_pass(self):
+        self.load_languages_config(cache=True, cache_dir=os.path.join(self.tmp_dir.name, 'cache'))
+        self.plugin.on_startup(command='serve', dirty=False)
+        with patch.object(plugin_module, 'normalize_quiz_languages', wraps=normalize_quiz_languages) as normalize:
+            for language in ('en', 'fr', 'de'):
+                self.write_page(f"{language}.md", self.config, language=language)
+        normalize.assert_called_once()
+        self.assertEqual(set(self.plugin.rendered_quizzes), {('quiz1', 'en'), ('quiz1', 'fr'), ('quiz1', 'de')})
+        self.assertEqual(len(self.plugin.render_cache), 3)
+
+    def test_i18n_builds_share_the_quiz_bank(self):
+        self.load_languages_config()
+        for language in ('en', 'fr'):
+            config = {'plugins': {'i18n': SimpleNamespace(current_language=language)}}
+            self.plugin.on_config(self.config)
+            with patch.object(plugin_module, 'normalize_quiz_languages', wraps=normalize_quiz_languages) as normalize:
+                self.write_page('index.md', config)
+            self.plugin.on_post_build(self.config)
+            self.assertEqual(normalize.call_count, 1 if language == 'en' else 0)
+            self.assertEqual(self.plugin.quiz_bank.load(), 'reused')
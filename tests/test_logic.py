@@ -1,3 +1,4 @@
+import logging
 from unittest.mock import patch, mock_open
 from .base_test_case import BaseTestCase
 from bs4 import BeautifulSoup 
@@ -230,28 +231,36 @@ class TestQuizLogic(BaseTestCase):
         self.assertIn('A bell', options)
         self.assertIn('A whistle', options)
 
-    @patch('builtins.print')
-    def test_logging_enabled(self, mock_print):
+    def test_logging_enabled(self):
         # Load plugin config with logging enabled
         self.load_plugin_config(logging=True)
 
-        # Trigger an event that would cause a log message
-        self.plugin.console_log("Test log message with logging enabled")
-
-        # Gather all the calls to print and extract the first argument
-        print_calls = [call[0][0] for call in mock_print.call_args_list]
+        # Trigger an event that would cause a log message, messages are logged at the INFO level
+        with self.assertLogs('mkdocs.plugins.mkdocs_quiz', level='INFO') as logs:
+            self.plugin.console_log("Test log message with %s", "logging enabled")
 
-        # Check if the expected log message is among the print calls
-        self.assertIn("DEBUG MESSAGE: Test log message with logging enabled", print_calls)
+        # Check if the expected log message is among the records
+        self.assertIn("Test log message with logging enabled", [record.getMessage() for record in logs.records])
 
-
-    @patch('builtins.print')
-    def test_logging_disabled(self, mock_print):
+    @patch('mkdocs_quiz.plugin.log')
+    def test_logging_disabled(self, mock_log):
+        # Only INFO messages and above are enabled, as in a default `mkdocs build`
+        mock_log.isEnabledFor.side_effect = lambda level: level >= logging.INFO
         # Load plugin config with logging disabled (default)
         self.load_plugin_config(logging=False)
 
         # Trigger an event that would cause a log message
-        self.plugin.console_log("Test log message with logging disabled")
+        self.plugin.console_log("Test log message with %s", "logging disabled")
+
+        # Ensure nothing was logged, as logging is disabled and DEBUG messages are not shown
+        mock_log.isEnabledFor.assert_called_with(logging.DEBUG)
+        mock_log.log.assert_not_called()
+
+    def test_logging_does_not_format_disabled_messages(self):
+        self.load_plugin_config(logging=False)
+
+        class Unformattable:
+            def __str__(self):
+                raise AssertionError("the message should not be formatted")
 
-        # Ensure the print function was not called, as logging is disabled
-        mock_print.assert_not_called()
+        self.plugin.console_log("Value: %s", Unformattable())
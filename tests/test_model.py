@@ -0,0 +1,75 @@
+import copy
+from .base_test_case import BaseTestCase
+from .mock_quiz_data import mock_quiz_data
+from mkdocs_quiz.model import Media, Option, Quiz, normalize_quiz
+
+
+class TestQuizModel(BaseTestCase):
+
+    def test_normalize_quiz(self):
+        quiz = normalize_quiz(mock_quiz_data['quizzes']['quiz1'], 'fr')
+        multiple_choice, true_false, fill_in_the_blank = quiz.questions
+
+        self.assertIsInstance(quiz, Quiz)
+        self.assertEqual(multiple_choice.text, 'Quelle est la capitale de la France?')
+        self.assertEqual(multiple_choice.media, Media('image', './static/images/test.png', 'Paris'))
+        self.assertEqual(multiple_choice.options[2], Option('Paris', True, ''))
+        self.assertEqual(true_false.type, 'true-false')
+        self.assertEqual(fill_in_the_blank.answer, 'jupiter')
+        self.assertEqual(fill_in_the_blank.hint, "C'est une géante gazeuse.")
+        self.assertEqual(fill_in_the_blank.options, ())
+
+    def test_language_fallback(self):
+        quiz = copy.deepcopy(mock_quiz_data['quizzes']['quiz1'])
+        del quiz['questions'][0]['question']['fr']
+        del quiz['questions'][0]['options'][0]['indice']
+        question = normalize_quiz(quiz, 'fr').questions[0]
+        self.assertEqual(question.text, 'What is the capital of France?')
+        self.assertEqual(question.options[0].indice, '')
+        self.assertEqual(question.options[1].indice, "Ceci est la capitale de l'Espagne.")
+
+    def test_sample(self):
+        quiz = copy.deepcopy(mock_quiz_data['quizzes']['quiz1'])
+        self.assertEqual(normalize_quiz(quiz, 'en').sample, 0)
+        for sample, expected in ((2, 2), (-1, 0), ('2', 0), (True, 0)):
+            quiz['sample'] = sample
+            self.assertEqual(normalize_quiz(quiz, 'en').sample, expected)
+
+    def test_extra_fields_of_custom_types(self):
+        quiz = {'questions': [
+            {'type': 'rating', 'question': {'en': 'How hard?'}, 'scale': 5, 'label': {'en': 'Hard', 'fr': 'Dur'},
+             'tags': ['maths']},
+            mock_quiz_data['quizzes']['quiz1']['questions'][0],
+        ]}
+        rating, multiple_choice = normalize_quiz(quiz, 'fr').questions
+        self.assertEqual(rating.extra, {'scale': 5, 'label': 'Dur', 'tags': ['maths']})
+        self.assertEqual(rating.options, ())
+        self.assertIsNone(multiple_choice.extra)
+
+    def test_strings_are_interned(self):
+        first = normalize_quiz(copy.deepcopy(mock_quiz_data['quizzes']['quiz1']), 'en')
+        second = normalize_quiz(copy.deepcopy(mock_quiz_data['quizzes']['quiz1']), 'en')
+        self.assertIs(first.questions[0].text, second.questions[0].text)
+        self.assertIs(first.questions[1].options[0].text, second.questions[1].options[0].text)
+
+    def test_numeric_texts(self):
+        quiz = {'questions': [
+            {'type': 'multiple-choice', 'question': {'en': 'What is 2 + 2?'},
+             'options': [{'text': {'en': 4}, 'correct': True}, {'text': {'en': 5.5}, 'correct': False}]},
+            {'type': 'fill-in-the-blank', 'question': {'en': 'What is 6 x 7?'}, 'answer': {'en': 42}},
+        ]}
+        multiple_choice, fill_in_the_blank = normalize_quiz(quiz, 'fr').questions
+        self.assertEqual(multiple_choice.options, (Option(4, True, ''), Option(5.5, False, '')))
+        self.assertEqual(fill_in_the_blank.answer, '42')
+
+        self.load_plugin_config()
+        quiz_html = self.plugin.generate_quiz_html(quiz, 'quiz1')
+        self.assertIn('5.5', quiz_html)
+        self.assertIn("data-answer='42'", quiz_html)
+
+    def test_plugin_renders_from_the_model(self):
+        self.load_plugin_config()
+        self.plugin.quiz_data = mock_quiz_data
+        dom_id, quiz_html = self.plugin.render_quiz('quiz1')
+        self.assertIsInstance(self.plugin.quiz_models[('quiz1', 'en')], Quiz)
+        self.assertEqual(quiz_html, self.plugin.generate_quiz_html(mock_quiz_data['quizzes']['quiz1'], 'quiz1'))
@@ -0,0 +1,105 @@
+import copy
+import json
+import os
+import tempfile
+from bs4 import BeautifulSoup
+from mkdocs.structure.pages import Page
+from mkdocs.structure.files import File
+from .base_test_case import BaseTestCase
+from .mock_quiz_data import mock_quiz_data
+from mkdocs_quiz.payload import build_payload, encode_payload
+
+
+class TestPayloadMode(BaseTestCase):
+
+    def load_payload_config(self, **kwargs):
+        self.load_plugin_config(**kwargs)
+        self.plugin.config['render_mode'] = 'payload'
+        self.plugin.on_config(self.config)
+        self.plugin.quiz_data = mock_quiz_data
+
+    def test_build_payload(self):
+        payload = build_payload(mock_quiz_data['quizzes']['quiz1'], 'fr')
+        multiple_choice, true_false, fill_in_the_blank = payload['questions']
+
+        self.assertEqual(multiple_choice['text'], 'Quelle est la capitale de la France?')
+        self.assertEqual(multiple_choice['media'], {'type': 'image', 'src': './static/images/test.png', 'alt': 'Paris'})
+        self.assertEqual(multiple_choice['options'][2], {'text': 'Paris', 'correct': True, 'indice': ''})
+        self.assertEqual(true_false['type'], 'true-false')
+        self.assertEqual(fill_in_the_blank['answer'], 'jupiter')
+        self.assertEqual(fill_in_the_blank['hint'], "C'est une géante gazeuse.")
+        self.assertNotIn('options', fill_in_the_blank)
+
+    def test_payload_url_depends_on_content_and_language(self):
+        quiz = mock_quiz_data['quizzes']['quiz1']
+        url, data = encode_payload('quiz1', quiz, 'en')
+        self.assertRegex(url, r'^quizzes/quiz1\.en\.[0-9a-f]{8}\.json$')
+        self.assertEqual(encode_payload('quiz1', quiz, 'en'), (url, data))
+        self.assertNotEqual(encode_payload('quiz1', quiz, 'fr')[0], url)
+        self.assertEqual(json.loads(data), build_payload(quiz, 'en'))
+
+    def test_page_gets_a_placeholder(self):
+        self.load_payload_config()
+        page = Page('Sample Page', File('sample_page.md', 'docs', 'site', False), self.config)
+        self.plugin.on_page_markdown("<!-- QUIZ_ID: quiz1 -->", page, self.config, None)
+
+        quiz_html, = self.plugin.resolve_placeholders(page).values()
+        quiz_div = BeautifulSoup(quiz_html, 'html.parser').find('div', class_='quiz')
+        self.assertEqual(quiz_div['data-quiz-src'], self.plugin.quiz_payloads[('quiz1', 'en')][0])
+        self.assertEqual(quiz_div['data-show-progress-bar'], 'true')
+        self.assertEqual(list(quiz_div.children), [])
+
+    def test_payloads_are_written_once(self):
+        self.load_payload_config()
+        for name in ('page1.md', 'page2.md'):
+            page = Page(name, File(name, 'docs', 'site', False), self.config)
+            markdown = self.plugin.on_page_markdown("<!-- QUIZ_ID: quiz1 -->", page, self.config, None)
+            self.plugin.on_post_page(f"<body>{markdown}</body>", page, self.config)
+
+        payload_url, payload = self.plugin.quiz_payloads[('quiz1', 'en')]
+        with tempfile.TemporaryDirectory() as site_dir:
+            self.plugin.on_post_build({'site_dir': site_dir})
+            self.assertEqual(len(os.listdir(os.path.join(site_dir, 'quizzes'))), 1)
+            with open(os.path.join(site_dir, payload_url), 'rb') as file:
+                self.assertEqual(file.read(), payload)
+
+
+class TestQuestionSampling(BaseTestCase):
+
+    def load_sampled_quiz(self, sample):
+        self.load_plugin_config()
+        quiz_data = copy.deepcopy(mock_quiz_data)
+        quiz_data['quizzes']['quiz1']['sample'] = sample
+        self.plugin.quiz_data = quiz_data
+
+    def test_sampled_quiz_gets_a_placeholder(self):
+        self.load_sampled_quiz(2)
+        dom_id, quiz_html = self.plugin.render_quiz('quiz1')
+
+        quiz_div = BeautifulSoup(quiz_html, 'html.parser').find('div', class_='quiz')
+        self.assertEqual(quiz_div['id'], f'quiz-{dom_id}')
+        self.assertEqual(quiz_div['data-sample'], '2')
+        self.assertEqual(quiz_div['data-quiz-src'], self.plugin.quiz_payloads[('quiz1', 'en')][0])
+        self.assertEqual(list(quiz_div.children), [])
+
+    def test_sample_of_all_questions_is_rendered_inline(self):
+        self.load_sampled_quiz(3)
+        dom_id, quiz_html = self.plugin.render_quiz('quiz1')
+
+        quiz_div = BeautifulSoup(quiz_html, 'html.parser').find('div', class_='quiz')
+        self.assertFalse(quiz_div.has_attr('data-sample'))
+        self.assertEqual(len(quiz_div.find_all('div', class_='question')), 3)
+        self.assertEqual(self.plugin.quiz_payloads, {})
+
+    def test_bank_is_written_once(self):
+        self.load_sampled_quiz(1)
+        for name in ('page1.md', 'page2.md'):
+            page = Page(name, File(name, 'docs', 'site', False), self.config)
+            markdown = self.plugin.on_page_markdown("<!-- QUIZ_ID: quiz1 -->", page, self.config, None)
+            self.plugin.on_post_page(f"<body>{markdown}</body>", page, self.config)
+
+        payload_url, payload = self.plugin.quiz_payloads[('quiz1', 'en')]
+        self.assertEqual(len(json.loads(payload)['questions']), 3)
+        with tempfile.TemporaryDirectory() as site_dir:
+            self.plugin.on_post_build({'site_dir': site_dir})
+            self.assertEqual(os.listdir(os.path.join(site_dir, 'quizzes')), [os.path.basename(payload_url)])
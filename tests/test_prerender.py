@@ -0,0 +1,137 @@
+import copy
+import json
+import os
+import tempfile
+from unittest.mock import patch
+from mkdocs.structure.pages import Page
+from mkdocs.structure.files import File, Files
+from .base_test_case import BaseTestCase
+from .mock_quiz_data import mock_quiz_data
+from .test_renderers import RatingRenderer
+from mkdocs_quiz import prerender, renderers
+from mkdocs_quiz.model import normalize_quiz
+from mkdocs_quiz.renderers import QuestionRenderer, register_renderer
+
+
+class TestPrerender(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.docs_dir = os.path.join(self.tmp_dir.name, 'docs')
+        self.quiz_file = os.path.join(self.tmp_dir.name, 'quizzes.json')
+        quiz_data = copy.deepcopy(mock_quiz_data)
+        for quiz_id in ('quiz2', 'quiz3', 'quiz4'):
+            quiz_data['quizzes'][quiz_id] = copy.deepcopy(mock_quiz_data['quizzes']['quiz1'])
+        quiz_data['quizzes']['quiz4']['questions'][0]['question']['en'] = 'Which city is the capital of France?'
+        quiz_data['quizzes']['quiz4']['questions'].append({
+            'type': 'rating',
+            'question': {'en': 'How hard was it?'},
+            'options': [{'text': {'en': str(i)}, 'correct': True} for i in range(5)],
+            'step': 1,
+            'label': {'en': 'Difficulty'},
+        })
+        with open(self.quiz_file, 'w') as file:
+            json.dump(quiz_data, file)
+        self.pages = {
+            'index.md': "# Home\n\n<!-- QUIZ_ID: quiz1 -->\n\n<!-- QUIZ_ID: quiz2 -->",
+            'guide.md': "# Guide\n\n<!-- QUIZ_ID: quiz2 -->\n\n<!-- QUIZ_ID: quiz4 -->\n\n<!-- QUIZ_ID: unknown -->",
+            'other.md': "# Other\n\nNo quiz here.",
+        }
+        os.makedirs(self.docs_dir)
+        for name, markdown in self.pages.items():
+            with open(os.path.join(self.docs_dir, name), 'w') as file:
+                file.write(markdown)
+        self.files = self.make_files()
+        self.config['site_dir'] = os.path.join(self.tmp_dir.name, 'site')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+        renderers.RENDERERS.clear()
+        renderers.RENDERERS.update(renderers.BUILTIN_RENDERERS)
+
+    def make_files(self):
+        return Files([File(name, self.docs_dir, os.path.join(self.tmp_dir.name, 'site'), False)
+                      for name in self.pages])
+
+    def load_prerender_config(self, **options):
+        self.load_plugin_config(quiz_file=self.quiz_file)
+        self.plugin.config.update(dict({'prerender': True, 'prerender_workers': 2}, **options))
+        self.plugin.on_config(self.config)
+
+    def build_pages(self):
+        outputs = {}
+        for name, markdown in self.pages.items():
+            page = Page(name, self.files.get_file_from_path(name), self.config)
+            markdown = self.plugin.on_page_markdown(markdown, page, self.config, self.files)
+            outputs[name] = (markdown, self.plugin.resolve_placeholders(page))
+        return outputs
+
+    def test_referenced_quizzes_are_prerendered(self):
+        self.load_prerender_config()
+        self.plugin.on_files(self.files, self.config)
+        self.assertEqual(set(self.plugin.rendered_quizzes), {('quiz1', 'en'), ('quiz2', 'en'), ('quiz4', 'en')})
+
+        with patch.object(self.plugin, 'build_quiz_html') as build_quiz_html:
+            prerendered = self.build_pages()
+        build_quiz_html.assert_not_called()
+
+        self.load_plugin_config(quiz_file=self.quiz_file)
+        self.assertEqual(self.build_pages(), prerendered)
+
+    def test_pages_are_read_from_their_source_file(self):
+        with open(os.path.join(self.docs_dir, 'other.md'), 'wb') as file:
+            file.write(b"# Caf\xe9\n\n<!-- QUIZ_ID: quiz3 -->")
+        self.load_prerender_config()
+        # File.content_string only exists from MkDocs 1.6
+        with patch.object(File, 'content_string', property(lambda file: self.fail('content_string was used')),
+                          create=True):
+            self.plugin.on_files(self.files, self.config)
+        self.assertIn(('quiz3', 'en'), self.plugin.rendered_quizzes)
+
+    def test_render_cache_is_used(self):
+        self.load_prerender_config(cache=True, cache_dir=os.path.join(self.tmp_dir.name, 'cache'))
+        self.plugin.on_files(self.files, self.config)
+        self.assertEqual(len(self.plugin.render_cache), 3)
+
+        self.plugin.rendered_quizzes = {}
+        with patch('mkdocs_quiz.plugin.render_in_pool') as render_in_pool:
+            self.plugin.on_files(self.make_files(), self.config)
+        render_in_pool.assert_not_called()
+        self.assertEqual(set(self.plugin.rendered_quizzes), {('quiz1', 'en'), ('quiz2', 'en'), ('quiz4', 'en')})
+
+    def test_disabled_by_default(self):
+        self.load_plugin_config(quiz_file=self.quiz_file)
+        with patch('mkdocs_quiz.plugin.render_in_pool') as render_in_pool:
+            self.plugin.on_files(self.files, self.config)
+        render_in_pool.assert_not_called()
+        self.assertEqual(self.plugin.rendered_quizzes, {})
+
+    def test_registered_renderers_are_sent_to_the_workers(self):
+        register_renderer('rating', RatingRenderer(), '1.0')
+        self.load_prerender_config()
+        with patch('mkdocs_quiz.plugin.render_in_pool', wraps=prerender.render_in_pool) as render_in_pool:
+            self.plugin.on_files(self.files, self.config)
+        self.assertEqual(set(render_in_pool.call_args[0][3]), {'rating'})
+        self.assertIn("type='range'", self.plugin.rendered_quizzes[('quiz4', 'en')][1])
+
+        # A worker that is not forked starts with the built-in renderers only
+        with open(self.quiz_file) as file:
+            model = normalize_quiz(json.load(file)['quizzes']['quiz4'], 'en')
+        with patch.dict(renderers.RENDERERS, renderers.BUILTIN_RENDERERS, clear=True), \
+                patch.object(prerender, '_worker_plugin', None):
+            prerender._init_worker(self.plugin.render_options(), {'rating': (RatingRenderer(), '1.0')})
+            (_, quiz_html), = prerender._render_batch([(('quiz4', 'en'), model, 'quiz4_abc')])
+        self.assertIn("type='range'", quiz_html)
+
+    def test_quizzes_with_unpicklable_renderers_are_rendered_with_their_page(self):
+        class LocalRenderer(QuestionRenderer):
+            def render(self, question, quiz_id, question_id, show_indice):
+                return "<input type='range'>"
+
+        register_renderer('rating', LocalRenderer())
+        self.load_prerender_config()
+        self.plugin.on_files(self.files, self.config)
+        self.assertEqual(set(self.plugin.rendered_quizzes), {('quiz1', 'en'), ('quiz2', 'en')})
+        _, quiz_html = self.build_pages()['guide.md']
+        self.assertIn("type='range'", ''.join(quiz_html.values()))
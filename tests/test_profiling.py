@@ -0,0 +1,53 @@
+import json
+import os
+import tempfile
+from mkdocs.structure.pages import Page
+from mkdocs.structure.files import File
+from .base_test_case import BaseTestCase
+from .mock_quiz_data import mock_quiz_data
+
+
+class TestProfiling(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.report_path = os.path.join(self.tmp_dir.name, 'profile.json')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_profile_report(self):
+        self.load_plugin_config()
+        self.plugin.config.update({'profile': True, 'profile_report': self.report_path})
+        self.plugin.on_config(self.config)
+        self.plugin.quiz_data = mock_quiz_data
+
+        for name, markdown in (('quiz.md', "<!-- QUIZ_ID: quiz1 -->"), ('plain.md', "# No quiz")):
+            page = Page(name, File(name, 'docs', 'site', False), self.config)
+            markdown = self.plugin.on_page_markdown(markdown, page=page, config=self.config, files=None)
+            self.plugin.on_post_page(f"<head></head><body>{markdown}</body>", page=page, config=self.config)
+        with self.assertLogs('mkdocs.plugins.mkdocs_quiz', level='INFO') as logs:
+            self.plugin.on_post_build(self.config)
+
+        with open(self.report_path) as file:
+            report = json.load(file)
+        self.assertEqual(report['hooks']['on_config']['calls'], 1)
+        self.assertEqual(report['hooks']['on_page_markdown']['calls'], 2)
+        self.assertEqual(report['hooks']['on_post_page']['calls'], 2)
+        self.assertEqual(report['hooks']['generate_quiz_html']['calls'], 1)
+        self.assertEqual(report['pages']['quiz.md']['quizzes'], 1)
+        self.assertEqual(report['pages']['plain.md']['quizzes'], 0)
+        self.assertGreater(report['pages']['quiz.md']['time'], 0)
+        self.assertGreater(report['quizzes']['quiz1']['bytes'], 1000)
+        self.assertGreater(report['peak_memory'], 0)
+
+        summary = '\n'.join(record.getMessage() for record in logs.records)
+        self.assertIn('Slowest pages:', summary)
+        self.assertIn('quiz1', summary)
+
+    def test_profiling_disabled(self):
+        self.load_plugin_config()
+        self.assertIsNone(self.plugin.profiler)
+        self.plugin.on_post_build(self.config)
+        self.assertFalse(os.path.exists(self.report_path))
@@ -0,0 +1,101 @@
+import copy
+import json
+import os
+import tempfile
+from unittest.mock import MagicMock, patch
+from mkdocs.structure.pages import Page
+from mkdocs.structure.files import File
+from .base_test_case import BaseTestCase
+from .mock_quiz_data import mock_quiz_data
+from mkdocs_quiz.quiz_dir import QuizDirectory
+
+
+class TestQuizDirectory(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.quiz_dir = os.path.join(self.tmp_dir.name, 'quizzes')
+        self.quiz = mock_quiz_data['quizzes']['quiz1']
+        self.write('capitals.json', self.quiz)
+        self.write(os.path.join('space', 'section.json'), {'quizzes': {'planets': self.quiz, 'stars': self.quiz}})
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write(self, name, data, mtime_offset=0):
+        path = os.path.join(self.quiz_dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(data, file)
+        if mtime_offset:
+            stat = os.stat(path)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + mtime_offset))
+
+    def test_quiz_and_section_files(self):
+        quizzes = QuizDirectory(self.quiz_dir).load()
+        self.assertEqual(sorted(quizzes), ['capitals', 'planets', 'stars'])
+        self.assertEqual(quizzes['capitals'], self.quiz)
+        self.assertEqual(quizzes.reloaded, 2)
+
+    def test_only_changed_files_are_read_again(self):
+        quizzes = QuizDirectory(self.quiz_dir).load()
+        changed = copy.deepcopy(self.quiz)
+        changed['questions'].pop()
+        self.write('capitals.json', changed, mtime_offset=10 ** 9)
+        os.remove(os.path.join(self.quiz_dir, 'space', 'section.json'))
+
+        with patch.object(QuizDirectory, '_read_file', wraps=QuizDirectory._read_file) as read_file:
+            quizzes.load()
+        read_file.assert_called_once_with(os.path.join(self.quiz_dir, 'capitals.json'))
+        self.assertEqual(dict(quizzes), {'capitals': changed})
+
+    def test_invalid_and_duplicated_quizzes(self):
+        with open(os.path.join(self.quiz_dir, 'broken.json'), 'w') as file:
+            file.write('{"questions": [')
+        self.write('zz_section.json', {'quizzes': {'capitals': {'questions': []}}})
+
+        with self.assertLogs('mkdocs.plugins.mkdocs_quiz', level='WARNING') as logs:
+            quizzes = QuizDirectory(self.quiz_dir).load()
+        self.assertEqual(quizzes['capitals'], {'questions': []})
+        self.assertNotIn('broken', quizzes)
+        messages = '\n'.join(logs.output)
+        self.assertIn('broken.json', messages)
+        self.assertIn('Quiz capitals is defined in', messages)
+
+    def test_plugin_merges_quiz_dir_and_quiz_file(self):
+        quiz_file = os.path.join(self.tmp_dir.name, 'quizzes.json')
+        with open(quiz_file, 'w') as file:
+            json.dump(mock_quiz_data, file)
+        self.load_plugin_config(quiz_file=quiz_file)
+        self.plugin.config['quiz_dir'] = self.quiz_dir
+        self.plugin.on_config(self.config)
+
+        quizzes = self.plugin.quiz_data['quizzes']
+        self.assertEqual(sorted(quizzes), ['capitals', 'planets', 'quiz1', 'stars'])
+        page = Page('Sample Page', File('sample_page.md', 'docs', 'site', False), self.config)
+        markdown = self.plugin.on_page_markdown("<!-- QUIZ_ID: planets -->\n<!-- QUIZ_ID: quiz1 -->", page,
+                                                self.config, None)
+        self.assertNotIn('QUIZ_ID', markdown)
+        self.assertEqual(len(page.meta['quiz_placeholder']), 2)
+
+        server = MagicMock()
+        self.plugin.on_serve(server, self.config, None)
+        server.watch.assert_any_call(os.path.abspath(self.quiz_dir))
+
+    def test_plugin_renders_only_changed_quizzes_again(self):
+        self.plugin.on_startup(command='serve', dirty=False)
+        self.load_plugin_config(quiz_file='')
+        self.plugin.config['quiz_dir'] = self.quiz_dir
+        self.plugin.on_config(self.config)
+        page = Page('Sample Page', File('sample_page.md', 'docs', 'site', False), self.config)
+        markdown = self.plugin.on_page_markdown("<!-- QUIZ_ID: capitals -->\n<!-- QUIZ_ID: stars -->", page,
+                                                self.config, None)
+        self.plugin.on_post_page(f"<body>{markdown}</body>", page, self.config)
+
+        changed = copy.deepcopy(self.quiz)
+        changed['questions'][0]['question']['en'] = 'What is the capital of Italy?'
+        self.write('capitals.json', changed, mtime_offset=10 ** 9)
+        self.plugin.on_config(self.config)
+        self.assertEqual(self.plugin.quiz_directory.reloaded, 1)
+        self.assertEqual(list(self.plugin.rendered_quizzes), [('stars', 'en')])
@@ -0,0 +1,106 @@
+import copy
+from unittest.mock import MagicMock, patch
+from .base_test_case import BaseTestCase
+from .mock_quiz_data import mock_quiz_data
+from mkdocs_quiz import renderers
+from mkdocs_quiz.renderers import QuestionRenderer, register_renderer
+
+
+class RatingRenderer(QuestionRenderer):
+
+    def render(self, question, quiz_id, question_id, show_indice):
+        return (f"<input type='range' id='rating-{question_id}' max='{len(question.options)}' "
+                f"data-step='{question.extra['step']}' title='{question.extra['label']}'>")
+
+
+class TestQuestionRenderers(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.renderers = dict(renderers.RENDERERS)
+        self.quiz = copy.deepcopy(mock_quiz_data['quizzes']['quiz1'])
+        self.quiz['questions'].append({
+            'type': 'rating',
+            'question': {'en': 'How hard was it?'},
+            'options': [{'text': {'en': str(i)}, 'correct': True} for i in range(5)],
+            'step': 1,
+            'label': {'en': 'Difficulty', 'fr': 'Difficulté'},
+        })
+
+    def tearDown(self):
+        renderers.RENDERERS.clear()
+        renderers.RENDERERS.update(self.renderers)
+
+    def test_unknown_type_has_no_answer_part(self):
+        self.load_plugin_config(quiz_file='')
+        html = self.plugin.generate_quiz_html(self.quiz, 'quiz1')
+        self.assertIn("data-quiz-type='rating'", html)
+        self.assertNotIn("type='range'", html)
+
+    def test_register_renderer(self):
+        self.load_plugin_config(quiz_file='')
+        register_renderer('rating', RatingRenderer())
+        html = self.plugin.generate_quiz_html(self.quiz, 'quiz1')
+        self.assertRegex(html, r"<p class='font-bold text-lg mb-4'>How hard was it\? <button .*?</p>"
+                               r"<input type='range' id='rating-quiz1_\w+_3' max='5' data-step='1' "
+                               r"title='Difficulty'></div>")
+
+    def test_entry_points(self):
+        rating = MagicMock(value='mkdocs_quiz_rating:RatingRenderer', load=MagicMock(return_value=RatingRenderer))
+        rating.name = 'rating'
+        broken = MagicMock(value='broken:Renderer', load=MagicMock(side_effect=ImportError('No module')))
+        broken.name = 'broken'
+        builtin = MagicMock(value='other:Renderer')
+        builtin.name = 'true-false'
+
+        with patch.object(renderers, '_entry_points_loaded', False), \
+                patch.object(renderers, '_iter_entry_points', return_value=[rating, broken, builtin]) as found, \
+                self.assertLogs('mkdocs.plugins.mkdocs_quiz', 'WARNING') as logs:
+            self.load_plugin_config(quiz_file='')
+            self.plugin.on_config(self.config)
+
+        found.assert_called_once_with('mkdocs_quiz.question_types')
+        self.assertIsInstance(renderers.RENDERERS['rating'], RatingRenderer)
+        self.assertNotIn('broken', renderers.RENDERERS)
+        self.assertIs(renderers.RENDERERS['true-false'], self.renderers['true-false'])
+        builtin.load.assert_not_called()
+        self.assertEqual(len(logs.output), 2)
+
+    def test_entry_points_without_importlib_metadata(self):
+        # Python 3.7 has neither importlib.metadata nor, unless installed, its backport
+        rating = MagicMock(module_name='mkdocs_quiz_rating', attrs=('RatingRenderer',), spec=['name', 'load',
+                                                                                              'module_name', 'attrs'])
+        pkg_resources = MagicMock()
+        pkg_resources.iter_entry_points.return_value = iter([rating])
+        with patch.dict('sys.modules', {'importlib.metadata': None, 'importlib_metadata': None,
+                                        'pkg_resources': pkg_resources}):
+            self.assertEqual(renderers._iter_entry_points('mkdocs_quiz.question_types'), [rating])
+        pkg_resources.iter_entry_points.assert_called_once_with('mkdocs_quiz.question_types')
+        self.assertEqual(renderers._entry_point_target(rating), 'mkdocs_quiz_rating:RatingRenderer')
+
+    def test_renderers_are_part_of_the_cache_key(self):
+        self.load_plugin_config(quiz_file='')
+        options = self.plugin.render_options()
+        self.assertEqual(options['question_types'], [])
+
+        register_renderer('rating', RatingRenderer(), '1.0')
+        self.assertEqual(self.plugin.render_options()['question_types'],
+                         [['rating', 'tests.test_renderers.RatingRenderer', '1.0']])
+        register_renderer('rating', RatingRenderer(), '1.1')
+        self.assertNotEqual(self.plugin.render_options(), options)
+
+    def test_custom_types_are_rendered_in_the_page(self):
+        self.load_plugin_config(quiz_file='')
+        self.plugin.config['render_mode'] = 'payload'
+        self.plugin.on_config(self.config)
+        register_renderer('rating', RatingRenderer())
+        self.quiz['sample'] = 2
+        self.plugin.quiz_data = {'quizzes': {'quiz1': self.quiz, 'quiz2': mock_quiz_data['quizzes']['quiz1']}}
+
+        with self.assertLogs('mkdocs.plugins.mkdocs_quiz', 'WARNING') as logs:
+            _, quiz_html = self.plugin.render_quiz('quiz1')
+        self.assertIn('Quiz quiz1 has question types', logs.output[0])
+        self.assertIn("type='range'", quiz_html)
+        self.assertNotIn('data-quiz-src', quiz_html)
+        self.assertNotIn(('quiz1', 'en'), self.plugin.quiz_payloads)
+        self.assertIn('data-quiz-src', self.plugin.render_quiz('quiz2')[1])
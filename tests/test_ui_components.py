@@ -1,5 +1,6 @@
 from bs4 import BeautifulSoup
 from .base_test_case import BaseTestCase  # Assuming BaseTestCase is in a shared setup file
+from .mock_quiz_data import mock_quiz_data
 
 class TestUIComponents(BaseTestCase):
 
@@ -123,3 +124,37 @@ class TestUIComponents(BaseTestCase):
         # Validate the refresh button is not present
         refresh_button = soup.find('button', class_='refresh-button')
         self.assertIsNone(refresh_button)
+
+    def load_paginated_config(self, questions_per_page):
+        self.load_plugin_config()
+        self.plugin.config['questions_per_page'] = questions_per_page
+        self.plugin.on_config(self.config)
+
+    def test_pagination(self):
+        self.load_paginated_config(2)
+        quiz_html = self.plugin.generate_quiz_html(mock_quiz_data['quizzes']['quiz1'])
+        quiz_div = BeautifulSoup(quiz_html, 'html.parser').find('div', class_='quiz')
+
+        self.assertEqual(quiz_div['data-questions-per-page'], '2')
+        first_page, second_page = quiz_div.find_all(class_='quiz-page')
+        self.assertEqual(first_page.name, 'div')
+        self.assertEqual(len(first_page.find_all('div', class_='question')), 2)
+        # The next pages stay inert until they are shown
+        self.assertEqual(second_page.name, 'template')
+        self.assertEqual(second_page['data-page'], '1')
+        question, = second_page.find_all('div', class_='question')
+        self.assertTrue(question['id'].endswith('_2'))
+        self.assertEqual(quiz_div.find('span', class_='quiz-page-number').text, '1 / 2')
+        self.assertTrue(quiz_div.find('button', class_='quiz-previous').has_attr('disabled'))
+        # The progress bar and score are kept outside of the pages
+        self.assertIsNone(first_page.find('div', class_='progress-bar'))
+        self.assertIsNotNone(quiz_div.find('div', class_='progress-bar'))
+        self.assertIsNotNone(quiz_div.find('div', class_='score', recursive=False))
+
+    def test_quiz_fitting_in_a_page_is_not_paginated(self):
+        self.load_paginated_config(3)
+        quiz_html = self.plugin.generate_quiz_html(mock_quiz_data['quizzes']['quiz1'])
+        soup = BeautifulSoup(quiz_html, 'html.parser')
+        self.assertEqual(soup.find_all(class_='quiz-page'), [])
+        self.assertIsNone(soup.find('div', class_='quiz-pagination'))
+        self.assertEqual(len(soup.find_all('div', class_='question')), 3)